@@ -0,0 +1,37 @@
+"""
+Code generation scaling benchmark.
+
+Generates orchestrators for chain DAGs of growing size and prints the time per
+node. Generation is O(V+E), so the per-node time should stay flat:
+
+    python benchmarks/bench_codegen.py [max_nodes]
+"""
+
+import sys
+import time
+
+from typeflow.core.bench import chain_dag
+from typeflow.core.script_generator import generate_script
+from typeflow.utils import create_adjacency_lists, extract_io_nodes
+
+
+def time_codegen(size, live=False):
+    dag = chain_dag(size)
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    ports = extract_io_nodes(dag)
+    start = time.perf_counter()
+    generate_script(adj_list, rev_adj_list, live=live, ports=ports, manifests=({}, {}))
+    return time.perf_counter() - start
+
+
+def main(max_nodes=100_000):
+    size = 100
+    print(f"{'nodes':>8} {'seconds':>10} {'µs/node':>10}")
+    while size <= max_nodes:
+        elapsed = time_codegen(size)
+        print(f"{size:>8} {elapsed:>10.3f} {elapsed / size * 1e6:>10.1f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
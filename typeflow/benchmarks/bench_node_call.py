@@ -0,0 +1,50 @@
+"""
+Per-call overhead of ``@node()``.
+
+Times a trivial node called undecorated, through the development wrapper and
+in production mode (``TYPEFLOW_PRODUCTION=1``), where the decorator returns
+the function itself and the call costs the same as the undecorated one:
+
+    python benchmarks/bench_node_call.py [calls]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+import typeflow.sdk.node as node_module
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def decorate(production):
+    node_module.PRODUCTION = production
+    return node_module.node()(add)
+
+
+def main(calls=1_000_000):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as project:
+        # The decorator writes its manifest to the current project
+        os.makedirs(os.path.join(project, ".typeflow"))
+        os.chdir(project)
+        try:
+            variants = {
+                "undecorated": add,
+                "@node (development)": decorate(False),
+                "@node (production)": decorate(True),
+            }
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'variant':<22} {'ns/call':>10}")
+    for name, func in variants.items():
+        best = min(timeit.repeat(lambda: func(1, 2), number=calls, repeat=5))
+        print(f"{name:<22} {best / calls * 1e9:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,66 @@
+"""
+Construction time and memory of ``@node_class`` instances.
+
+Creates many instances of the same class decorated with the default generic
+``__init__`` and with ``slots=True``:
+
+    python benchmarks/bench_node_class.py [instances]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from typeflow import node_class
+
+
+def define(slots):
+    class Pixel:
+        x: int
+        y: int
+        value: float = 0.0
+
+        def brightness(self) -> float:
+            return self.value
+
+    return node_class(slots=slots)(Pixel)
+
+
+def measure(cls, count):
+    """Return ``(seconds, bytes_per_instance)`` for ``count`` instances."""
+    gc.collect()
+    start = time.perf_counter()
+    instances = [cls(x=i, y=i, value=1.0) for i in range(count)]
+    seconds = time.perf_counter() - start
+    del instances
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls(x=i, y=i, value=1.0) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return seconds, size / count
+
+
+def main(count=1_000_000):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as project:
+        # The decorator writes its manifest to the current project
+        os.makedirs(os.path.join(project, ".typeflow"))
+        os.chdir(project)
+        try:
+            variants = {"@node_class": define(False), "@node_class(slots=True)": define(True)}
+        finally:
+            os.chdir(cwd)
+
+    print(f"{'variant':<26} {'ns/instance':>12} {'bytes/instance':>15}")
+    for name, cls in variants.items():
+        seconds, size = measure(cls, count)
+        print(f"{name:<26} {seconds / count * 1e9:>12.1f} {size:>15.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,35 @@
+"""
+pytest-benchmark suite for the compile, generate and execute stages.
+
+    pytest benchmarks/bench_stages.py --benchmark-autosave
+    pytest benchmarks/bench_stages.py --benchmark-compare --benchmark-compare-fail=min:50%
+
+Set TYPEFLOW_BENCH_SIZES (e.g. "10,1000,100000") to change the graph sizes.
+"""
+
+import os
+
+import pytest
+
+from typeflow.core.bench import SHAPES, STAGES, bench_manifests, stage_functions
+
+pytest.importorskip("pytest_benchmark")
+
+BENCH_SIZES = [int(s) for s in os.environ.get("TYPEFLOW_BENCH_SIZES", "10,1000").split(",")]
+
+_stage_cache = {}
+
+
+def stages_for(shape, size):
+    if (shape, size) not in _stage_cache:
+        _stage_cache[(shape, size)] = stage_functions(SHAPES[shape](size))
+    return _stage_cache[(shape, size)]
+
+
+@pytest.mark.parametrize("stage", STAGES)
+@pytest.mark.parametrize("size", BENCH_SIZES)
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_stage(benchmark, shape, size, stage):
+    benchmark.group = f"{shape}/{size}"
+    with bench_manifests():
+        benchmark(stages_for(shape, size)[stage])
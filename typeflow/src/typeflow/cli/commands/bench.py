@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import typer
+
+from typeflow.core.bench import (
+    BASELINE_FILE,
+    SHAPES,
+    SIZES,
+    STAGES,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def split_option(value: str, allowed=None):
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if allowed is not None:
+        unknown = [item for item in items if item not in allowed]
+        if unknown:
+            typer.echo(
+                f"❌ Unknown value(s) {', '.join(unknown)}; choose from {', '.join(allowed)}"
+            )
+            raise typer.Exit(1)
+    return items
+
+
+def bench(
+    shapes: str = typer.Option(",".join(SHAPES), "--shapes", help="Comma-separated DAG shapes"),
+    sizes: str = typer.Option(
+        ",".join(str(s) for s in SIZES), "--sizes", help="Comma-separated node counts"
+    ),
+    stages: str = typer.Option(",".join(STAGES), "--stages", help="Comma-separated stages"),
+    repeat: int = typer.Option(3, "--repeat", help="Runs per timing; the best one is kept"),
+    baseline: Path = typer.Option(BASELINE_FILE, "--baseline", help="Baseline JSON file"),
+    save: bool = typer.Option(False, "--save-baseline", help="Store the results as baseline"),
+    max_ratio: float = typer.Option(
+        1.5, "--max-regression", help="Fail when a stage is this many times slower"
+    ),
+):
+    """Benchmark compile, generate and execute stages on synthetic DAGs."""
+    previous = load_baseline(baseline)
+
+    def report(key, result):
+        line = (
+            f"{key:<28} {result['seconds'] * 1000:>10.2f} ms"
+            f" {result['peak_bytes'] / 2**20:>9.2f} MB"
+        )
+        old = previous.get(key)
+        if old and old["seconds"] > 0:
+            line += f"  x{result['seconds'] / old['seconds']:.2f} vs baseline"
+        typer.echo(line)
+
+    results = run_benchmarks(
+        split_option(shapes, SHAPES),
+        [int(size) for size in split_option(sizes)],
+        split_option(stages, STAGES),
+        repeat,
+        report,
+    )
+
+    if save:
+        save_baseline({**previous, **results}, baseline)
+        typer.echo(f"💾 Baseline saved to {baseline}")
+        return
+
+    regressions = compare(results, previous, max_ratio)
+    if regressions:
+        for key, ratio in regressions.items():
+            typer.echo(f"⚠️ Regression: {key} is {ratio:.2f}x slower than baseline")
+        raise typer.Exit(1)
+    if previous:
+        typer.echo(f"✅ No stage more than {max_ratio}x slower than baseline")
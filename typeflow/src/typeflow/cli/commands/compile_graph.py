@@ -6,31 +6,95 @@ from typeflow.utils import (
     create_adjacency_lists,
     ensure_structure,
     extract_io_nodes,
+    load_yaml_definitions,
     save_compiled,
     save_io_nodes,
-    validate_graph,
+    validate_edges,
 )
+from typeflow.utils.fingerprint import (
+    changed_entities,
+    edges_to_validate,
+    io_fingerprints,
+    load_fingerprint,
+    manifest_fingerprints,
+    save_fingerprint,
+    sha,
+)
+from typeflow.utils.io_utils import IO_FILE
+from typeflow.utils.manifests import INDEX_ENABLED, build_index, load_index
 
 
-def compile():
+def report(results: dict, reused: dict):
+    """
+    Print the overall result. Edges validated in this run already printed
+    their errors; invalid edges reused from the fingerprint are listed here.
+    """
+    for key, valid in reused.items():
+        if not valid:
+            src, src_port, tgt_node, tgt_port = key.split("|")
+            typer.echo(
+                f"⚠️ Invalid edge (unchanged since last compile):"
+                f" {src}:{src_port} → {tgt_node}:{tgt_port}"
+            )
+    if all(results.values()):
+        typer.echo("✅ Workflow compiled and validated successfully!")
+    else:
+        typer.echo(
+            "⚠️ Workflow compiled but with some validation errors. You can still run it."
+        )
+
+
+def compile(
+    full: bool = typer.Option(
+        False, "--full", help="Ignore the previous compile and revalidate every edge"
+    ),
+):
     """Compile workflow DAG into adjacency lists and validate edges."""
     dag_path = ensure_structure()
+    dag_bytes = dag_path.read_bytes()
+
+    previous = {} if full else load_fingerprint()
+    dag_hash = sha(dag_bytes)
+    manifests = manifest_fingerprints(previous.get("manifests", {}))
 
-    with open(dag_path, "r") as f:
-        workflow_json = json.load(f)
+    if (
+        previous.get("dag") == dag_hash
+        and previous.get("manifests") == manifests
+        and IO_FILE.exists()
+    ):
+        typer.echo("♻️ Workflow and manifests unchanged since last compile.")
+        edges = previous.get("edges", {})
+        report(edges, edges)
+        return
+
+    workflow_json = json.loads(dag_bytes)
 
     typer.echo("🧩 Compiling graph...")
     adj_list, rev_adj_list = create_adjacency_lists(workflow_json)
     io_nodes = extract_io_nodes(workflow_json)
-    save_io_nodes(io_nodes)
     save_compiled(adj_list, rev_adj_list)
+    save_io_nodes(io_nodes)
 
-    typer.echo("🔍 Validating graph edges...")
-    all_valid = validate_graph(adj_list)
+    io_prints = io_fingerprints(io_nodes)
+    previous_io = previous.get("io", {})
+    io_changed = {
+        node_id for node_id, value in io_prints.items() if previous_io.get(node_id) != value
+    }
+    entities = changed_entities(previous.get("manifests", {}), manifests)
+    pending, reused = edges_to_validate(adj_list, previous, io_changed, entities)
+    results = dict(reused)
 
-    if all_valid:
-        typer.echo("✅ Workflow compiled and validated successfully!")
-    else:
-        typer.echo(
-            "⚠️ Workflow compiled but with some validation errors. You can still run it."
-        )
+    typer.echo(
+        f"🔍 Validating {len(pending)} changed graph edges"
+        f" ({len(reused)} unchanged edges reused)..."
+    )
+    if pending:
+        if INDEX_ENABLED and load_index() is None:
+            build_index()
+        load_yaml_definitions()
+        results.update(validate_edges(pending, io_nodes))
+
+    save_fingerprint(
+        {"dag": dag_hash, "manifests": manifests, "io": io_prints, "edges": results}
+    )
+    report(results, reused)
@@ -6,13 +6,37 @@ from typeflow.core import generate_script, write_script_to_file
 from typeflow.utils import load_compiled_graphs
 
 
-def generate():
+def generate(
+    parallel: bool = typer.Option(
+        False, "--parallel", help="Run independent nodes concurrently in waves"
+    ),
+    workers: int = typer.Option(
+        None, "--workers", "-w", help="Thread pool size for --parallel"
+    ),
+    process_workers: int = typer.Option(
+        None, "--process-workers", help="Process pool size for executor='process' nodes"
+    ),
+    cache: bool = typer.Option(
+        False, "--cache", help="Reuse node results from .typeflow/cache when inputs are unchanged"
+    ),
+    batch: bool = typer.Option(
+        False, "--batch", help="Run the workflow over JSON records read from stdin, one per line"
+    ),
+):
     """Generate orchestrator script based on compiled graphs."""
     # typer.echo("🔧 Loading compiled adjacency data...")
     adj_list, rev_adj_list = load_compiled_graphs()
 
     typer.echo("🧠 Generating orchestrator script...")
-    script = generate_script(adj_list, rev_adj_list)
+    script = generate_script(
+        adj_list,
+        rev_adj_list,
+        parallel=parallel,
+        max_workers=workers,
+        process_workers=process_workers,
+        cache=cache,
+        batch=batch,
+    )
 
     output_path = Path.cwd() / "src" / "orchestrator.py"
     write_script_to_file(script, output_path)
@@ -4,14 +4,28 @@ from pathlib import Path
 
 import typer
 
+from typeflow.core.profiler import PROFILE_DIR, PROFILERS, profile_run
+from typeflow.utils import load_compiled_graphs
+
 root = Path(".")
 
 
-def run():
+def run(
+    profile: str = typer.Option(
+        None, "--profile", help="Profile the run per node: 'cprofile' or 'sample'"
+    ),
+    output: Path = typer.Option(
+        PROFILE_DIR, "--profile-dir", help="Where --profile writes its report"
+    ),
+):
     """
     Runs the orchestrator script
     """
 
+    if profile:
+        run_profiled(profile, output)
+        return
+
     typer.echo("Running project...")
     try:
         subprocess.run(
@@ -25,3 +39,25 @@ def run():
         )
     except subprocess.CalledProcessError as e:
         typer.echo(f"❌ Workflow project failed to run: {e}")
+
+
+def run_profiled(profile: str, output: Path):
+    if profile not in PROFILERS:
+        typer.echo(f"❌ Unknown profiler '{profile}'. Choose from: {', '.join(PROFILERS)}")
+        raise typer.Exit(1)
+    script = (root / "src" / "orchestrator.py").resolve()
+    if not script.exists():
+        typer.echo(
+            "⚠️  Orchestrator script not found! Please run it to get script `typeflow generate`."
+        )
+        raise typer.Exit(1)
+
+    adj_list, _ = load_compiled_graphs()
+    typer.echo(f"Running project under {profile} profiler...")
+    try:
+        report = profile_run(profile, script, root.resolve(), adj_list, output)
+    except Exception as e:
+        typer.echo(f"❌ Workflow project failed to run: {e}")
+        raise typer.Exit(1)
+    typer.echo(report.read_text(encoding="utf-8"))
+    typer.echo(f"📄 Profile report written to {report}")
@@ -0,0 +1,217 @@
+"""
+Import node and class modules for validation.
+
+Each module is run as ``__main__``, exactly like ``python -m``, but inside a
+small pool of long-lived worker processes: a worker pays for the interpreter
+start-up and for importing shared libraries once, not once per module, and
+the modules are imported in parallel.
+
+A module is skipped when its source hash is unchanged since it last
+validated successfully and the manifests it wrote still exist. The hashes
+are kept in ``.typeflow/validated.json``; ``--force`` ignores them.
+
+With ``--static``, manifests are read from the source by
+``typeflow.sdk.static`` and only modules it cannot resolve are imported.
+"""
+
+import hashlib
+import json
+import os
+import runpy
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import typer
+
+from typeflow.sdk.static import Unresolved, write_static_manifests
+
+from .utils import check_decorator, update_workflow_yaml
+
+VALIDATE_WORKERS = int(
+    os.environ.get("TYPEFLOW_VALIDATE_WORKERS", str(min(os.cpu_count() or 1, 8)))
+)
+VALIDATED_FILE = Path(".typeflow/validated.json")
+
+KINDS = {
+    "node": {
+        "label": "Node",
+        "file": "src/nodes/{}/main.py",
+        "module": "src.nodes.{}.main",
+        "decorator": "node",
+        "section": "nodes",
+    },
+    "class": {
+        "label": "Class",
+        "file": "src/classes/{}.py",
+        "module": "src.classes.{}",
+        "decorator": "node_class",
+        "section": "classes",
+    },
+}
+
+
+def source_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def init_worker(root: str):
+    os.chdir(root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    # Forked workers inherit the parent's modules; project modules must come from root
+    for name in [m for m in sys.modules if m == "src" or m.startswith("src.")]:
+        del sys.modules[name]
+
+
+def import_module(module: str) -> tuple[list[str] | None, str | None]:
+    """
+    Run ``module`` as ``__main__`` in this worker. Returns the manifests its
+    decorators wrote, or the traceback when it failed.
+    """
+    try:
+        namespace = runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code in (None, 0):
+            return [], None
+        return None, f"exited with status {e.code}"
+    except BaseException:
+        return None, traceback.format_exc()
+
+    manifests = []
+    for value in namespace.values():
+        # Skip nodes imported from other modules; they are validated on their own
+        if getattr(value, "__module__", None) != "__main__":
+            continue
+        metadata = getattr(value, "__typeflow_node__", None)
+        if isinstance(metadata, dict):
+            manifests.append(f".typeflow/nodes/{metadata['name']}.yaml")
+        elif isinstance(value, type) and value.__dict__.get("__is_node_class__"):
+            manifests.append(f".typeflow/classes/{value.__name__}.yaml")
+    return manifests, None
+
+
+def load_validated(root: Path) -> dict:
+    try:
+        return json.loads((root / VALIDATED_FILE).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def is_unchanged(root: Path, entry: dict | None, digest: str, static: bool = False) -> bool:
+    return (
+        entry is not None
+        and entry["hash"] == digest
+        # Modules only read statically have not been imported yet
+        and (static or not entry.get("static"))
+        and all((root / manifest).exists() for manifest in entry["manifests"])
+    )
+
+
+def import_modules(root: Path, modules: list[str]) -> dict[str, tuple]:
+    """Import ``modules`` in parallel; maps each to ``(manifests, error)``."""
+    if not modules:
+        return {}
+    workers = max(1, min(VALIDATE_WORKERS, len(modules)))
+    results = {}
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(str(root),)) as pool:
+        futures = {module: pool.submit(import_module, module) for module in modules}
+        for module, future in futures.items():
+            try:
+                results[module] = future.result()
+            except BrokenProcessPool:
+                results[module] = (None, "validation worker crashed")
+    return results
+
+
+def extract_modules(root: Path, modules: list[str], paths: dict) -> dict[str, list[str]]:
+    """Write the manifests of the modules that can be read statically."""
+    extracted = {}
+    for module in modules:
+        try:
+            extracted[module] = write_static_manifests(paths[module], root)
+        except Unresolved:
+            continue
+    return extracted
+
+
+def validate_items(
+    items: list[tuple[str, str]], force: bool = False, static: bool = False
+) -> dict[tuple, str]:
+    """
+    Validate ``(kind, name)`` pairs, ``kind`` being ``"node"`` or ``"class"``.
+    Valid items are added to workflow.yaml. Every item is reported; raises
+    ``typer.Exit(1)`` at the end if any failed. Returns the status of each
+    pair: ``validated``, ``extracted`` (``static`` only), ``unchanged`` or
+    ``failed``.
+
+    With ``static``, manifests are read from the source when possible and
+    only the other modules are imported.
+    """
+    root = Path.cwd()
+    validated = load_validated(root)
+    status, pending, digests, paths = {}, [], {}, {}
+
+    for kind, name in items:
+        spec = KINDS[kind]
+        path = root / spec["file"].format(name)
+        if not path.exists():
+            typer.echo(f"Error: {spec['label']} '{name}' does not exist.")
+            status[kind, name] = "failed"
+            continue
+        if not check_decorator(path, spec["decorator"]):
+            typer.echo(
+                f"Error: {spec['label']} '{name}' does not have @{spec['decorator']} decorator."
+            )
+            status[kind, name] = "failed"
+            continue
+        module = spec["module"].format(name)
+        digests[module], paths[module] = source_hash(path), path
+        if not force and is_unchanged(root, validated.get(module), digests[module], static):
+            status[kind, name] = "unchanged"
+        elif module not in pending:
+            pending.append(module)
+
+    extracted = extract_modules(root, pending, paths) if static else {}
+    results = import_modules(root, [module for module in pending if module not in extracted])
+    for kind, name in items:
+        module = KINDS[kind]["module"].format(name)
+        if module in extracted:
+            validated[module] = {
+                "hash": digests[module],
+                "manifests": extracted[module],
+                "static": True,
+            }
+            status[kind, name] = "extracted"
+            continue
+        if module not in results:
+            continue
+        manifests, error = results[module]
+        if error is None:
+            validated[module] = {"hash": digests[module], "manifests": manifests}
+            status[kind, name] = "validated"
+        else:
+            typer.echo(error.rstrip(), err=True)
+            typer.echo(f"Runtime Error in {kind} '{name}': {error.strip().splitlines()[-1]}")
+            validated.pop(module, None)
+            status[kind, name] = "failed"
+
+    (root / VALIDATED_FILE).write_text(json.dumps(validated, indent=2, sort_keys=True))
+
+    for kind, spec in KINDS.items():
+        names = [n for k, n in items if k == kind and status[k, n] != "failed"]
+        if not names:
+            continue
+        update_workflow_yaml(names, spec["section"])
+        for name in names:
+            suffix = {
+                "unchanged": " (unchanged, not re-imported)",
+                "extracted": " (manifest read from source)",
+            }.get(status[kind, name], "")
+            typer.echo(f"{spec['label']} '{name}' validated and added to workflow.yaml{suffix}")
+
+    if "failed" in status.values():
+        raise typer.Exit(code=1)
+    return status
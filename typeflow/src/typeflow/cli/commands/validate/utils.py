@@ -14,7 +14,7 @@ def check_decorator(file_path: Path, decorator_name: str) -> bool:
         tree = ast.parse(f.read(), filename=str(file_path))
 
     for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
             for dec in node.decorator_list:
                 if isinstance(dec, ast.Name) and dec.id == decorator_name:
                     return True
@@ -27,7 +27,7 @@ def check_decorator(file_path: Path, decorator_name: str) -> bool:
     return False
 
 
-def update_workflow_yaml(item_name: str, section: str):
+def update_workflow_yaml(item_names: list[str], section: str):
     cwd = Path.cwd()
     workflow_file = cwd / "workflow" / "workflow.yaml"
     if not workflow_file.exists():
@@ -40,8 +40,9 @@ def update_workflow_yaml(item_name: str, section: str):
     if section not in data:
         data[section] = []
 
-    if item_name not in data[section]:
-        data[section].append(item_name)
+    for item_name in item_names:
+        if item_name not in data[section]:
+            data[section].append(item_name)
 
     with open(workflow_file, "w") as f:
         yaml.safe_dump(data, f, sort_keys=False)
@@ -5,11 +5,17 @@ from pathlib import Path
 import typer
 import yaml
 
-from .validate_class import validate_class
-from .validate_node import validate_node
+from .runner import validate_items
 
 
-def validate_workflow():
+def validate_workflow(
+    force: bool = typer.Option(
+        False, "--force", help="Re-import modules whose source is unchanged"
+    ),
+    static: bool = typer.Option(
+        False, "--static", help="Read manifests from the source, importing only when needed"
+    ),
+):
     cwd = Path.cwd()
     workflow_file = cwd / "workflow" / "workflow.yaml"
 
@@ -29,12 +35,13 @@ def validate_workflow():
         typer.echo(f"\n🧩 Validating {len(nodes)} nodes:")
         for node in nodes:
             typer.echo(f" -> Node: {node}")
-            validate_node(node)
 
     if classes:
         typer.echo(f"\n🏗️ Validating {len(classes)} classes:")
         for cls in classes:
             typer.echo(f" -> Class: {cls}")
-            validate_class(cls)
 
+    # Nodes and classes are imported together by one worker pool
+    items = [("node", n) for n in nodes] + [("class", c) for c in classes]
+    validate_items(items, force=force, static=static)
     typer.echo("\n✅ Workflow validation complete!")
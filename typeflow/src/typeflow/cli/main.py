@@ -2,12 +2,13 @@ import typer
 
 from .commands import (
     add,
-    remove,
+    bench,
     compile_graph,
     create_class,
     create_node,
     generate,
     install,
+    remove,
     run,
     setup,
     start_ui,
@@ -37,6 +38,7 @@ app.command()(generate.generate)
 app.command()(start_ui.start_ui)
 app.command()(run.run)
 app.command()(install.install)
+app.command()(bench.bench)
 app.add_typer(validate.app, name="validate")
 
 if __name__ == "__main__":
@@ -1,2 +1,3 @@
+from .runtime import compile_plan as compile_plan
 from .script_generator import generate_script as generate_script
 from .script_generator import write_script_to_file as write_script_to_file
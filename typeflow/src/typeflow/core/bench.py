@@ -0,0 +1,259 @@
+"""
+Benchmarks of the compile, generate and execute stages on synthetic DAGs.
+
+Every shape builds a workflow of roughly ``size`` nodes together with the
+manifests and node implementations it needs, so the whole pipeline runs
+without a project on disk:
+
+    results = run_benchmarks(shapes=("chain",), sizes=(1000,))
+    regressions = compare(results, load_baseline())
+"""
+
+import contextlib
+import gc
+import io
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from typeflow.utils import create_adjacency_lists, extract_io_nodes, graph_utils, validate_edges
+
+from .runtime import compile_plan
+from .script_generator import generate_script, topo_kahn
+
+BASELINE_FILE = Path(".typeflow/bench/baseline.json")
+SIZES = (10, 1_000, 100_000)
+STAGES = ("adjacency", "topo", "validate", "generate", "plan", "execute")
+
+# Timings below this are dominated by noise and never count as regressions
+MIN_COMPARABLE_SECONDS = 0.001
+
+INT_INPUT = {"id": "X:num@1", "type": "X", "data": {"value": "1", "valueType": "int"}}
+
+FUNC_MANIFESTS = {
+    "inc": {"name": "inc", "entity": "function", "inputs": {"x": "int"}, "returns": "int"},
+    "add": {
+        "name": "add",
+        "entity": "function",
+        "inputs": {"a": "int", "b": "int"},
+        "returns": "int",
+    },
+}
+CLASS_MANIFESTS = {
+    "Counter": {
+        "name": "Counter",
+        "entity": "class",
+        "fields": {"step": "int"},
+        "methods": {"add": {"input": {"x": "int"}, "returns": "int"}},
+    }
+}
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def add(a: int, b: int) -> int:
+    return (a + b) % 1_000_003
+
+
+class Counter:
+    def __init__(self, step: int):
+        self.step = step
+
+    def add(self, x: int) -> int:
+        return x + self.step
+
+
+CALLABLES = {"inc": inc, "add": add, "Counter": Counter}
+
+
+def resolve(node):
+    return CALLABLES[node.split(":")[1].split("@")[0]]
+
+
+def edge(source, target, source_handle, target_handle):
+    return {
+        "source": source,
+        "target": target,
+        "sourceHandle": source_handle,
+        "targetHandle": target_handle,
+    }
+
+
+def output_node(source, source_handle="returns"):
+    node = {"id": "O:text_out@1", "type": "O", "data": {"outputType": "int"}}
+    return node, edge(source, node["id"], source_handle, "input")
+
+
+def chain_dag(size):
+    """An input followed by ``size`` function nodes in a single chain."""
+    nodes, connections = [INT_INPUT], []
+    prev, handle = INT_INPUT["id"], "val"
+    for i in range(1, size + 1):
+        node = f"F:inc@{i}"
+        nodes.append({"id": node, "type": "F", "data": {}})
+        connections.append(edge(prev, node, handle, "x"))
+        prev, handle = node, "returns"
+    out, out_edge = output_node(prev, handle)
+    return {"nodes": nodes + [out], "connections": connections + [out_edge]}
+
+
+def fanout_dag(size):
+    """One input consumed by ``size`` independent function nodes."""
+    nodes, connections = [INT_INPUT], []
+    for i in range(1, size + 1):
+        node = f"F:inc@{i}"
+        nodes.append({"id": node, "type": "F", "data": {}})
+        connections.append(edge(INT_INPUT["id"], node, "val", "x"))
+    return {"nodes": nodes, "connections": connections}
+
+
+def diamond_dag(size):
+    """Chained diamonds: each value feeds two branches that are joined again."""
+    nodes, connections = [INT_INPUT], []
+    prev, handle = INT_INPUT["id"], "val"
+    for i in range(1, max(size // 3, 1) + 1):
+        left, right, join = f"F:inc@{3 * i - 2}", f"F:inc@{3 * i - 1}", f"F:add@{i}"
+        for node in (left, right, join):
+            nodes.append({"id": node, "type": "F", "data": {}})
+        connections += [
+            edge(prev, left, handle, "x"),
+            edge(prev, right, handle, "x"),
+            edge(left, join, "returns", "a"),
+            edge(right, join, "returns", "b"),
+        ]
+        prev, handle = join, "returns"
+    out, out_edge = output_node(prev, handle)
+    return {"nodes": nodes + [out], "connections": connections + [out_edge]}
+
+
+def class_dag(size):
+    """Chained class instances, each with one method node."""
+    nodes, connections = [INT_INPUT], []
+    prev, handle = INT_INPUT["id"], "val"
+    for i in range(1, max(size // 2, 1) + 1):
+        cls, method = f"C:Counter@{i}", f"C:Counter@{i}:add@{i}"
+        nodes.append({"id": cls, "type": "C", "data": {"subNodes": [{"id": method}]}})
+        connections += [
+            edge(INT_INPUT["id"], cls, "val", "step"),
+            edge(prev, method, handle, "x"),
+        ]
+        prev, handle = method, "returns"
+    out, out_edge = output_node(prev, handle)
+    return {"nodes": nodes + [out], "connections": connections + [out_edge]}
+
+
+SHAPES = {
+    "chain": chain_dag,
+    "fanout": fanout_dag,
+    "diamond": diamond_dag,
+    "class": class_dag,
+}
+
+
+def stage_functions(dag):
+    """Return ``{stage: callable}``; each stage reuses the previous stage's output."""
+    io_nodes = extract_io_nodes(dag)
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    edges = [
+        (src, src_port, tgt_node, tgt_port)
+        for src, targets in adj_list.items()
+        for tgt_node, src_port, tgt_port in targets
+    ]
+    manifests = (CLASS_MANIFESTS, FUNC_MANIFESTS)
+    plan = compile_plan(adj_list, rev_adj_list, io_nodes, resolve, manifests)
+
+    def validate():
+        with contextlib.redirect_stdout(io.StringIO()):
+            validate_edges(edges, io_nodes)
+
+    return {
+        "adjacency": lambda: create_adjacency_lists(dag),
+        "topo": lambda: topo_kahn(adj_list),
+        "validate": validate,
+        "generate": lambda: generate_script(
+            adj_list, rev_adj_list, ports=io_nodes, manifests=manifests
+        ),
+        "plan": lambda: compile_plan(adj_list, rev_adj_list, io_nodes, resolve, manifests),
+        "execute": plan.run,
+    }
+
+
+@contextlib.contextmanager
+def bench_manifests():
+    """Install the benchmark manifests in the validator's lookup tables."""
+    saved = dict(graph_utils.class_yaml), dict(graph_utils.func_yaml)
+    graph_utils.class_yaml.update(CLASS_MANIFESTS)
+    graph_utils.func_yaml.update(FUNC_MANIFESTS)
+    try:
+        yield
+    finally:
+        for table, old in zip((graph_utils.class_yaml, graph_utils.func_yaml), saved):
+            table.clear()
+            table.update(old)
+
+
+def measure(func, repeat=3):
+    """Return ``(best_seconds, peak_bytes)``. Memory is traced in a separate run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(shapes=tuple(SHAPES), sizes=SIZES, stages=STAGES, repeat=3, report=None):
+    """
+    Benchmark every stage on every shape and size. Returns
+    ``{"shape/size/stage": {"seconds": ..., "peak_bytes": ...}}``; ``report`` is
+    called with each key and result as soon as it is measured.
+    """
+    results = {}
+    with bench_manifests():
+        for shape in shapes:
+            for size in sizes:
+                funcs = stage_functions(SHAPES[shape](size))
+                for stage in stages:
+                    seconds, peak = measure(funcs[stage], repeat)
+                    key = f"{shape}/{size}/{stage}"
+                    results[key] = {"seconds": seconds, "peak_bytes": peak}
+                    if report:
+                        report(key, results[key])
+    return results
+
+
+def load_baseline(path=BASELINE_FILE):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(results, path=BASELINE_FILE):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+def compare(results, baseline, max_ratio=1.5):
+    """Return ``{key: ratio}`` for every timing slower than ``max_ratio`` × baseline."""
+    regressions = {}
+    for key, result in results.items():
+        old = baseline.get(key)
+        if not old or old["seconds"] < MIN_COMPARABLE_SECONDS:
+            continue
+        ratio = result["seconds"] / old["seconds"]
+        if ratio > max_ratio:
+            regressions[key] = ratio
+    return regressions
@@ -0,0 +1,134 @@
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from pathlib import Path
+
+CACHE_DIR = Path(".typeflow/cache")
+DEFAULT_MAX_BYTES = int(os.environ.get("TYPEFLOW_CACHE_MAX_BYTES", str(1 << 30)))
+
+MANIFEST_DIRS = (Path(".typeflow/nodes"), Path(".typeflow/classes"))
+
+
+def _digest(*parts: bytes) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+class NodeCache:
+    """
+    Content-addressed, size-bounded on-disk cache of node results.
+
+    A result is keyed on the node's source file, its manifest and the pickled
+    input values (including the instance for methods). Changing an input or a
+    node's code therefore only re-runs the affected nodes: unchanged upstream
+    nodes hit the cache and produce identical inputs downstream. Entries are
+    evicted least-recently-used once the cache exceeds ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.code_hashes: dict = {}
+        self.size = sum(p.stat().st_size for p in self.directory.glob("*.pkl"))
+
+    def code_hash(self, func) -> bytes:
+        """Hash of the node's source file and manifest, computed once per callable."""
+        target = getattr(func, "__func__", func)
+        if target in self.code_hashes:
+            return self.code_hashes[target]
+        # @node wraps the function; hash the module that defines its body
+        source = inspect.unwrap(target)
+        parts = [f"{source.__module__}.{source.__qualname__}".encode()]
+        try:
+            parts.append(Path(inspect.getsourcefile(source)).read_bytes())
+        except (TypeError, OSError):
+            parts.append(source.__code__.co_code)
+        owner = getattr(func, "__self__", None)
+        name = type(owner).__name__ if owner is not None else source.__name__
+        for manifest_dir in MANIFEST_DIRS:
+            manifest = manifest_dir / f"{name}.yaml"
+            if manifest.exists():
+                parts.append(manifest.read_bytes())
+        code = _digest(*parts).encode()
+        self.code_hashes[target] = code
+        return code
+
+    def key(self, func, kwargs) -> str | None:
+        """Cache key for ``func(**kwargs)``; None when the inputs cannot be hashed."""
+        try:
+            inputs = pickle.dumps(
+                (getattr(func, "__self__", None), sorted(kwargs.items())), protocol=5
+            )
+        except Exception:
+            return None
+        return _digest(self.code_hash(func), inputs)
+
+    def get(self, key: str):
+        """Return ``(True, value)`` on a hit, ``(False, None)`` on a miss."""
+        path = self.directory / f"{key}.pkl"
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        # Entries referring to renamed or removed code no longer unpickle
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return False, None
+        # Touch the entry so eviction is least-recently-used
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value):
+        try:
+            data = pickle.dumps(value, protocol=5)
+        except Exception:
+            return
+        if len(data) > self.max_bytes:
+            return
+        path = self.directory / f"{key}.pkl"
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        with self.lock:
+            self.size += len(data)
+            if self.size > self.max_bytes:
+                self.evict()
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self.size -= size
+
+    def call(self, func, /, **kwargs):
+        """Return the cached result of ``func(**kwargs)``, computing it on a miss."""
+        key = self.key(func, kwargs)
+        if key is None:
+            return func(**kwargs)
+        hit, value = self.get(key)
+        if hit:
+            return value
+        value = func(**kwargs)
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            for path in self.directory.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+            self.size = 0
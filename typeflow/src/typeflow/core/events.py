@@ -0,0 +1,49 @@
+"""
+Structured events of live orchestrators.
+
+Live scripts report progress with ``emit(event)``. Inside a warm worker the
+server installs a dedicated channel, and every event travels as one
+length-prefixed binary frame (``Connection.send_bytes``), separate from
+stdout and stderr, which only carry the user's logs. Run anywhere else, for
+example from a test or a terminal, events are printed as JSON lines.
+"""
+
+import json
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+channel = None
+# Nodes of parallel waves and the image encoder emit from their own threads
+lock = threading.Lock()
+
+
+def encode_event(event: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:  # e.g. integers beyond 64 bits, which json handles
+            pass
+    return json.dumps(event).encode()
+
+
+def decode_event(frame: bytes) -> dict:
+    return orjson.loads(frame) if orjson is not None else json.loads(frame)
+
+
+def set_channel(conn):
+    """Send events to ``conn`` (a multiprocessing Connection) from now on."""
+    global channel
+    channel = conn
+
+
+def emit(event: dict):
+    if channel is None:
+        print(json.dumps(event))
+        return
+    frame = encode_event(event)
+    with lock:
+        channel.send_bytes(frame)
@@ -0,0 +1,275 @@
+"""
+Output sinks of live orchestrators.
+
+Image outputs are encoded on a background thread so the workflow does not
+wait for them. Only a preview is encoded during the run: a thumbnail of at
+most ``THUMBNAIL_SIZE`` pixels, in ``IMAGE_FORMAT``. The full-resolution
+pixels are saved unencoded and turned into an image file the first time the
+editor asks for it (``encode_full``). With ``THUMBNAIL_SIZE=0`` the full
+image is encoded during the run and serves as the preview.
+
+Table outputs are written once, one ``.npy`` file per column, and the event
+only carries the schema, the row count and the first page. ``read_table``
+serves further pages, column subsets and sorted views; numeric columns are
+memory-mapped, so a page only reads the rows it returns.
+"""
+
+import json
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+from .events import emit
+
+OUTPUT_DIR = Path("data/outputs")
+TABLE_DIR = OUTPUT_DIR / "tables"
+# Rows sent with the node_output event and served per page by default
+TABLE_PAGE_SIZE = int(os.environ.get("TYPEFLOW_TABLE_PAGE_SIZE", "100"))
+# Text columns up to this many characters are stored fixed-width so they can be memory-mapped
+MAX_FIXED_TEXT = 64
+
+IMAGE_FORMATS = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}
+IMAGE_FORMAT = os.environ.get("TYPEFLOW_IMAGE_FORMAT", "png").lower()
+# Quality of lossy formats (JPEG, WebP), 1-100
+IMAGE_QUALITY = int(os.environ.get("TYPEFLOW_IMAGE_QUALITY", "85"))
+# Longest side of the preview in pixels
+THUMBNAIL_SIZE = int(os.environ.get("TYPEFLOW_IMAGE_THUMBNAIL", "512"))
+
+OUTPUT_ID = re.compile(r"^[0-9a-f]{32}$")
+
+encoder = None
+pending = []
+lock = threading.Lock()
+# Serializes full-resolution encodes requested by concurrent editor requests
+full_lock = threading.Lock()
+
+
+def image_extension(fmt=None) -> str:
+    fmt = (fmt or IMAGE_FORMAT).lower()
+    if fmt not in IMAGE_FORMATS:
+        raise ValueError(
+            f"Unknown image format '{fmt}'. Expected one of: {', '.join(IMAGE_FORMATS)}."
+        )
+    return "jpg" if fmt == "jpeg" else fmt
+
+
+def encode(img: Image.Image, path: Path, fmt=None, quality=None):
+    """Write ``img`` to ``path`` in ``fmt`` (png, jpeg or webp)."""
+    fmt = (fmt or IMAGE_FORMAT).lower()
+    image_extension(fmt)
+    if fmt == "jpeg" and img.mode not in ("L", "RGB"):
+        img = img.convert("RGB")
+    options = {} if fmt == "png" else {"quality": quality or IMAGE_QUALITY}
+    tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+    img.save(tmp, format=IMAGE_FORMATS[fmt], **options)
+    os.replace(tmp, path)
+
+
+def to_pixels(value):
+    """Copy an image output so later nodes cannot change it while it is encoded."""
+    if isinstance(value, np.ndarray):
+        return np.array(value, copy=True)
+    if isinstance(value, Image.Image):
+        if value.mode not in ("L", "RGB", "RGBA"):
+            value = value.convert("RGBA")
+        return np.asarray(value).copy()
+    return None
+
+
+def write_image(pixels: np.ndarray, image_id: str, node: str):
+    img = Image.fromarray(pixels)
+    height, width = pixels.shape[:2]
+    event = {
+        "event": "node_output",
+        "outputType": "image",
+        "id": node,
+        "width": width,
+        "height": height,
+    }
+    if THUMBNAIL_SIZE > 0 and max(width, height) > THUMBNAIL_SIZE:
+        # Keep the pixels; the full image is encoded if someone opens it
+        np.save(OUTPUT_DIR / f"{image_id}.npy", pixels)
+        img.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        preview = f"{image_id}_preview.{image_extension()}"
+        event["full"] = f"/api/images/{image_id}"
+    else:
+        preview = f"{image_id}.{image_extension()}"
+        event["full"] = f"/outputs/{preview}"
+    encode(img, OUTPUT_DIR / preview)
+    event["val"] = f"/outputs/{preview}"
+    emit(event)
+
+
+def encode_output(pixels: np.ndarray, image_id: str, node: str):
+    try:
+        write_image(pixels, image_id, node)
+    except Exception as e:
+        message = f"Image encoding failed: {e}"
+        emit({"event": "node_error", "id": node, "msg": message})
+
+
+def send_image(value, node: str):
+    """Queue an image output for encoding and return immediately."""
+    global encoder
+    pixels = to_pixels(value)
+    if pixels is None:
+        emit({"event": "node_error", "id": node, "msg": "Unsupported image type"})
+        return
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with lock:
+        if encoder is None:
+            encoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="typeflow-images")
+        pending.append(encoder.submit(encode_output, pixels, uuid.uuid4().hex, node))
+
+
+def wait_for_outputs():
+    """Block until every queued output has been written and reported."""
+    with lock:
+        futures = list(pending)
+        pending.clear()
+    for future in futures:
+        future.result()
+
+
+def encode_full(image_id: str, output_dir: Path = OUTPUT_DIR) -> Path | None:
+    """
+    Path of the full-resolution image, encoding it from the saved pixels on
+    first request. Returns None for unknown ids.
+    """
+    if not OUTPUT_ID.match(image_id):
+        return None
+    path = output_dir / f"{image_id}.{image_extension()}"
+    raw = output_dir / f"{image_id}.npy"
+    with full_lock:
+        if path.exists():
+            return path
+        if not raw.exists():
+            return None
+        encode(Image.fromarray(np.load(raw)), path)
+        raw.unlink()
+    return path
+
+
+# ------------------------------
+# Tables
+# ------------------------------
+
+
+def to_frame(value) -> pd.DataFrame:
+    if isinstance(value, pd.DataFrame):
+        return value
+    if isinstance(value, pd.Series):
+        return value.to_frame()
+    value = list(value)
+    if value and all(isinstance(x, dict) for x in value):
+        return pd.DataFrame(value)
+    return pd.DataFrame({"value": value})
+
+
+def page_records(frame: pd.DataFrame) -> list[dict]:
+    """JSON-safe records (NaN as null, dates in ISO format)."""
+    return json.loads(frame.to_json(orient="records", date_format="iso"))
+
+
+def write_table(frame: pd.DataFrame, table_dir: Path) -> dict:
+    """Store ``frame`` column by column; returns its schema."""
+    table_dir.mkdir(parents=True, exist_ok=True)
+    columns = []
+    for index, (name, series) in enumerate(frame.items()):
+        array = series.to_numpy()
+        if (
+            array.dtype.kind == "O"
+            and pd.api.types.is_string_dtype(series)
+            and series.notna().all()
+            and series.str.len().max() <= MAX_FIXED_TEXT
+        ):
+            array = array.astype(str)
+        # Only fixed-width columns can be memory-mapped; others are pickled
+        np.save(table_dir / f"{index}.npy", array, allow_pickle=array.dtype.kind == "O")
+        columns.append({"name": str(name), "dtype": str(series.dtype)})
+    schema = {"rows": len(frame), "columns": columns}
+    (table_dir / "schema.json").write_text(json.dumps(schema))
+    return schema
+
+
+def send_table(value, node: str, output_dir: Path | None = None):
+    """Persist a table output and send its schema, row count and first page."""
+    frame = to_frame(value)
+    table_id = uuid.uuid4().hex
+    schema = write_table(frame, (output_dir or TABLE_DIR) / table_id)
+    emit({
+        "event": "node_output",
+        "outputType": "table",
+        "id": node,
+        "val": page_records(frame.iloc[:TABLE_PAGE_SIZE]),
+        "table": {"id": table_id, "url": f"/api/tables/{table_id}", **schema},
+    })
+
+
+def load_column(table_dir: Path, index: int) -> np.ndarray:
+    path = table_dir / f"{index}.npy"
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:  # object columns cannot be memory-mapped
+        return np.load(path, allow_pickle=True)
+
+
+def sort_order(table_dir: Path, index: int, descending: bool) -> np.ndarray:
+    """Row order sorted by one column (nulls last), cached next to the table."""
+    path = table_dir / f"order-{index}-{'desc' if descending else 'asc'}.npy"
+    if path.exists():
+        return np.load(path, mmap_mode="r")
+    column = pd.Series(load_column(table_dir, index))
+    order = column.sort_values(ascending=not descending, kind="stable").index.to_numpy()
+    np.save(path, order)
+    return order
+
+
+def read_table(
+    table_id: str,
+    offset: int = 0,
+    limit: int = TABLE_PAGE_SIZE,
+    columns: list[str] | None = None,
+    sort: str | None = None,
+    descending: bool = False,
+    output_dir: Path | None = None,
+) -> dict | None:
+    """
+    One page of a stored table: ``limit`` rows from ``offset``, restricted to
+    ``columns`` and ordered by the ``sort`` column. Returns None for unknown
+    ids and raises KeyError for unknown columns.
+    """
+    if not OUTPUT_ID.match(table_id):
+        return None
+    table_dir = (output_dir or TABLE_DIR) / table_id
+    try:
+        schema = json.loads((table_dir / "schema.json").read_text())
+    except FileNotFoundError:
+        return None
+    names = [c["name"] for c in schema["columns"]]
+    for name in (columns or []) + ([sort] if sort else []):
+        if name not in names:
+            raise KeyError(name)
+
+    rows = slice(offset, offset + limit)
+    if sort:
+        rows = np.asarray(sort_order(table_dir, names.index(sort), descending)[rows])
+    selected = columns or names
+    page = pd.DataFrame(
+        {name: load_column(table_dir, names.index(name))[rows] for name in selected},
+        columns=selected,
+    )
+    return {
+        "id": table_id,
+        "rows": schema["rows"],
+        "offset": offset,
+        "columns": [c for c in schema["columns"] if c["name"] in selected],
+        "data": page_records(page),
+    }
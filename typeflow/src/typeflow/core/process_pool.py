@@ -0,0 +1,77 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Arrays smaller than this are cheaper to pickle than to stage in shared memory
+SHARED_MEMORY_THRESHOLD = 1 << 20
+
+
+class SharedArray:
+    """Picklable handle to a NumPy array staged in a shared memory block."""
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def load(self):
+        """Attach to the block and copy the array out of it."""
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            view = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+            array = view.copy()
+            del view
+        finally:
+            shm.close()
+        return array
+
+
+def share_arrays(kwargs):
+    """
+    Replace large NumPy arrays in ``kwargs`` by SharedArray handles.
+    Returns the new kwargs and the shared memory blocks the caller must release.
+    """
+    shared, blocks = {}, []
+    for key, value in kwargs.items():
+        if (
+            isinstance(value, np.ndarray)
+            and value.dtype != object
+            and value.nbytes >= SHARED_MEMORY_THRESHOLD
+        ):
+            shm = shared_memory.SharedMemory(create=True, size=value.nbytes)
+            staged = np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+            staged[...] = value
+            del staged
+            blocks.append(shm)
+            shared[key] = SharedArray(shm.name, value.shape, value.dtype)
+        else:
+            shared[key] = value
+    return shared, blocks
+
+
+def release(blocks):
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+
+def call_shared(func, kwargs):
+    """Worker-side entry point: restore shared arrays and call the node."""
+    kwargs = {
+        key: value.load() if isinstance(value, SharedArray) else value
+        for key, value in kwargs.items()
+    }
+    return func(**kwargs)
+
+
+def submit_to_process(pool, func, /, **kwargs):
+    """
+    Submit ``func(**kwargs)`` to a ProcessPoolExecutor and return the future.
+    Large NumPy arguments travel through shared memory instead of the pickle pipe.
+    """
+    shared, blocks = share_arrays(kwargs)
+    if not blocks:
+        return pool.submit(func, **kwargs)
+    future = pool.submit(call_shared, func, shared)
+    future.add_done_callback(lambda _: release(blocks))
+    return future
@@ -0,0 +1,236 @@
+"""
+Profile an orchestrator run and attribute the time to workflow nodes.
+
+Generated lines end with a ``# <node ids>`` comment, and every F/C node maps
+to a function in the project's sources. Time spent on an annotated line of the
+orchestrator, or inside a node's function, is charged to that node.
+
+Two profilers are available:
+
+- ``cprofile``: deterministic, per-function totals from ``cProfile``. Nodes
+  sharing a function (``F:inc@1``, ``F:inc@2``) are reported together, and
+  only calls made on the main thread are seen.
+- ``sample``: samples the stack of every thread at a fixed interval, so time
+  is split per node id and also covers thread-pool and asyncio waves.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import re
+import runpy
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+PROFILERS = ("cprofile", "sample")
+PROFILE_DIR = Path(".typeflow/profile")
+SAMPLE_INTERVAL = 0.001
+TOP = 15
+
+NODE_COMMENT = re.compile(r"#\s*([FCXO]:\S+(?:,\s*[FCXO]:\S+)*)\s*$")
+
+
+def node_lines(source: str) -> dict:
+    """Map line numbers of a generated script to the node ids they evaluate."""
+    lines = {}
+    for lineno, line in enumerate(source.splitlines(), start=1):
+        match = NODE_COMMENT.search(line)
+        if match:
+            lines[lineno] = match.group(1)
+    return lines
+
+
+def node_functions(adj_list, root: Path) -> dict:
+    """Map ``(source file, function name)`` of every F/C node to its node ids."""
+    functions = defaultdict(list)
+    for node in adj_list:
+        parts = node.split(":")
+        name = parts[1].split("@")[0]
+        if parts[0] == "F":
+            key = (root / "src" / "nodes" / name / "main.py", name)
+        elif parts[0] == "C":
+            method = parts[2].split("@")[0] if len(parts) >= 3 else "__init__"
+            key = (root / "src" / "classes" / f"{name}.py", method)
+        else:
+            continue
+        functions[(os.path.realpath(key[0]), key[1])].append(node)
+    return {key: ", ".join(nodes) for key, nodes in functions.items()}
+
+
+def execute(script: Path, root: Path):
+    """Run the orchestrator like ``python -m src.orchestrator`` would."""
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise
+
+
+def describe(filename, lineno, funcname):
+    if filename == "~":  # cProfile's marker for built-in functions
+        return funcname
+    return f"{funcname} ({Path(filename).name}:{lineno})"
+
+
+def profile_cprofile(script: Path, root: Path, adj_list):
+    """Return ``(wall_seconds, nodes, callees, raw_stats)`` from a cProfile run."""
+    functions = node_functions(adj_list, root)
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        execute(script, root)
+    finally:
+        profiler.disable()
+        wall = time.perf_counter() - start
+    stats = pstats.Stats(profiler)
+
+    # Identify the node functions among the profiled entries
+    labels = {}
+    for func in stats.stats:
+        filename, _, funcname = func
+        label = functions.get((os.path.realpath(filename), funcname))
+        if label:
+            labels[func] = label
+
+    nodes = defaultdict(lambda: {"calls": 0, "own": 0.0, "total": 0.0})
+    for func, label in labels.items():
+        _, calls, own, total, _ = stats.stats[func]
+        nodes[label]["calls"] += calls
+        nodes[label]["own"] += own
+        nodes[label]["total"] += total
+
+    callees = defaultdict(Counter)
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, total) in callers.items():
+            if caller in labels and func not in labels:
+                callees[labels[caller]][describe(*func)] += total
+    return wall, dict(nodes), callees, stats
+
+
+class Sampler(threading.Thread):
+    """Samples every thread's stack and charges each sample to a node."""
+
+    def __init__(self, script: Path, lines: dict, functions: dict, interval: float):
+        super().__init__(name="typeflow-sampler", daemon=True)
+        self.script = str(script)
+        self.lines = lines
+        self.functions = functions
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.samples = Counter()
+        self.seconds = Counter()
+        self.callees = defaultdict(Counter)
+        self.realpaths = {}
+
+    def node_of(self, frame):
+        """Innermost node function on the stack, overridden by an annotated line."""
+        node = None
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == self.script and frame.f_lineno in self.lines:
+                return self.lines[frame.f_lineno]
+            if node is None:
+                path = self.realpaths.get(code.co_filename)
+                if path is None:
+                    path = os.path.realpath(code.co_filename)
+                    self.realpaths[code.co_filename] = path
+                node = self.functions.get((path, code.co_name))
+            frame = frame.f_back
+        return node
+
+    def run(self):
+        me = threading.get_ident()
+        last = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            # A busy node holds the GIL, so ticks are often late: charge each
+            # sample with the time actually elapsed since the previous one
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                node = self.node_of(frame)
+                if node:
+                    code = frame.f_code
+                    leaf = describe(code.co_filename, frame.f_lineno, code.co_name)
+                    self.samples[node] += 1
+                    self.seconds[node] += elapsed
+                    self.callees[node][leaf] += elapsed
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def profile_sample(script: Path, root: Path, adj_list, interval=SAMPLE_INTERVAL):
+    """Return ``(wall_seconds, nodes, callees)`` from a sampled run."""
+    sampler = Sampler(
+        script,
+        node_lines(script.read_text(encoding="utf-8")),
+        node_functions(adj_list, root),
+        interval,
+    )
+    start = time.perf_counter()
+    sampler.start()
+    try:
+        execute(script, root)
+    finally:
+        sampler.stop()
+        wall = time.perf_counter() - start
+    nodes = {
+        label: {"samples": count, "total": sampler.seconds[label]}
+        for label, count in sampler.samples.items()
+    }
+    return wall, nodes, sampler.callees
+
+
+def format_report(mode: str, wall: float, nodes: dict, callees: dict, top: int = TOP) -> str:
+    out = io.StringIO()
+    out.write(f"Typeflow profile ({mode}) - wall time {wall:.3f}s\n\n")
+    out.write("Hottest nodes\n")
+    ranked = sorted(nodes.items(), key=lambda item: item[1]["total"], reverse=True)
+    if mode == "cprofile":
+        out.write(f"  {'node':<40} {'calls':>7} {'own s':>10} {'total s':>10} {'%':>6}\n")
+        for label, n in ranked[:top]:
+            share = 100 * n["total"] / wall if wall else 0
+            out.write(
+                f"  {label:<40} {n['calls']:>7} {n['own']:>10.4f}"
+                f" {n['total']:>10.4f} {share:>5.1f}%\n"
+            )
+    else:
+        out.write(f"  {'node':<40} {'samples':>8} {'~s':>10} {'%':>6}\n")
+        for label, n in ranked[:top]:
+            share = 100 * n["total"] / wall if wall else 0
+            out.write(f"  {label:<40} {n['samples']:>8} {n['total']:>10.4f} {share:>5.1f}%\n")
+
+    out.write("\nHottest callees per node\n")
+    for label, _ in ranked[:top]:
+        counter = callees.get(label)
+        if not counter:
+            continue
+        out.write(f"  {label}\n")
+        for name, seconds in counter.most_common(5):
+            out.write(f"      {seconds:>10.4f}s  {name}\n")
+    return out.getvalue()
+
+
+def profile_run(mode: str, script: Path, root: Path, adj_list, output_dir: Path = PROFILE_DIR):
+    """Profile one run of ``script`` and write the report; returns its path."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if mode == "cprofile":
+        wall, nodes, callees, stats = profile_cprofile(script, root, adj_list)
+        stats.dump_stats(str(output_dir / "orchestrator.prof"))
+    elif mode == "sample":
+        wall, nodes, callees = profile_sample(script, root, adj_list)
+    else:
+        raise ValueError(f"Unknown profiler '{mode}', choose from {', '.join(PROFILERS)}")
+    report = output_dir / f"report-{mode}.txt"
+    report.write_text(format_report(mode, wall, nodes, callees), encoding="utf-8")
+    return report
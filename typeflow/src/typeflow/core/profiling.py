@@ -0,0 +1,160 @@
+"""
+Per-node instrumentation for live orchestrators.
+
+Live scripts call nodes through ``traced(node, func)``, which emits a
+``node_start`` event and a ``node_success`` event carrying ``metrics``:
+monotonic ``start``/``end`` timestamps (``time.perf_counter``), ``wall`` and
+``cpu`` seconds, the growth of the process' peak RSS in bytes and the size of
+the returned value in bytes. ``build_profile`` turns those events into a
+per-run timeline and a per-node summary.
+"""
+
+import functools
+import inspect
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .events import emit
+
+
+def peak_rss() -> int | None:
+    """Peak resident set size of this process in bytes, if the platform reports it."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def output_size(value) -> int:
+    """Approximate size of a node result in bytes."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            return int(memory_usage(deep=True).sum())
+        except Exception:
+            pass
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 0
+
+
+class NodeTimer:
+    """Measures one node invocation and emits its start and success events."""
+
+    def __init__(self, node: str, local: bool = True):
+        # CPU time and RSS are only meaningful when the node runs in this thread
+        self.node = node
+        self.local = local
+        self.start = time.perf_counter()
+        self.cpu_start = time.thread_time() if local else None
+        self.rss_start = peak_rss() if local else None
+        emit({"event": "node_start", "id": node, "ts": self.start})
+
+    def success(self, value):
+        end = time.perf_counter()
+        rss_delta = None
+        if self.local and self.rss_start is not None:
+            rss_delta = peak_rss() - self.rss_start
+        metrics = {
+            "start": self.start,
+            "end": end,
+            "wall": end - self.start,
+            "cpu": time.thread_time() - self.cpu_start if self.local else None,
+            "peak_rss_delta": rss_delta,
+            "output_size": output_size(value),
+            "thread": threading.current_thread().name,
+        }
+        emit({"event": "node_success", "id": self.node, "metrics": metrics})
+
+
+def traced(node: str, func):
+    """
+    Wrap ``func`` so each call emits timed events for ``node``. The wrapper runs
+    in the calling thread, so thread-pool and ``asyncio.to_thread`` calls are
+    measured where they execute. CPU time of async nodes includes whatever
+    else ran on the event loop while they were suspended.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def run_async(*args, **kwargs):
+            timer = NodeTimer(node)
+            value = await func(*args, **kwargs)
+            timer.success(value)
+            return value
+
+        return run_async
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        timer = NodeTimer(node)
+        value = func(*args, **kwargs)
+        timer.success(value)
+        return value
+
+    return run
+
+
+def traced_future(node: str, future):
+    """
+    Time a node submitted to a process pool from submission to completion.
+    CPU time and RSS are spent in another process and are not reported.
+    """
+    timer = NodeTimer(node, local=False)
+
+    def done(f):
+        if not f.cancelled() and f.exception() is None:
+            timer.success(f.result())
+
+    future.add_done_callback(done)
+    return future
+
+
+def build_profile(events: list[dict]) -> dict:
+    """
+    Aggregate ``node_success`` events into a timeline, with times relative to
+    the first node start, and a per-node summary sorted by total wall time.
+    """
+    records = [
+        {"id": e["id"], **e["metrics"]}
+        for e in events
+        if e.get("event") == "node_success" and "metrics" in e
+    ]
+    if not records:
+        return {"total_wall": 0.0, "timeline": [], "nodes": []}
+
+    origin = min(r["start"] for r in records)
+    timeline = sorted(
+        (
+            {**r, "start": r["start"] - origin, "end": r["end"] - origin}
+            for r in records
+        ),
+        key=lambda r: r["start"],
+    )
+
+    summary = {}
+    for r in records:
+        entry = summary.setdefault(
+            r["id"], {"id": r["id"], "calls": 0, "wall": 0.0, "cpu": 0.0, "output_size": 0}
+        )
+        entry["calls"] += 1
+        entry["wall"] += r["wall"]
+        entry["cpu"] += r["cpu"] or 0.0
+        entry["output_size"] = max(entry["output_size"], r["output_size"])
+
+    return {
+        "total_wall": max(r["end"] for r in timeline),
+        "timeline": timeline,
+        "nodes": sorted(summary.values(), key=lambda e: e["wall"], reverse=True),
+    }
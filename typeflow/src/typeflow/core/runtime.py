@@ -0,0 +1,272 @@
+"""
+In-memory workflow runtime.
+
+Executes compiled adjacency lists directly instead of generating, writing and
+importing an orchestrator script. A plan is compiled once: callables are
+resolved, every value the generated script would hold in a variable gets a
+slot, and each node gets a precomputed table binding its parameters to slots.
+
+    plan = compile_plan(adj_list, rev_adj_list, io_nodes)
+    outputs = plan.run({"X:num@1": 5})
+"""
+
+import asyncio
+import importlib
+import inspect
+from ast import literal_eval
+
+from typeflow.utils import (
+    format_input_val,
+    get_io_node,
+    index_io_nodes,
+    load_compiled_graphs,
+    load_io_data,
+    load_yaml_definitions,
+)
+
+from .script_generator import (
+    call_arguments,
+    find_parent,
+    instance_name_from_cls_key,
+    output_expr,
+    port_to_expr,
+    stream_branches,
+    topo_kahn,
+)
+from .streams import split_stream
+
+# Step kinds
+CALL, METHOD, ALIAS, ATTRIBUTE, OUTPUT, SPLIT = range(6)
+
+
+def import_callable(node):
+    """Resolve the function or class behind a node, like the generated imports do."""
+    node_type, body = node.split(":")[:2]
+    name = body.split("@")[0]
+    if node_type == "F":
+        module = importlib.import_module(f"src.nodes.{name}.main")
+    else:
+        module = importlib.import_module(f"src.classes.{name}")
+    return getattr(module, name)
+
+
+def input_value(data):
+    """Python value of an X node; format_input_val renders strings as literals."""
+    val = format_input_val(data)
+    if data["valueType"].lower().strip() in ("str", "string"):
+        return literal_eval(val)
+    return val
+
+
+class Plan:
+    """A compiled workflow that can be executed any number of times."""
+
+    def __init__(self, slots, constants, inputs, steps, sinks=frozenset()):
+        self.slots = slots
+        self.constants = constants
+        self.inputs = inputs
+        self.steps = steps
+        # Nodes without consumers run for their side effects and are never cached
+        self.sinks = sinks
+
+    def _bind_inputs(self, inputs):
+        values = [None] * len(self.slots)
+        for slot, value in self.constants:
+            values[slot] = value
+        if inputs:
+            for node, value in inputs.items():
+                if node not in self.inputs:
+                    raise KeyError(f"'{node}' is not an input node of this workflow.")
+                values[self.inputs[node]] = value
+        return values
+
+    def _split(self, values, results, node, source, branches, all_nodes):
+        """Replace a stream read by several nodes with one branch per consumer."""
+        stream = split_stream(values[source], len(branches))
+        values[source] = stream
+        for index, slot in enumerate(branches):
+            values[slot] = stream[index]
+        if all_nodes:
+            results[node] = stream
+
+    def run(self, inputs=None, all_nodes=False, cache=None):
+        """
+        Execute the workflow. ``inputs`` overrides X node values by node id.
+        Returns the value of every O node, or of every node with ``all_nodes``.
+        Coroutines returned by async nodes are driven with ``asyncio.run``.
+        A NodeCache passed as ``cache`` memoizes function and method results,
+        except for nodes without consumers.
+        """
+        values = self._bind_inputs(inputs)
+        results = {}
+        for node, kind, func, bindings, target in self.steps:
+            if kind == SPLIT:
+                self._split(values, results, node, func, bindings, all_nodes)
+                continue
+            cached = cache and node not in self.sinks
+            if kind == CALL:
+                kwargs = {name: values[slot] for name, slot in bindings}
+                if cached and not inspect.isclass(func):
+                    value = cache.call(func, **kwargs)
+                else:
+                    value = func(**kwargs)
+            elif kind == METHOD:
+                method = getattr(values[func], bindings[0])
+                kwargs = {name: values[slot] for name, slot in bindings[1]}
+                value = cache.call(method, **kwargs) if cached else method(**kwargs)
+            elif kind == ALIAS:
+                value = values[func]
+            elif kind == ATTRIBUTE:
+                value = getattr(values[func], bindings)
+            else:
+                results[node] = values[func]
+                continue
+            if inspect.isawaitable(value):
+                value = asyncio.run(value)
+            values[target] = value
+            if all_nodes:
+                results[node] = value
+        return results
+
+    async def run_async(self, inputs=None, all_nodes=False, cache=None):
+        """Like ``run`` but awaits async nodes on the running event loop."""
+        values = self._bind_inputs(inputs)
+        results = {}
+        for node, kind, func, bindings, target in self.steps:
+            if kind == SPLIT:
+                self._split(values, results, node, func, bindings, all_nodes)
+                continue
+            cached = cache and node not in self.sinks
+            if kind == CALL:
+                kwargs = {name: values[slot] for name, slot in bindings}
+                if cached and not inspect.isclass(func):
+                    value = cache.call(func, **kwargs)
+                else:
+                    value = func(**kwargs)
+            elif kind == METHOD:
+                method = getattr(values[func], bindings[0])
+                kwargs = {name: values[slot] for name, slot in bindings[1]}
+                value = cache.call(method, **kwargs) if cached else method(**kwargs)
+            elif kind == ALIAS:
+                value = values[func]
+            elif kind == ATTRIBUTE:
+                value = getattr(values[func], bindings)
+            else:
+                results[node] = values[func]
+                continue
+            if inspect.isawaitable(value):
+                value = await value
+            values[target] = value
+            if all_nodes:
+                results[node] = value
+        return results
+
+
+def compile_plan(
+    adj_list, rev_adj_list, io_nodes=None, resolver=import_callable, manifests=None
+):
+    """
+    Compile adjacency lists into a Plan. ``resolver(node)`` returns the
+    function or class of an F/C node; by default it imports it from ``src``.
+    Slots are named like the generated script's variables so the wiring is
+    identical to ``generate_script``, including the branches of streams read
+    by several nodes. ``manifests`` defaults to the project's manifests.
+    """
+    if io_nodes is None:
+        io_nodes = load_io_data()
+    io_nodes = index_io_nodes(io_nodes)
+    if manifests is None:
+        manifests = load_yaml_definitions()
+    # Outputs are returned to the caller, who may iterate them
+    splits, branches = stream_branches(adj_list, manifests)
+    slots = {}
+    callables = {}
+
+    def slot(name):
+        if name not in slots:
+            slots[name] = len(slots)
+        return slots[name]
+
+    def resolve(node):
+        key = node.split(":")[1].split("@")[0]
+        if key not in callables:
+            callables[key] = resolver(node)
+        return callables[key]
+
+    constants, inputs, steps = [], {}, []
+
+    def add_split(node):
+        if node in splits:
+            source = port_to_expr(node, "returns")
+            streams = tuple(slot(f"{source}[{index}]") for index in range(splits[node]))
+            steps.append((node, SPLIT, slot(source), streams, None))
+
+    for node in topo_kahn(adj_list):
+        node_type = node.split(":")[0]
+        parts = node.split(":")
+
+        if node_type == "X":
+            name, vid = parts[1].split("@")
+            target = slot(f"{name}_{vid}")
+            node_data = get_io_node(node, io_nodes)
+            constants.append((target, input_value(node_data) if node_data else None))
+            inputs[node] = target
+            continue
+
+        if node_type == "O":
+            expr, _ = output_expr(node, rev_adj_list, branches)
+            steps.append((node, OUTPUT, slot(expr), None, None))
+            continue
+
+        bindings = tuple(
+            (param, slot(expr))
+            for param, expr in call_arguments(node, rev_adj_list, branches)
+        )
+
+        if node_type == "C" and len(parts) == 2:
+            cls_key = parts[1]
+            target = slot(instance_name_from_cls_key(cls_key))
+            self_edge = next(
+                (
+                    (s, sh)
+                    for s, sh, th in find_parent(node, rev_adj_list)
+                    if th == "self"
+                ),
+                None,
+            )
+            if self_edge:
+                src_slot = slot(port_to_expr(*self_edge))
+                if self_edge[1] == "output":
+                    steps.append((node, ALIAS, src_slot, None, target))
+                else:
+                    attr = cls_key.split("@")[0].lower()
+                    steps.append((node, ATTRIBUTE, src_slot, attr, target))
+            else:
+                steps.append((node, CALL, resolve(node), bindings, target))
+            continue
+
+        if node_type == "C":
+            cls_key = parts[1]
+            method = parts[2].split("@")[0]
+            instance = slot(instance_name_from_cls_key(cls_key))
+            target = slot(port_to_expr(node, "returns"))
+            steps.append((node, METHOD, instance, (method, bindings), target))
+            add_split(node)
+            continue
+
+        if node_type == "F":
+            target = slot(port_to_expr(node, "returns"))
+            steps.append((node, CALL, resolve(node), bindings, target))
+            add_split(node)
+            continue
+
+        raise ValueError(f"Unknown node prefix for {node}")
+
+    sinks = frozenset(node for node, edges in adj_list.items() if not edges)
+    return Plan(slots, constants, inputs, steps, sinks)
+
+
+def load_plan(resolver=import_callable):
+    """Compile the plan of the current project from `.typeflow/compiled`."""
+    adj_list, rev_adj_list = load_compiled_graphs()
+    return compile_plan(adj_list, rev_adj_list, load_io_data(), resolver)
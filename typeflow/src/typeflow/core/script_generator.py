@@ -1,7 +1,15 @@
 from collections import deque
 from pathlib import Path
 
-from typeflow.utils import format_input_val, get_io_node, load_io_data
+from typeflow.utils import (
+    format_input_val,
+    get_io_node,
+    index_io_nodes,
+    load_io_data,
+    load_yaml_definitions,
+)
+
+from .streams import is_stream_type
 
 # -------------------------------
 # Graph utilities
@@ -37,71 +45,62 @@ def topo_kahn(adj_list):
     return order
 
 
+def topo_waves(adj_list):
+    """
+    Group nodes into topological waves using Kahn's algorithm level by level.
+    Every node in a wave depends only on nodes of earlier waves.
+    """
+    indegree = {node: 0 for node in adj_list}
+    for src, edges in adj_list.items():
+        for dest, _, _ in edges:
+            indegree[dest] += 1
+
+    wave = [n for n, d in indegree.items() if d == 0]
+    waves = []
+    seen = 0
+
+    while wave:
+        waves.append(wave)
+        seen += len(wave)
+        next_wave = []
+        for node in wave:
+            for neighbor, _, _ in adj_list.get(node, []):
+                indegree[neighbor] -= 1
+                if indegree[neighbor] == 0:
+                    next_wave.append(neighbor)
+        wave = next_wave
+
+    if seen != len(adj_list):
+        raise ValueError("Cycle detected in DAG")
+
+    return waves
+
+
 # -------------------------------
 # Helpers for code generation
 # -------------------------------
 
 
 send_output_def = """
-import uuid, os, json
-from pathlib import Path
-from PIL import Image
-from io import BytesIO
-import numpy as np
+import json
+from typeflow.core.events import emit
+from typeflow.core.outputs import send_image, send_table, wait_for_outputs
 
-OUTPUT_DIR = Path("data/outputs")
-OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
 def send_output(value, type_, node):
     if type_ == "text":
-        print(json.dumps(
-            {"event": "node_output", "outputType": type_, "id" : node, "val": str(value)}
-            ))
+        emit({"event": "node_output", "outputType": type_, "id": node, "val": str(value)})
     elif type_ == "json":
         try:
             json.dumps(value)
-            print(json.dumps(
-                {"event": "node_output", "outputType": type_, "id": node, "val": value}
-                ))
+            emit({"event": "node_output", "outputType": type_, "id": node, "val": value})
         except Exception:
-            print(json.dumps(
-                {"event": "node_output", "outputType": type_, "id": node, "val": str(value)}
-                ))
+            emit({"event": "node_output", "outputType": type_, "id": node, "val": str(value)})
     elif type_ == "table":
-        if isinstance(value, pd.DataFrame):
-            data = value.to_dict(orient="records")
-        elif isinstance(value, list) and all(isinstance(x, dict) for x in value):
-            data = value
-        else:
-            data = [{"value": v} for v in value]
-        print(json.dumps({"event": "node_output", "outputType": "table", "id": node, "val": data}))
+        # Stored column by column; the event only carries the first page
+        send_table(value, node)
     elif type_ == "image":
-        buf = BytesIO()
-        if isinstance(value, np.ndarray):
-            img = Image.fromarray(value)
-            img.save(buf, format="PNG")
-        elif isinstance(value, Image.Image):
-            value.save(buf, format="PNG")
-        else:
-            print(json.dumps({
-                "event": "node_error",
-                "id": node,
-                "msg": "Unsupported image type"
-            }))
-            return
-
-        img_id = f"{uuid.uuid4().hex}.png"
-        img_path = OUTPUT_DIR / img_id
-        with open(img_path, "wb") as f:
-            f.write(buf.getvalue())
-
-        # Send only relative path or accessible URL
-        print(json.dumps({
-            "event": "node_output",
-            "outputType": "image",
-            "id": node,
-            "val": f"/outputs/{img_id}"
-        }))
-        return
+        # Encoded on a background thread; the event is sent once it is written
+        send_image(value, node)
 """
 
 
@@ -158,152 +157,526 @@ def generate_imports(adj_list):
 # -------------------------------
 
 
-def generate_script(adj_list, rev_adj_list, live=False, ports=None):
+def call_arguments(node, rev_adj_list, branches=None):
+    """
+    Return ``(parameter, expression)`` pairs bound when calling a C/F node.
+    ``branches`` maps ``(source, node, parameter)`` edges of split streams to
+    the index of the branch the edge reads (see ``stream_branches``).
+    """
+    parents = find_parent(node, rev_adj_list)
+    parts = node.split(":")
+    if parts[0] == "C" and len(parts) == 2:
+        parents = [(s, sh, th) for s, sh, th in parents if th != "self"]
+    elif parts[0] == "C":
+        cls_key = parts[1]
+        parents = [
+            (s, sh, th)
+            for s, sh, th in parents
+            if not (th == "self" and s.startswith(f"C:{cls_key}"))
+        ]
+    if not branches:
+        return [(th, port_to_expr(s, sh)) for s, sh, th in parents]
+    arguments = []
+    for s, sh, th in parents:
+        expr = port_to_expr(s, sh)
+        if (s, node, th) in branches:
+            expr = f"{expr}[{branches[s, node, th]}]"
+        arguments.append((th, expr))
+    return arguments
+
+
+def node_statement(node, adj_list, rev_adj_list, ports, branches=None):
+    """
+    Describe the statement that evaluates a node as ``(target, func, args)``.
+
+    ``func`` is the callable expression and ``args`` its keyword-argument string.
+    ``args`` is None when ``func`` is a plain expression assigned to ``target``.
+    ``target`` is None when the returned value is discarded.
+    ``ports`` should be an id → io node index (see ``index_io_nodes``).
+    ``branches`` is passed on to ``call_arguments``.
+    """
+    node_type = node.split(":")[0]
+    parents = find_parent(node, rev_adj_list)
+
+    # ----- Input constants -----
+    if node_type == "X":
+        name_id = node.split(":")[1]
+        name, vid = name_id.split("@")
+        val = None
+        node_data = get_io_node(node, ports)
+        if node_data:
+            val = format_input_val(node_data)
+        return f"{name}_{vid}", f"{val}", None
+
+    # ----- Components -----
+    if node_type == "C":
+        parts = node.split(":")
+        # ---- Base Component ----
+        if len(parts) == 2:
+            cls_key = parts[1]
+            inst_var = instance_name_from_cls_key(cls_key)
+            cls_name = cls_key.split("@")[0]
+
+            # detect if any parent gives `self` input
+            self_edge = next(
+                ((s, sh, th) for s, sh, th in parents if th == "self"), None
+            )
+            if self_edge:
+                src_node, src_handle, _ = self_edge
+                src_expr = port_to_expr(src_node, src_handle)
+                if src_handle == "output":
+                    return inst_var, src_expr, None
+                return inst_var, f"{src_expr}.{cls_name.lower()}", None
+
+            args = [
+                f"{th}={expr}" for th, expr in call_arguments(node, rev_adj_list, branches)
+            ]
+            return inst_var, cls_name, ", ".join(args)
+
+        # ---- Subnode (method) ----
+        cls_key = parts[1]
+        method = parts[2].split("@")[0]
+        inst_var = instance_name_from_cls_key(cls_key)
+        args = [f"{th}={expr}" for th, expr in call_arguments(node, rev_adj_list, branches)]
+        return f"{inst_var}_{method}_out", f"{inst_var}.{method}", ", ".join(args)
+
+    # ----- Functions -----
+    if node_type == "F":
+        func_key = node.split(":")[1]
+        func_name = func_key.split("@")[0]
+        args = [f"{th}={expr}" for th, expr in call_arguments(node, rev_adj_list, branches)]
+        # adj_list holds the out-edges, so consumers are an O(1) lookup
+        consumers_exist = bool(adj_list.get(node))
+        target = f"{func_name}_out" if consumers_exist else None
+        return target, func_name, ", ".join(args)
+
+    raise ValueError(f"Unknown node prefix for {node}")
+
+
+def format_statement(target, func, args):
+    """Render a ``(target, func, args)`` triple as a line of Python."""
+    expr = func if args is None else f"{func}({args})"
+    return f"{target} = {expr}" if target else expr
+
+
+def output_type(node):
+    out_key = node.split(":")[1]  # text_out@3
+    return out_key.split("_")[0]  # "text", "json", "table", "image"
+
+
+def output_expr(node, rev_adj_list, branches=None):
+    """
+    Return ``(expr, out_type)`` for the value an output node displays.
+    ``branches`` is used as in ``call_arguments``.
+    """
+    parents = find_parent(node, rev_adj_list)
+    if len(parents) != 1:
+        raise ValueError(f"Output node {node} must have exactly one parent")
+    src_node, src_handle, tgt_handle = parents[0]
+    expr = port_to_expr(src_node, src_handle)
+    if branches and (src_node, node, tgt_handle) in branches:
+        expr = f"{expr}[{branches[src_node, node, tgt_handle]}]"
+    return expr, output_type(node)
+
+
+def indent(line):
+    """Indent every line of a (possibly multi-line) generated statement."""
+    return "\n".join("    " + ln if ln else ln for ln in line.split("\n"))
+
+
+def annotate(line, *nodes):
+    """Tag a generated line with the nodes it evaluates so profilers can map it back."""
+    return f"{line}  # {', '.join(nodes)}"
+
+
+def event_line(event, node):
+    return f'emit({{"event": "{event}", "id": "{node}"}})'
+
+
+def node_manifest(node, manifests):
+    """Return the manifest entry of a function or method node, if known."""
+    class_yaml, func_yaml = manifests
+    parts = node.split(":")
+    name = parts[1].split("@")[0]
+    if parts[0] == "F":
+        return func_yaml.get(name)
+    if parts[0] == "C" and len(parts) >= 3:
+        method = parts[2].split("@")[0]
+        return class_yaml.get(name, {}).get("methods", {}).get(method)
+    return None
+
+
+def is_async_node(node, manifests):
+    manifest = node_manifest(node, manifests)
+    return bool(manifest and manifest.get("is_async"))
+
+
+def is_process_node(node, manifests):
+    manifest = node_manifest(node, manifests)
+    return bool(manifest and manifest.get("executor") == "process")
+
+
+def process_call(func, args):
+    submit_args = f"_process_pool, {func}, {args}" if args else f"_process_pool, {func}"
+    return f"submit_to_process({submit_args})"
+
+
+# Output types whose display iterates the value (send_table builds a frame)
+ITERATING_OUTPUTS = ("table",)
+
+
+def is_stream_node(node, manifests):
+    manifest = node_manifest(node, manifests)
+    return bool(manifest and is_stream_type(manifest.get("returns")))
+
+
+def stream_branches(adj_list, manifests, outputs=True):
+    """
+    Find streams read by more than one node. Returns ``(splits, branches)``:
+    ``splits`` maps each such producer to its number of consumers, and
+    ``branches`` maps every consuming edge ``(source, node, parameter)`` to
+    its branch index. Output nodes count only when their display iterates
+    the value (``ITERATING_OUTPUTS``), and not at all without ``outputs``
+    (nothing displays them, so their branch would never be read).
+    """
+    splits, branches = {}, {}
+    for node, edges in adj_list.items():
+        consumers = [
+            (tgt, th)
+            for tgt, sh, th in edges
+            if sh == "returns"
+            and (
+                not tgt.startswith("O:")
+                or (outputs and output_type(tgt) in ITERATING_OUTPUTS)
+            )
+        ]
+        if len(consumers) < 2 or not is_stream_node(node, manifests):
+            continue
+        splits[node] = len(consumers)
+        for index, (tgt, th) in enumerate(consumers):
+            branches[node, tgt, th] = index
+    return splits, branches
+
+
+def is_batch_node(node, manifests):
+    manifest = node_manifest(node, manifests)
+    return bool(manifest and manifest.get("batch"))
+
+
+# -------------------------------
+# Batch orchestrator
+# -------------------------------
+
+
+def per_record(call, columns):
+    """List comprehension applying ``call`` (which uses ``_0``, ``_1``, ...) to each record."""
+    if not columns:
+        return f"[{call} for _ in range(_n)]"
+    if len(columns) == 1:
+        return f"[{call} for _0 in {columns[0]}]"
+    names = ", ".join(f"_{i}" for i in range(len(columns)))
+    return f"[{call} for {names} in zip({', '.join(columns)})]"
+
+
+def batch_statement(node, adj_list, rev_adj_list, ports, manifests):
+    """
+    Line of ``run_batch`` evaluating ``node`` over all records. Every variable
+    holds a column with one value per record; batch nodes get the columns
+    directly, any other node is called once per record.
+    """
+    parts = node.split(":")
+    target, func, args = node_statement(node, adj_list, rev_adj_list, ports)
+
+    if parts[0] == "X":
+        return f'{target} = [_record.get("{node}", {func}) for _record in records]'
+
+    if args is None:
+        # Instance taken from another class node's self port or attribute
+        src_node, src_handle, _ = next(
+            p for p in find_parent(node, rev_adj_list) if p[2] == "self"
+        )
+        src_expr = port_to_expr(src_node, src_handle)
+        if src_handle == "output":
+            return f"{target} = {src_expr}"
+        attr = parts[1].split("@")[0].lower()
+        return f"{target} = {per_record(f'_0.{attr}', [src_expr])}"
+
+    params = call_arguments(node, rev_adj_list)
+    if parts[0] == "F" and params and is_batch_node(node, manifests):
+        expr = f"{func}({args})"
+    elif parts[0] == "C" and len(parts) >= 3:
+        # Method of the instance held by the same record
+        instance, method = func.split(".")
+        columns = [instance] + [column for _, column in params]
+        call_args = ", ".join(f"{th}=_{i}" for i, (th, _) in enumerate(params, start=1))
+        expr = per_record(f"_0.{method}({call_args})", columns)
+    else:
+        call_args = ", ".join(f"{th}=_{i}" for i, (th, _) in enumerate(params))
+        expr = per_record(f"{func}({call_args})", [column for _, column in params])
+    return f"{target} = {expr}" if target else expr
+
+
+def generate_batch_script(adj_list, rev_adj_list, ports, manifests):
+    """
+    Orchestrator running the workflow over many records per call.
+
+    ``run_batch(records)`` takes a list of ``{input node id: value}`` dicts
+    (inputs missing from a record keep their editor value) and returns
+    ``{output node id: column}``. Run as a script, it reads one JSON record
+    per line from stdin and prints one JSON line of outputs per record.
+    """
+    if any(is_async_node(node, manifests) for node in adj_list):
+        raise ValueError("Batch orchestrators do not support async nodes.")
+    if stream_branches(adj_list, manifests, outputs=False)[0]:
+        raise ValueError("Batch orchestrators do not support streams read by several nodes.")
+
+    lines = ["# Auto-generated batch workflow script\n"]
+    lines.extend(generate_imports(adj_list))
+    lines.append("import json")
+    lines.append("import sys")
+    lines.append("\n")
+    lines.append("def run_batch(records):")
+    body = ["_n = len(records)"]
+    outputs = []
+    for node in topo_kahn(adj_list):
+        if node.startswith("O:"):
+            outputs.append((node, output_expr(node, rev_adj_list)[0]))
+            continue
+        line = batch_statement(node, adj_list, rev_adj_list, ports, manifests)
+        body.append(annotate(line, node))
+    body.append(
+        "return {" + ", ".join(f'"{node}": {expr}' for node, expr in outputs) + "}"
+    )
+    lines.extend("    " + line for line in body)
+    lines.append(
+        """
+
+if __name__ == "__main__":
+    # One JSON object per line; an interactive run uses the editor values once
+    if sys.stdin.isatty():
+        _records = [{}]
+    else:
+        _records = [json.loads(_line) for _line in sys.stdin if _line.strip()]
+    _outputs = run_batch(_records)
+    for _row in zip(*_outputs.values()):
+        print(json.dumps(dict(zip(_outputs, _row)), default=str))"""
+    )
+    lines.append("\n# End of generated workflow\n")
+    return "\n".join(lines)
+
+
+def generate_script(
+    adj_list,
+    rev_adj_list,
+    live=False,
+    ports=None,
+    parallel=False,
+    max_workers=None,
+    manifests=None,
+    process_workers=None,
+    cache=False,
+    batch=False,
+):
     """
     Generate Python code lines for orchestrator based on adjacency lists.
+
+    With ``parallel`` the nodes are grouped into topological waves and the
+    calls inside each wave are submitted to a thread pool of ``max_workers``.
+    When the manifests mark any node as ``is_async`` an asyncio orchestrator
+    is emitted instead: async nodes of a wave are awaited together with
+    ``asyncio.gather``. Nodes declared with ``executor: process`` are
+    dispatched to a ProcessPoolExecutor of ``process_workers``. With
+    ``cache`` the results of sync function and method nodes with consumers
+    are memoized in ``.typeflow/cache`` so unchanged nodes are not re-executed. With
+    ``batch`` a ``run_batch(records)`` orchestrator is emitted instead (see
+    ``generate_batch_script``). Streams (``Iterator``/``Generator`` returns)
+    read by several nodes are split into one buffered branch per consumer.
     """
+    if batch and (live or parallel or cache):
+        raise ValueError("Batch orchestrators cannot be live, parallel or cached.")
     if not ports:
         ports = load_io_data()
+    ports = index_io_nodes(ports)
+    if manifests is None:
+        manifests = load_yaml_definitions()
+    if batch:
+        return generate_batch_script(adj_list, rev_adj_list, ports, manifests)
     # print("ports: ",ports)
-    topo_order = topo_kahn(adj_list)
+    async_mode = any(is_async_node(node, manifests) for node in adj_list)
+    process_mode = any(is_process_node(node, manifests) for node in adj_list)
+    # Outputs are only displayed, and so read, by live scripts
+    splits, branches = stream_branches(adj_list, manifests, outputs=live)
     import_lines = generate_imports(adj_list)
     lines = ["# Auto-generated workflow script\n"]
     lines.extend(import_lines)
+    if async_mode:
+        lines.append("import asyncio")
+    if parallel:
+        lines.append("from concurrent.futures import ThreadPoolExecutor")
+    if process_mode:
+        lines.append("from concurrent.futures import ProcessPoolExecutor")
+        lines.append("from typeflow.core.process_pool import submit_to_process")
+    if cache:
+        lines.append("from typeflow.core.cache import NodeCache")
+    if splits:
+        lines.append("from typeflow.core.streams import split_stream")
+    if live:
+        lines.append("from typeflow.core.profiling import traced, traced_future")
     lines.append("\n")
     if live:
         lines.append(send_output_def)
     lines.append("\n")
 
-    def get_parents(node):
-        return find_parent(node, rev_adj_list)
-
-    for node in topo_order:
-        node_type = node.split(":")[0]
-
-        # ----- Input constants -----
-        if node_type == "X":
-            name_id = node.split(":")[1]
-            name, vid = name_id.split("@")
-            val = None
-            node_data = get_io_node(node, ports)
-            if node_data:
-                val = format_input_val(node_data)
-            lines.append(f"{name}_{vid} = {val}")
-            continue
-
-        # ----- Components -----
-        if node_type == "C":
-            parts = node.split(":")
-            # ---- Base Component ----
-            if len(parts) == 2:
-                cls_key = parts[1]
-                inst_var = instance_name_from_cls_key(cls_key)
-                cls_name = cls_key.split("@")[0]
-                parents = get_parents(node)
-
-                # detect if any parent gives `self` input
-                self_edge = next(
-                    ((s, sh, th) for s, sh, th in parents if th == "self"), None
-                )
-
-                args = [
-                    f"{th}={port_to_expr(s, sh)}"
-                    for s, sh, th in parents
-                    if th != "self"
-                ]
-                arg_str = ", ".join(args)
-                if live:
-                    lines.append(
-                        f'print(json.dumps({{"event": "node_start", "id": "{node}"}}))'
-                    )
-                if self_edge:
-                    src_node, src_handle, _ = self_edge
-                    src_expr = port_to_expr(src_node, src_handle)
-                    if src_handle == "output":
-                        lines.append(f"{inst_var} = {src_expr}")
-                    else:
-                        lines.append(f"{inst_var} = {src_expr}.{cls_name.lower()}")
-                else:
-                    lines.append(f"{inst_var} = {cls_name}({arg_str})")
-                if live:
-                    lines.append(
-                        f'print(json.dumps({{"event": "node_success", "id": "{node}"}}))'
-                    )
-                continue
-
-            # ---- Subnode (method) ----
-            if len(parts) >= 3:
-                cls_key = parts[1]
-                method = parts[2].split("@")[0]
-                inst_var = instance_name_from_cls_key(cls_key)
-                out_var = f"{inst_var}_{method}_out"
-                parents = get_parents(node)
-
-                args = [
-                    f"{th}={port_to_expr(s, sh)}"
-                    for s, sh, th in parents
-                    if not (th == "self" and s.startswith(f"C:{cls_key}"))
-                ]
-                arg_str = ", ".join(args)
-                if live:
-                    lines.append(
-                        f'print(json.dumps({{"event": "node_start", "id": "{node}"}}))'
-                    )
-                lines.append(f"{out_var} = {inst_var}.{method}({arg_str})")
-                if live:
-                    lines.append(
-                        f'print(json.dumps({{"event": "node_success", "id": "{node}"}}))'
-                    )
-                continue
-
-        # ----- Functions -----
-        if node_type == "F":
-            func_key = node.split(":")[1]
-            func_name = func_key.split("@")[0]
-            parents = get_parents(node)
-            args = [f"{th}={port_to_expr(s, sh)}" for s, sh, th in parents]
-            arg_str = ", ".join(args)
-
-            if live:
-                lines.append(
-                    f'print(json.dumps({{"event": "node_start", "id": "{node}"}}))'
-                )
-            consumers_exist = any(
-                node in [dst for dst, _, _ in edges] for edges in adj_list.values()
-            )
-            if consumers_exist:
-                lines.append(f"{func_name}_out = {func_name}({arg_str})")
+    body = []
+
+    def statement_for(node):
+        target, func, args = node_statement(node, adj_list, rev_adj_list, ports, branches)
+        # Nodes without consumers only run for their side effects, so they always run
+        cached = (
+            cache
+            and args is not None
+            and bool(adj_list.get(node))
+            and (node.startswith("F:") or len(node.split(":")) >= 3)
+            and not is_async_node(node, manifests)
+            and not is_process_node(node, manifests)
+        )
+        if cached:
+            func, args = "_cache.call", f"{func}, {args}" if args else func
+        # Live calls report their timings; process nodes are timed by their future
+        if live and args is not None and not is_process_node(node, manifests):
+            func = f'traced("{node}", {func})'
+        return target, func, args
+
+    def submit_process(node, func, args):
+        call = process_call(func, args)
+        return f'traced_future("{node}", {call})' if live else call
+
+    def emit_output(node):
+        expr, out_type = output_expr(node, rev_adj_list, branches)
+        if live:
+            call = f'traced("{node}", send_output)'
+            body.append(annotate(f"{call}({expr}, '{out_type}', '{node}')", node))
+
+    def emit_split(node):
+        if node in splits:
+            target = port_to_expr(node, "returns")
+            body.append(f"{target} = split_stream({target}, {splits[node]})")
+
+    def emit_sequential(node):
+        if node.startswith("O:"):
+            emit_output(node)
+            return
+        target, func, args = statement_for(node)
+        if is_process_node(node, manifests):
+            call = f"{submit_process(node, func, args)}.result"
+            body.append(annotate(format_statement(target, call, ""), node))
+            emit_split(node)
+            return
+        # Plain expressions (instance aliases) are not calls and carry no timings
+        evented = live and args is None and not node.startswith("X:")
+        if evented:
+            body.append(event_line("node_start", node))
+        body.append(annotate(format_statement(target, func, args), node))
+        if evented:
+            body.append(event_line("node_success", node))
+        emit_split(node)
+
+    def emit_thread_wave(calls):
+        futures = []
+        for node, (target, func, args) in calls:
+            future = f"_future_{len(futures)}"
+            if is_process_node(node, manifests):
+                body.append(annotate(f"{future} = {submit_process(node, func, args)}", node))
             else:
-                lines.append(f"{func_name}({arg_str})")
-            if live:
-                lines.append(
-                    f'print(json.dumps({{"event": "node_success", "id": "{node}"}}))'
-                )
-            continue
+                submit_args = f"{func}, {args}" if args else func
+                body.append(annotate(f"{future} = _executor.submit({submit_args})", node))
+            futures.append((node, target, future))
+        for node, target, future in futures:
+            body.append(format_statement(target, f"{future}.result", ""))
+        for node, _, _ in futures:
+            emit_split(node)
+
+    def emit_async_wave(calls):
+        awaitables = []
+        for node, (target, func, args) in calls:
+            if is_async_node(node, manifests):
+                awaitables.append((node, target, f"{func}({args})"))
+            elif is_process_node(node, manifests):
+                expr = f"asyncio.wrap_future({submit_process(node, func, args)})"
+                awaitables.append((node, target, expr))
+            elif parallel:
+                to_thread_args = f"{func}, {args}" if args else func
+                awaitables.append((node, target, f"asyncio.to_thread({to_thread_args})"))
+            else:
+                emit_sequential(node)
+        if not awaitables:
+            return
+        if len(awaitables) == 1:
+            node, target, expr = awaitables[0]
+            body.append(annotate(format_statement(target, f"await {expr}", None), node))
+        else:
+            targets = ", ".join(target or "_" for _, target, _ in awaitables)
+            gathered = ", ".join(expr for _, _, expr in awaitables)
+            nodes = [node for node, _, _ in awaitables]
+            body.append(annotate(f"{targets} = await asyncio.gather({gathered})", *nodes))
+        for node, _, _ in awaitables:
+            emit_split(node)
+
+    if cache:
+        body.append("_cache = NodeCache()")
+    pool_start = len(body)
+    if not parallel and not async_mode:
+        for node in topo_kahn(adj_list):
+            emit_sequential(node)
+    else:
+        if parallel:
+            executor = f"ThreadPoolExecutor(max_workers={max_workers})"
+            if async_mode:
+                body.append(f"asyncio.get_running_loop().set_default_executor({executor})")
+            else:
+                body.append(f"_executor = {executor}")
+        for index, wave in enumerate(topo_waves(adj_list), start=1):
+            if live or any(not node.startswith("O:") for node in wave):
+                body.append(f"\n# ----- wave {index} -----")
+            calls = []
+            for node in wave:
+                if node.startswith("O:"):
+                    continue
+                statement = statement_for(node)
+                if statement[2] is None:
+                    body.append(annotate(format_statement(*statement), node))
+                else:
+                    calls.append((node, statement))
+
+            if async_mode:
+                emit_async_wave(calls)
+            elif len(calls) == 1:
+                emit_sequential(calls[0][0])
+            elif calls:
+                emit_thread_wave(calls)
+
+            for node in wave:
+                if node.startswith("O:"):
+                    emit_output(node)
+        if parallel and not async_mode:
+            body.append("_executor.shutdown()")
+    if process_mode:
+        # The pool is shut down even when a node raises
+        pool = f"with ProcessPoolExecutor(max_workers={process_workers}) as _process_pool:"
+        body[pool_start:] = [pool] + [indent(line) for line in body[pool_start:]]
 
-        if node_type == "O":
-            parts = node.split(":")
-            out_key = parts[1]  # text_out@3
-            out_type = out_key.split("_")[0]  # "text", "json", "table", "image"
-            parents = get_parents(node)
-            if len(parents) != 1:
-                raise ValueError(f"Output node {node} must have exactly one parent")
-            src_node, src_handle, _ = parents[0]
-            expr = port_to_expr(src_node, src_handle)
-
-            if live:
-                lines.append(
-                    f'print(json.dumps({{"event": "node_start", "id": "{node}"}}))'
-                )
-                lines.append(f"send_output({expr}, '{out_type}', '{node}')")
-                lines.append(
-                    f'print(json.dumps({{"event": "node_success", "id": "{node}"}}))'
-                )
-            continue
     if live:
-        lines.append(
-            "\nprint(json.dumps({'event': 'workflow_complete', 'data': None}))"
-        )
+        body.append("\nwait_for_outputs()")
+        body.append("emit({'event': 'workflow_complete', 'data': None})")
+
+    if async_mode or process_mode:
+        # Process pools re-import the main module, so the run must be guarded
+        lines.append("async def main():" if async_mode else "def main():")
+        lines.extend(indent(line) for line in body)
+        lines.append('\n\nif __name__ == "__main__":')
+        lines.append("    asyncio.run(main())" if async_mode else "    main()")
+    else:
+        lines.extend(body)
     lines.append("\n# End of generated workflow\n")
     return "\n".join(lines)
 
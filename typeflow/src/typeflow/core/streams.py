@@ -0,0 +1,138 @@
+"""
+Streaming edges between nodes.
+
+A node returning ``Iterator[T]`` or ``Generator[...]`` (typically a generator
+function) is passed on lazily: a single consumer receives the iterator itself,
+so a chain of generator nodes processes one item at a time. When several
+nodes consume the same stream, the orchestrator splits it with
+``split_stream`` and gives each consumer its own branch.
+
+Each branch buffers the items it has not read yet. At most about twice
+``buffer_size`` items are kept in memory; beyond that they are pickled, in
+chunks, to a temporary file until the branch catches up. Memory therefore
+stays flat even when one consumer reads the whole stream before the other
+starts, as long as the items can be pickled.
+"""
+
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import deque
+
+STREAM_BUFFER = int(os.environ.get("TYPEFLOW_STREAM_BUFFER", "1024"))
+
+STREAM_TYPE = re.compile(r"^(Iterator|Generator)\b")
+
+
+def is_stream_type(type_str) -> bool:
+    """Whether a manifest type string (``Iterator[int]``) denotes a stream."""
+    return isinstance(type_str, str) and bool(STREAM_TYPE.match(type_str))
+
+
+class Branch:
+    """
+    One consumer's view of a split stream. Unread items sit in ``head`` until
+    it holds ``buffer_size`` of them; later ones collect in ``tail``, which is
+    pickled to the spill file as one chunk whenever it fills up.
+    """
+
+    def __init__(self, stream: "SplitStream", buffer_size: int):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.head = deque()
+        self.tail = []
+        self.spill = None
+        self.chunks = 0
+        self.read_pos = 0
+
+    def put(self, item):
+        # Once items overflow, later ones queue behind them to keep the order
+        if not self.tail and not self.chunks and len(self.head) < self.buffer_size:
+            self.head.append(item)
+            return
+        self.tail.append(item)
+        if len(self.tail) >= self.buffer_size:
+            if self.spill is None:
+                self.spill = tempfile.TemporaryFile()
+            self.spill.seek(0, os.SEEK_END)
+            pickle.dump(self.tail, self.spill, protocol=pickle.HIGHEST_PROTOCOL)
+            self.chunks += 1
+            self.tail = []
+
+    def pending(self) -> bool:
+        return bool(self.head or self.chunks or self.tail)
+
+    def take(self):
+        if not self.head:
+            if self.chunks:
+                self.spill.seek(self.read_pos)
+                self.head = deque(pickle.load(self.spill))
+                self.read_pos = self.spill.tell()
+                self.chunks -= 1
+                if not self.chunks:
+                    self.spill.seek(0)
+                    self.spill.truncate()
+                    self.read_pos = 0
+            else:
+                self.head, self.tail = deque(self.tail), []
+        return self.head.popleft()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.stream.next_for(self)
+
+    def __del__(self):
+        if self.spill is not None:
+            self.spill.close()
+
+
+class SplitStream:
+    """
+    Fan one iterator out to ``n`` branches. Whichever branch runs ahead pulls
+    the next item from the source and appends it to the others' buffers;
+    branches may be consumed from different threads.
+    """
+
+    def __init__(self, iterable, n: int, buffer_size: int = STREAM_BUFFER):
+        self.source = iter(iterable)
+        self.lock = threading.Lock()
+        self.done = False
+        self.error = None
+        self.branches = [Branch(self, buffer_size) for _ in range(n)]
+
+    def __getitem__(self, index) -> Branch:
+        return self.branches[index]
+
+    def __len__(self):
+        return len(self.branches)
+
+    def next_for(self, branch: Branch):
+        with self.lock:
+            if branch.pending():
+                return branch.take()
+            if self.error is not None:
+                raise self.error
+            if self.done:
+                raise StopIteration
+            try:
+                item = next(self.source)
+            except StopIteration:
+                self.done = True
+                raise
+            except Exception as e:
+                # Every branch fails at the same point of the stream
+                self.error = e
+                raise
+            for other in self.branches:
+                if other is not branch:
+                    other.put(item)
+            return item
+
+
+def split_stream(iterable, n: int, buffer_size: int = STREAM_BUFFER) -> SplitStream:
+    """Split ``iterable`` into ``n`` independent iterators, indexed ``0..n-1``."""
+    return SplitStream(iterable, n, buffer_size)
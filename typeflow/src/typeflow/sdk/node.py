@@ -3,13 +3,30 @@ import os
 from functools import wraps
 from typing import get_type_hints
 
-import yaml
-
 from typeflow.utils import get_project_root, simplify_type, validate_type
+from typeflow.utils.manifests import update_index, write_manifest
+
+EXECUTORS = ("thread", "process")
+
+# In production the decorator returns the function itself, so calling a node
+# costs exactly as much as calling the undecorated function
+PRODUCTION = os.environ.get("TYPEFLOW_PRODUCTION", "0") == "1"
 
 
-def node():
-    """Function decorator for visual editor"""
+def node(executor: str = "thread", batch: bool = False):
+    """Function decorator for visual editor
+
+    ``executor="process"`` marks CPU-bound nodes that the generated
+    orchestrator dispatches to a process pool. ``batch=True`` marks
+    elementwise nodes that accept a whole column (list, NumPy array, Series)
+    per argument and return one result per element; batch orchestrators call
+    them once per batch instead of once per record. The manifest is attached
+    to the returned function as ``__typeflow_node__``.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unknown executor '{executor}'. Expected one of: {', '.join(EXECUTORS)}."
+        )
 
     def decorator(func):
         type_hints = get_type_hints(func)
@@ -39,6 +56,9 @@ def node():
                 for param_name in sig.parameters
             },
             "returns": simplify_type(type_hints.get("return")),
+            "is_async": inspect.iscoroutinefunction(func),
+            "executor": executor,
+            "batch": batch,
             "description": (
                 func.__doc__.strip() if func.__doc__ and func.__doc__.strip() else None
             ),
@@ -62,20 +82,32 @@ def node():
 
         yaml_file_path = os.path.join(nodes_dir, f"{func.__name__}.yaml")
         try:
-            with open(yaml_file_path, "w") as yaml_file:
-                yaml.dump(
-                    metadata, yaml_file, default_flow_style=False, sort_keys=False
-                )
+            write_manifest(yaml_file_path, metadata)
             # print(f"Node manifest saved to: {yaml_file_path}")
         except PermissionError:
             raise PermissionError(
                 f"Cannot write to '{yaml_file_path}'. Please check permissions."
             )
+        update_index(project_root, metadata)
+
+        if PRODUCTION:
+            func.__typeflow_node__ = metadata
+            return func
+
+        if metadata["is_async"]:
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await func(*args, **kwargs)
+
+            async_wrapper.__typeflow_node__ = metadata
+            return async_wrapper
 
         @wraps(func)
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
+        wrapper.__typeflow_node__ = metadata
         return wrapper
 
     return decorator
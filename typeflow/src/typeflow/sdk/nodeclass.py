@@ -2,36 +2,97 @@ import inspect
 import os
 from typing import get_type_hints
 
-import yaml
-
+from typeflow.sdk.node import EXECUTORS
 from typeflow.utils import get_project_root, simplify_type, validate_type
+from typeflow.utils.manifests import update_index, write_manifest
+
+
+def compile_init(cls, fields, defaults):
+    """
+    Build an ``__init__`` taking every field as a keyword-only argument, the
+    way dataclasses do, so construction is a plain function call with no loop
+    over the fields.
+    """
+    params = [f"{name}=_default_{name}" if name in defaults else name for name in fields]
+    signature = ", ".join(["self", "*", *params] if params else ["self"])
+    body = "".join(f"    self.{name} = {name}\n" for name in fields) or "    pass\n"
+    namespace = {f"_default_{name}": value for name, value in defaults.items()}
+    exec(f"def __init__({signature}):\n{body}", namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+def with_slots(cls, fields):
+    """
+    Recreate ``cls`` storing ``fields`` in ``__slots__`` instead of a per-instance
+    ``__dict__``. Class attributes holding field defaults are dropped, since
+    they would clash with the slot descriptors.
+    """
+    namespace = {
+        name: value
+        for name, value in cls.__dict__.items()
+        if name not in fields and name not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = tuple(fields)
+    namespace["__qualname__"] = cls.__qualname__
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    # Methods using zero-argument super() close over the original class
+    for value in namespace.values():
+        func = getattr(value, "__func__", value)
+        for cell in getattr(func, "__closure__", None) or ():
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+    return new_cls
+
+
+def node_class(cls=None, *, executor: str = "thread", slots: bool = False):
+    """Function decorator for visual editor
+
+    Usable bare (``@node_class``) or with options:
+    ``@node_class(executor="process")`` dispatches every method node of the
+    class to the orchestrator's process pool.
+    ``@node_class(slots=True)`` returns a new class storing its fields in
+    ``__slots__``, with an ``__init__`` compiled from the field list. Instances
+    are smaller and faster to create, but have no ``__dict__`` and reject
+    unknown keyword arguments.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"Unknown executor '{executor}'. Expected one of: {', '.join(EXECUTORS)}."
+        )
+    if cls is None:
+        return lambda cls: node_class(cls, executor=executor, slots=slots)
 
-
-def node_class(cls):
-    """Function decorator for visual editor"""
     if not inspect.isclass(cls):
         raise TypeError(
             f"@node_class can only decorate classes, not {type(cls).__name__}"
         )
 
-    cls.__is_node_class__ = True
-
     type_hints = get_type_hints(cls)
     defaults = {k: getattr(cls, k) for k in type_hints.keys() if hasattr(cls, k)}
 
     if "__init__" in cls.__dict__:
         delattr(cls, "__init__")
 
-    def __init__(self, **kwargs):
-        for field_name, field_type in type_hints.items():
-            if field_name in kwargs:
-                setattr(self, field_name, kwargs[field_name])
-            elif field_name in defaults:
-                setattr(self, field_name, defaults[field_name])
-            else:
-                raise TypeError(f"Missing required field: {field_name}")
+    if slots:
+        cls = with_slots(cls, list(type_hints))
+        cls.__init__ = compile_init(cls, list(type_hints), defaults)
+    else:
+
+        def __init__(self, **kwargs):
+            for field_name, field_type in type_hints.items():
+                if field_name in kwargs:
+                    setattr(self, field_name, kwargs[field_name])
+                elif field_name in defaults:
+                    setattr(self, field_name, defaults[field_name])
+                else:
+                    raise TypeError(f"Missing required field: {field_name}")
 
-    setattr(cls, "__init__", __init__)
+        setattr(cls, "__init__", __init__)
+
+    cls.__is_node_class__ = True
 
     for field_name, field_type in type_hints.items():
         validate_type(field_type)
@@ -73,6 +134,8 @@ def node_class(cls):
         metadata["methods"][name] = {
             "input": params,
             "returns": ret_type,
+            "is_async": inspect.iscoroutinefunction(method),
+            "executor": executor,
             "description": inspect.getdoc(method) or "",
             "is_static": isinstance(cls.__dict__.get(name), staticmethod),
         }
@@ -88,13 +151,13 @@ def node_class(cls):
         )
     yaml_file_path = os.path.join(class_dir, f"{cls.__name__}.yaml")
     try:
-        with open(yaml_file_path, "w") as f:
-            yaml.dump(metadata, f, sort_keys=False, default_flow_style=False)
+        write_manifest(yaml_file_path, metadata)
 
         # print(f"Manifest for: {cls.__name__} -> {yaml_file_path}")
     except PermissionError:
         raise PermissionError(
             f"Cannot write to '{yaml_file_path}'. Please check permissions."
         )
+    update_index(project_root, metadata)
 
     return cls
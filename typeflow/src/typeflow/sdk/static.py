@@ -0,0 +1,443 @@
+"""
+Static manifest extraction.
+
+Reads ``@node`` functions and ``@node_class`` classes from a module's AST and
+builds the same manifests the decorators write, without executing the module
+or importing its dependencies. Annotations are evaluated against builtins,
+a few standard typing modules (``STATIC_MODULES``) and the project's classes,
+then converted with ``simplify_type`` exactly as at import time.
+
+Anything whose result cannot be known without running the module (an
+annotation naming a third-party type, a type alias, another decorator, an
+inherited docstring...) raises ``Unresolved``. Callers then import the
+module instead, which also reports the real error if the module is invalid.
+Errors raised by module-level code are only found by importing it.
+"""
+
+import ast
+import builtins
+import importlib
+import inspect
+import os
+import sys
+import typing
+from pathlib import Path
+from types import ModuleType
+
+from typeflow.sdk.node import EXECUTORS
+from typeflow.utils import simplify_type, validate_type
+from typeflow.utils.manifests import update_index, write_manifest
+
+# Modules whose types may appear in statically extracted annotations
+STATIC_MODULES = (
+    "typing",
+    "types",
+    "collections",
+    "collections.abc",
+    "datetime",
+    "decimal",
+    "fractions",
+    "pathlib",
+    "uuid",
+)
+
+EMPTY = inspect.Parameter.empty
+NODE = object()
+NODE_CLASS = object()
+# Names bound by code the extractor does not follow
+UNKNOWN = object()
+
+DECORATORS = {
+    ("typeflow", "node"): NODE,
+    ("typeflow.sdk.node", "node"): NODE,
+    ("typeflow", "node_class"): NODE_CLASS,
+    ("typeflow.sdk.nodeclass", "node_class"): NODE_CLASS,
+}
+
+
+class Unresolved(Exception):
+    """The manifest depends on something only an import can tell."""
+
+
+def decorator_name(dec) -> str | None:
+    func = dec.func if isinstance(dec, ast.Call) else dec
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def is_typeflow_decorated(definition) -> bool:
+    return any(decorator_name(d) in ("node", "node_class") for d in definition.decorator_list)
+
+
+def is_coroutine(func) -> bool:
+    if not isinstance(func, ast.AsyncFunctionDef):
+        return False
+    # inspect.iscoroutinefunction is False for async generators
+    if any(isinstance(item, (ast.Yield, ast.YieldFrom)) for item in ast.walk(func)):
+        raise Unresolved(f"async generator '{func.name}'")
+    return True
+
+
+def parameters(arguments: ast.arguments) -> list[ast.arg]:
+    """Parameters in ``inspect.signature`` order."""
+    return [
+        *arguments.posonlyargs,
+        *arguments.args,
+        *([arguments.vararg] if arguments.vararg else []),
+        *arguments.kwonlyargs,
+        *([arguments.kwarg] if arguments.kwarg else []),
+    ]
+
+
+def builtin_namespace() -> dict:
+    namespace = {name: value for name, value in vars(builtins).items() if isinstance(value, type)}
+    namespace["staticmethod"] = staticmethod
+    namespace["classmethod"] = classmethod
+    namespace["property"] = property
+    return namespace
+
+
+def bound_names(statement: ast.stmt) -> set[str]:
+    """Every name a statement may bind, including inside nested blocks."""
+    names = set()
+    for item in ast.walk(statement):
+        if isinstance(item, ast.Name) and isinstance(item.ctx, ast.Store):
+            names.add(item.id)
+        elif isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(item.name)
+        elif isinstance(item, ast.alias):
+            names.add((item.asname or item.name).split(".")[0])
+    return names
+
+
+class Extractor:
+    def __init__(self, root: Path):
+        self.root = root
+        self.placeholders = {}
+        # Set by ``from __future__ import annotations``: every annotation is a string
+        self.postponed = False
+
+    def project_class(self, module: str, name: str):
+        """Stand-in for a class of ``src/classes``; only its name reaches the manifest."""
+        parts = module.split(".")
+        if len(parts) != 3 or parts[:2] != ["src", "classes"]:
+            return UNKNOWN
+        if (module, name) not in self.placeholders:
+            path = self.root / "src" / "classes" / f"{parts[2]}.py"
+            try:
+                tree = ast.parse(path.read_text(), filename=str(path))
+            except (OSError, SyntaxError):
+                return UNKNOWN
+            defined = any(isinstance(s, ast.ClassDef) and s.name == name for s in tree.body)
+            self.placeholders[module, name] = (
+                type(name, (), {"__module__": module}) if defined else UNKNOWN
+            )
+        return self.placeholders[module, name]
+
+    def bind_import(self, statement, namespace: dict):
+        if isinstance(statement, ast.Import):
+            for alias in statement.names:
+                top = alias.name.split(".")[0]
+                if alias.name not in STATIC_MODULES:
+                    namespace[alias.asname or top] = UNKNOWN
+                elif alias.asname:
+                    namespace[alias.asname] = importlib.import_module(alias.name)
+                else:
+                    importlib.import_module(alias.name)
+                    namespace[top] = importlib.import_module(top)
+            return
+        module = statement.module if not statement.level else None
+        if module == "__future__":
+            self.postponed |= any(alias.name == "annotations" for alias in statement.names)
+            return
+        for alias in statement.names:
+            if alias.name == "*":
+                raise Unresolved(f"star import from {statement.module}")
+            name = alias.asname or alias.name
+            if (module, alias.name) in DECORATORS:
+                namespace[name] = DECORATORS[module, alias.name]
+            elif module in STATIC_MODULES:
+                namespace[name] = getattr(importlib.import_module(module), alias.name, UNKNOWN)
+            elif module:
+                namespace[name] = self.project_class(module, alias.name)
+            else:
+                namespace[name] = UNKNOWN
+
+    def evaluate(self, expr, namespace: dict, strings: bool = True):
+        """Evaluate an annotation; string forward references only when ``strings``."""
+        if isinstance(expr, ast.Constant):
+            if expr.value is None or expr.value is Ellipsis:
+                return expr.value
+            if isinstance(expr.value, str) and strings:
+                try:
+                    parsed = ast.parse(expr.value.strip(), mode="eval")
+                except SyntaxError:
+                    raise Unresolved(f"invalid forward reference {expr.value!r}")
+                return self.evaluate(parsed.body, namespace, strings)
+            raise Unresolved(f"constant {expr.value!r} in annotation")
+        if isinstance(expr, ast.Name):
+            value = namespace.get(expr.id, UNKNOWN)
+            if value is UNKNOWN:
+                raise Unresolved(f"name '{expr.id}'")
+            return value
+        if isinstance(expr, ast.Attribute):
+            base = self.evaluate(expr.value, namespace, strings)
+            if not isinstance(base, ModuleType) or not hasattr(base, expr.attr):
+                raise Unresolved(f"attribute '{expr.attr}'")
+            return getattr(base, expr.attr)
+        if isinstance(expr, ast.Subscript):
+            base = self.evaluate(expr.value, namespace, strings)
+            # get_type_hints strips Annotated from function hints but signatures keep it
+            if base is typing.Annotated:
+                raise Unresolved("Annotated hint")
+            if base is typing.Literal:
+                try:
+                    args = ast.literal_eval(expr.slice)
+                except ValueError:
+                    raise Unresolved("non-literal Literal argument")
+            else:
+                args = self.evaluate(expr.slice, namespace, strings)
+            try:
+                return base[args]
+            except Exception:
+                raise Unresolved(f"cannot subscript {base!r}")
+        if isinstance(expr, ast.Tuple):
+            return tuple(self.evaluate(e, namespace, strings) for e in expr.elts)
+        if isinstance(expr, ast.List):
+            return [self.evaluate(e, namespace, strings) for e in expr.elts]
+        if isinstance(expr, ast.BinOp) and isinstance(expr.op, ast.BitOr):
+            left = self.evaluate(expr.left, namespace, strings)
+            right = self.evaluate(expr.right, namespace, strings)
+            try:
+                return left | right
+            except TypeError:
+                raise Unresolved("invalid union")
+        raise Unresolved(f"{type(expr).__name__} in annotation")
+
+    def hint(self, expr, namespace: dict, strings: bool = True):
+        value = self.evaluate(expr, namespace, strings)
+        try:
+            validate_type(value)
+        except ValueError as e:
+            raise Unresolved(str(e))
+        return value
+
+    def decorator_options(self, definition, marker, namespace: dict):
+        """Keyword options of the typeflow decorator, or None if undecorated."""
+        found = [
+            dec
+            for dec in definition.decorator_list
+            if isinstance(dec.func if isinstance(dec, ast.Call) else dec, ast.Name)
+            and namespace.get(decorator_name(dec)) is marker
+        ]
+        if not found:
+            if is_typeflow_decorated(definition):
+                raise Unresolved(f"unrecognized decorator on '{definition.name}'")
+            return None
+        if len(definition.decorator_list) > 1:
+            raise Unresolved(f"other decorator on '{definition.name}'")
+        found = found[0]
+        if not isinstance(found, ast.Call):
+            # A bare @node receives the function as its executor and fails
+            if marker is NODE:
+                raise Unresolved(f"@node without parentheses on '{definition.name}'")
+            return {}
+        try:
+            if marker is NODE:
+                names = ("executor", "batch")
+                if len(found.args) > len(names):
+                    raise Unresolved("too many decorator arguments")
+                options = {n: ast.literal_eval(a) for n, a in zip(names, found.args)}
+            elif found.args:
+                raise Unresolved("positional @node_class arguments")
+            else:
+                options = {}
+            options.update({k.arg: ast.literal_eval(k.value) for k in found.keywords})
+        except ValueError:
+            raise Unresolved(f"non-literal decorator argument on '{definition.name}'")
+        allowed = ("executor", "batch") if marker is NODE else ("executor", "slots")
+        if any(key not in allowed for key in options):
+            raise Unresolved(f"unknown decorator argument on '{definition.name}'")
+        if options.get("executor", "thread") not in EXECUTORS:
+            raise Unresolved(f"unknown executor on '{definition.name}'")
+        return options
+
+    def function_manifest(self, func, options: dict, namespace: dict) -> dict:
+        params = parameters(func.args)
+        if any(p.annotation is None for p in params) or func.returns is None:
+            raise Unresolved(f"missing type hint in '{func.name}'")
+        inputs = {p.arg: simplify_type(self.hint(p.annotation, namespace)) for p in params}
+        returns = simplify_type(self.hint(func.returns, namespace))
+        doc = ast.get_docstring(func, clean=False)
+        # Python 3.13 dedents docstrings at compile time
+        if doc and sys.version_info >= (3, 13):
+            doc = inspect.cleandoc(doc)
+        description = doc.strip() if doc and doc.strip() else None
+        if not description:
+            param_names = ", ".join(inputs)
+            description = (
+                f"Function '{func.name}' takes parameters {param_names or 'none'}."
+                f" It returns a value of type {returns}."
+            )
+        return {
+            "name": func.name,
+            "node_type": "private",
+            "entity": "function",
+            "inputs": inputs,
+            "returns": returns,
+            "is_async": is_coroutine(func),
+            "executor": options.get("executor", "thread"),
+            "batch": options.get("batch", False),
+            "description": description,
+        }
+
+    def method_manifest(self, method, executor: str, namespace: dict, class_name: str) -> dict:
+        is_static = False
+        for dec in method.decorator_list:
+            if isinstance(dec, ast.Name) and namespace.get(dec.id) is staticmethod:
+                is_static = True
+            else:
+                raise Unresolved(f"decorator on method '{method.name}'")
+        params = parameters(method.args)
+        annotated = [p.annotation for p in params if p.annotation] + [method.returns]
+        if self.postponed and any(annotated):
+            raise Unresolved(f"string annotations on method '{method.name}'")
+        # Methods are read with inspect.signature, so annotations must not be strings
+        inputs = {
+            p.arg: simplify_type(
+                self.hint(p.annotation, namespace, strings=False) if p.annotation else EMPTY
+            )
+            for p in params
+            if p.arg != "self"
+        }
+        inputs["self"] = class_name
+        returns = self.hint(method.returns, namespace, strings=False) if method.returns else EMPTY
+        doc = ast.get_docstring(method, clean=False)
+        return {
+            "input": inputs,
+            "returns": simplify_type(returns),
+            "is_async": is_coroutine(method),
+            "executor": executor,
+            "description": inspect.cleandoc(doc) if doc else "",
+            "is_static": is_static,
+        }
+
+    def class_manifest(self, cls, options: dict, namespace: dict) -> dict:
+        # Inherited fields, methods and docstrings need the real class
+        if cls.keywords or any(
+            not (isinstance(b, ast.Name) and namespace.get(b.id) is object) for b in cls.bases
+        ):
+            raise Unresolved(f"base classes of '{cls.name}'")
+        executor = options.get("executor", "thread")
+        fields, methods = {}, {}
+        for index, statement in enumerate(cls.body):
+            if isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+                fields[statement.target.id] = simplify_type(
+                    self.hint(statement.annotation, namespace)
+                )
+            elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                decorators = [
+                    namespace.get(d.id) for d in statement.decorator_list if isinstance(d, ast.Name)
+                ]
+                # Class methods and properties are not listed as method nodes
+                if decorators in ([classmethod], [property]):
+                    methods.pop(statement.name, None)
+                elif statement.name.startswith("__"):
+                    methods.pop(statement.name, None)
+                else:
+                    methods[statement.name] = self.method_manifest(
+                        statement, executor, namespace, cls.name
+                    )
+            elif isinstance(statement, ast.Assign):
+                try:
+                    ast.literal_eval(statement.value)
+                except ValueError:
+                    raise Unresolved(f"computed class attribute in '{cls.name}'")
+                for name in bound_names(statement):
+                    methods.pop(name, None)
+            elif isinstance(statement, ast.Pass):
+                continue
+            elif not (
+                index == 0
+                and isinstance(statement, ast.Expr)
+                and isinstance(statement.value, ast.Constant)
+                and isinstance(statement.value.value, str)
+            ):
+                raise Unresolved(f"{type(statement).__name__} in class '{cls.name}'")
+        fields["self"] = cls.name
+        doc = ast.get_docstring(cls, clean=False)
+        return {
+            "entity": "class",
+            "name": cls.name,
+            "description": inspect.cleandoc(doc) if doc else "",
+            "fields": fields,
+            "methods": dict(sorted(methods.items())),
+        }
+
+    def extract(self, source: str, filename: str = "<unknown>") -> list[dict]:
+        try:
+            tree = ast.parse(source, filename=filename)
+        except SyntaxError as e:
+            raise Unresolved(f"syntax error: {e}")
+        namespace = builtin_namespace()
+        manifests = []
+        for statement in tree.body:
+            if isinstance(statement, (ast.Import, ast.ImportFrom)):
+                self.bind_import(statement, namespace)
+                continue
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                options = self.decorator_options(statement, NODE, namespace)
+                if options is not None:
+                    manifests.append(self.function_manifest(statement, options, namespace))
+                namespace[statement.name] = UNKNOWN
+                continue
+            if isinstance(statement, ast.ClassDef):
+                options = self.decorator_options(statement, NODE_CLASS, namespace)
+                if options is not None:
+                    manifests.append(self.class_manifest(statement, options, namespace))
+                # Only the name of a class reaches a manifest
+                plain = options is not None or not statement.decorator_list
+                namespace[statement.name] = type(statement.name, (), {}) if plain else UNKNOWN
+                continue
+            for name in bound_names(statement):
+                namespace[name] = UNKNOWN
+
+        # Decorated definitions inside other statements are only found by importing
+        decorated = sum(
+            1
+            for item in ast.walk(tree)
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+            and is_typeflow_decorated(item)
+        )
+        if decorated != len(manifests):
+            raise Unresolved("nested decorated definitions")
+        return manifests
+
+
+def extract_manifests(path, root=".") -> list[dict]:
+    """
+    Manifests of the nodes and node classes defined in ``path``, read from
+    its source. Raises ``Unresolved`` when the module must be imported instead.
+    """
+    path = Path(path)
+    return Extractor(Path(root)).extract(path.read_text(), str(path))
+
+
+def write_static_manifests(path, root=".") -> list[str]:
+    """
+    Write the manifests of ``path`` as the decorators would. Returns their
+    paths relative to ``root``; raises ``Unresolved`` like ``extract_manifests``.
+    """
+    root = Path(root)
+    written = []
+    for metadata in extract_manifests(path, root):
+        folder = "classes" if metadata["entity"] == "class" else "nodes"
+        manifest = Path(".typeflow") / folder / f"{metadata['name']}.yaml"
+        os.makedirs(root / manifest.parent, exist_ok=True)
+        write_manifest(root / manifest, metadata)
+        update_index(root, metadata)
+        written.append(str(manifest))
+    return written
@@ -1,8 +1,9 @@
 import json
 from pathlib import Path
 
-from typeflow.server.utils.class_json import load_all_class_manifests
-from typeflow.server.utils.node_json import load_all_node_manifests
+from typeflow.server.utils.class_json import load_all_class_manifests, manifest_to_class_json
+from typeflow.server.utils.node_json import load_all_node_manifests, manifest_to_node_json
+from typeflow.utils.manifests import load_index
 
 WORKFLOW_DIR = Path("workflow")
 
@@ -18,6 +19,14 @@ def load_dag():
 
 
 def load_nodes_classes() -> dict:
+    indexed = load_index()
+    if indexed is not None:
+        class_yaml, func_yaml = indexed
+        return {
+            "nodes": [manifest_to_node_json(m) for m in func_yaml.values()],
+            "classes": [manifest_to_class_json(m) for m in class_yaml.values()],
+        }
+
     NODES_DIR = Path(".typeflow/nodes")
     CLASS_DIR = Path(".typeflow/classes")
     nodes = load_all_node_manifests(NODES_DIR)
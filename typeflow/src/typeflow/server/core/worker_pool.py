@@ -0,0 +1,236 @@
+import atexit
+import importlib
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+import weakref
+from multiprocessing.connection import wait
+from pathlib import Path
+
+from typeflow.core import events
+
+# spawn is safe to use from the threaded server on every platform; its start-up
+# cost is paid while the worker sits idle, not when a run is requested.
+CONTEXT = multiprocessing.get_context("spawn")
+
+# Workers are not daemons, because daemonic processes cannot start the process
+# pool of executor="process" nodes. They are terminated explicitly instead, at
+# the latest when the server exits.
+workers = weakref.WeakSet()
+
+
+@atexit.register
+def terminate_workers():
+    for worker in list(workers):
+        worker.terminate()
+
+
+def source_snapshot(root: Path) -> dict:
+    """Map every project source file to its mtime, used to detect stale workers."""
+    snapshot = {}
+    for folder in ("nodes", "classes"):
+        for path in (root / "src" / folder).rglob("*.py"):
+            try:
+                snapshot[str(path)] = path.stat().st_mtime_ns
+            except OSError:
+                continue
+    return snapshot
+
+
+def preload_project(root: Path):
+    """Import every node and class module so runs find them in sys.modules."""
+    modules = [
+        f"src.nodes.{d.name}.main"
+        for d in sorted((root / "src" / "nodes").glob("*"))
+        if (d / "main.py").exists()
+    ]
+    modules += [
+        f"src.classes.{f.stem}"
+        for f in sorted((root / "src" / "classes").glob("*.py"))
+        if f.name != "__init__.py"
+    ]
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            # Broken modules are reported by the run that actually needs them
+            continue
+
+
+class PipeWriter:
+    """Line-buffered text stream that forwards each line over a connection."""
+
+    def __init__(self, conn, kind):
+        self.conn = conn
+        self.kind = kind
+        self.buffer = ""
+        # Parallel orchestrators print from worker threads
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        with self.lock:
+            self.buffer += text
+            while "\n" in self.buffer:
+                line, self.buffer = self.buffer.split("\n", 1)
+                self.conn.send((self.kind, line))
+        return len(text)
+
+    def flush(self):
+        with self.lock:
+            if self.buffer:
+                self.conn.send((self.kind, self.buffer))
+                self.buffer = ""
+
+    def isatty(self):
+        return False
+
+
+def worker_main(conn, event_conn, root: str):
+    """
+    Entry point of a warm worker: preload the project, then run one script.
+    Printed lines go over ``conn``; events emitted by the script go over
+    ``event_conn`` as binary frames.
+    """
+    os.chdir(root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    preload_project(Path(root))
+
+    try:
+        script = conn.recv()
+    except EOFError:
+        return
+
+    events.set_channel(event_conn)
+    stdout, stderr = PipeWriter(conn, "stdout"), PipeWriter(conn, "stderr")
+    sys.stdout, sys.stderr = stdout, stderr
+    return_code = 0
+    try:
+        exec(compile(script, "orchestrator_live", "exec"), {"__name__": "__main__"})
+    except SystemExit as e:
+        return_code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+        return_code = 1
+    finally:
+        stdout.flush()
+        stderr.flush()
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    events.set_channel(None)
+    event_conn.close()
+    conn.send(("exit", return_code))
+    conn.close()
+
+
+class WarmWorker:
+    """A pre-started process that has already imported the project's nodes."""
+
+    def __init__(self, root: Path):
+        self.conn, child_conn = CONTEXT.Pipe()
+        # One-way pipe reserved for events, so user output is never parsed as one
+        self.events, child_events = CONTEXT.Pipe(duplex=False)
+        self.snapshot = source_snapshot(root)
+        self.process = CONTEXT.Process(
+            target=worker_main, args=(child_conn, child_events, str(root))
+        )
+        self.process.start()
+        workers.add(self)
+        child_conn.close()
+        child_events.close()
+
+    def run(self, script: str, on_message) -> int:
+        """
+        Execute ``script`` in the worker, calling ``on_message(kind, payload)``
+        for every stdout/stderr line (``payload`` is the text) and every emitted
+        event (kind ``"event"``, ``payload`` is the event dict). Blocks until
+        the run ends; returns its exit code.
+        """
+        try:
+            self.conn.send(script)
+            channels = [self.conn, self.events]
+            while True:
+                for ready in wait(channels):
+                    if ready is self.events:
+                        try:
+                            frame = self.events.recv_bytes()
+                        except EOFError:
+                            channels.remove(self.events)
+                            continue
+                        on_message("event", events.decode_event(frame))
+                        continue
+                    kind, payload = self.conn.recv()
+                    if kind == "exit":
+                        # The worker closed its end, so the rest of the events are buffered
+                        self.drain_events(on_message)
+                        return payload
+                    on_message(kind, payload)
+        except (EOFError, OSError):
+            self.process.join()
+            return self.process.exitcode or 1
+        finally:
+            self.close()
+
+    def drain_events(self, on_message):
+        try:
+            while True:
+                on_message("event", events.decode_event(self.events.recv_bytes()))
+        except (EOFError, OSError):
+            pass
+
+    def close(self):
+        self.conn.close()
+        self.events.close()
+        self.process.join(timeout=5)
+        self.terminate()
+
+    def terminate(self):
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=5)
+
+    def discard(self):
+        self.conn.close()
+        self.events.close()
+        self.terminate()
+
+
+class WorkerPool:
+    """
+    Keeps ``size`` warm one-shot workers ready. Each run consumes a worker and
+    a replacement is started right away, so runs never share interpreter state.
+    Workers started before a source file changed are discarded on acquire.
+    """
+
+    def __init__(self, root: Path, size: int = 1):
+        self.root = root
+        self.size = size
+        self.idle: list[WarmWorker] = []
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            while len(self.idle) < self.size:
+                self.idle.append(WarmWorker(self.root))
+
+    def acquire(self) -> WarmWorker:
+        snapshot = source_snapshot(self.root)
+        with self.lock:
+            worker = None
+            while self.idle and worker is None:
+                candidate = self.idle.pop(0)
+                if candidate.snapshot == snapshot and candidate.process.is_alive():
+                    worker = candidate
+                else:
+                    candidate.discard()
+            if worker is None:
+                worker = WarmWorker(self.root)
+        self.start()
+        return worker
+
+    def shutdown(self):
+        with self.lock:
+            for worker in self.idle:
+                worker.discard()
+            self.idle.clear()
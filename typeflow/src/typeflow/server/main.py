@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -12,8 +13,15 @@ OUTPUT_DIR = Path("data/outputs")
 OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    api.worker_pool.start()
+    yield
+    api.worker_pool.shutdown()
+
+
 def create_app():
-    app = FastAPI(title="Typeflow UI Backend")
+    app = FastAPI(title="Typeflow UI Backend", lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["http://localhost:3000"],
@@ -3,16 +3,19 @@ import json
 import os
 import re
 import shutil
-import sys
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
 
-from typeflow.core import generate_script, write_script_to_file
+from typeflow.core import generate_script
+from typeflow.core.outputs import TABLE_PAGE_SIZE, encode_full, read_table
+from typeflow.core.profiling import build_profile
 from typeflow.server.core.loader import load_dag, load_nodes_classes
 from typeflow.server.core.saver import save_workflow
+from typeflow.server.core.worker_pool import WorkerPool
 from typeflow.utils import (  # validate_graph,
     create_adjacency_lists,
     extract_io_nodes,
@@ -29,83 +32,182 @@ router = APIRouter()
 
 sessions: dict[str, asyncio.Queue] = {}
 
+# Pre-started processes with the project's nodes already imported
+worker_pool = WorkerPool(Path.cwd(), size=int(os.environ.get("TYPEFLOW_WARM_WORKERS", "1")))
 
-async def run_script(session_id: str, script_path: Path):
-    proc = await asyncio.create_subprocess_exec(
-        sys.executable,
-        "-m",
-        "src.orchestrator_live",
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-    )
+# Runs beyond MAX_CONCURRENT_RUNS wait in a queue of at most MAX_QUEUED_RUNS
+MAX_CONCURRENT_RUNS = int(os.environ.get("TYPEFLOW_MAX_RUNS", str(os.cpu_count() or 1)))
+MAX_QUEUED_RUNS = int(os.environ.get("TYPEFLOW_MAX_QUEUED_RUNS", "32"))
+run_slots = asyncio.Semaphore(MAX_CONCURRENT_RUNS)
+queued_runs = 0
+
+# Session queues are bounded so a slow client applies backpressure to the run
+EVENT_QUEUE_SIZE = int(os.environ.get("TYPEFLOW_EVENT_QUEUE_SIZE", "1000"))
+# Events arriving within this window after the first are sent in one write
+SSE_FLUSH_INTERVAL = float(os.environ.get("TYPEFLOW_SSE_FLUSH_INTERVAL", "0.05"))
+TERMINAL_EVENTS = {"workflow_complete", "workflow_error"}
+# A run whose queue is full and that has no /stream client after this many
+# seconds drops its session, so it completes instead of waiting forever
+STREAM_CONNECT_TIMEOUT = float(os.environ.get("TYPEFLOW_STREAM_CONNECT_TIMEOUT", "30"))
+# Sessions with a client attached to /stream
+streaming: set[str] = set()
+
+# Opt-in memoization of node results across editor runs
+CACHE_RESULTS = os.environ.get("TYPEFLOW_CACHE", "0") == "1"
+
+# Largest page /tables/{id} serves in one response
+MAX_TABLE_PAGE_SIZE = int(os.environ.get("TYPEFLOW_MAX_TABLE_PAGE_SIZE", "10000"))
+
+# Timed node events of the most recent runs, served by /runs/{id}/profile
+MAX_PROFILED_RUNS = int(os.environ.get("TYPEFLOW_PROFILED_RUNS", "100"))
+run_events: OrderedDict[str, list[dict]] = OrderedDict()
+
+
+def record_event(session_id: str, event: dict):
+    events = run_events.get(session_id)
+    if events is not None and event.get("event") == "node_success" and "metrics" in event:
+        events.append(event)
+
+
+def parse_output_line(kind: str, text: str) -> dict | None:
+    """
+    Turn a line printed by the orchestrator into a log event. Structured
+    events arrive separately over the worker's event channel, so printed
+    text is never interpreted, even when it looks like JSON.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    if kind == "stderr":
+        return {"event": "error_log", "data": text}
+    return {"event": "log", "data": text}
+
+
+async def run_script(session_id: str, script: str):
+    global queued_runs
     queue = sessions[session_id]
 
-    async def read_stdout():
-        if not proc.stdout:
-            return
-        async for line in proc.stdout:
-            # print("logs: ",line)
-            text = line.decode().strip()
-            if not text:
-                continue
-            try:
-                event = json.loads(text)
-                if isinstance(event, dict) and "event" in event:
-                    await queue.put(event)
-                else:
-                    await queue.put({"event": "log", "data": text})
-            except json.JSONDecodeError:
-                await queue.put({"event": "log", "data": text})
-
-    async def read_stderr():
-        if not proc.stderr:
+    if run_slots.locked():
+        await queue.put({"event": "run_queued", "data": {"position": queued_runs}})
+    try:
+        await run_slots.acquire()
+    finally:
+        queued_runs -= 1
+    try:
+        await execute_script(session_id, queue, script)
+    finally:
+        run_slots.release()
+
+
+async def deliver(session_id: str, queue: asyncio.Queue, event: dict):
+    """
+    Wait for room in the session queue; drop events once the client is gone.
+    If no client attaches to /stream within STREAM_CONNECT_TIMEOUT, the
+    session is removed and later events are dropped as well.
+    """
+    waited = 0.0
+    while session_id in sessions:
+        try:
+            await asyncio.wait_for(queue.put(event), timeout=1.0)
             return
-        async for line in proc.stderr:
-            # print("logs: ",line)
-            text = line.decode().strip()
-            if not text:
-                continue
-            await queue.put({"event": "error_log", "data": text})
+        except asyncio.TimeoutError:
+            waited += 1.0
+            if session_id not in streaming and waited >= STREAM_CONNECT_TIMEOUT:
+                sessions.pop(session_id, None)
+                print(f"🧹 Dropped session {session_id}: no client connected")
 
-    # Run both concurrently
-    stdout_task = asyncio.create_task(read_stdout())
-    stderr_task = asyncio.create_task(read_stderr())
 
-    await asyncio.wait([stdout_task, stderr_task])
+async def execute_script(session_id: str, queue: asyncio.Queue, script: str):
+    loop = asyncio.get_running_loop()
 
-    return_code = await proc.wait()
+    def on_message(kind: str, payload):
+        event = payload if kind == "event" else parse_output_line(kind, payload)
+        if event:
+            record_event(session_id, event)
+            # Blocks the pipe reader while the queue is full
+            asyncio.run_coroutine_threadsafe(
+                deliver(session_id, queue, event), loop
+            ).result()
 
-    if return_code != 0:
-        await queue.put({"event": "workflow_error", "data": f"Exit code {return_code}"})
-    else:
-        await queue.put({"event": "workflow_complete", "data": None})
     try:
-        if os.path.exists(script_path):
-            os.remove(script_path)
-            print(f"✅ Deleted script: {script_path}")
-        else:
-            print(f"⚠️ Script not found: {script_path}")
+        worker = await loop.run_in_executor(None, worker_pool.acquire)
+        return_code = await loop.run_in_executor(None, worker.run, script, on_message)
     except Exception as e:
-        print(f"⚠️ Error deleting script: {e}")
+        # The client waits for a terminal event, so failures must produce one
+        print(f"❌ Run {session_id} failed: {e}")
+        await deliver(session_id, queue, {"event": "workflow_error", "data": str(e)})
+        return
+
+    if return_code != 0:
+        event = {"event": "workflow_error", "data": f"Exit code {return_code}"}
+    else:
+        event = {"event": "workflow_complete", "data": None}
+    await deliver(session_id, queue, event)
 
 
 @router.post("/start")
 async def start_script(data: dict, background_tasks: BackgroundTasks):
+    global queued_runs
+    if queued_runs >= MAX_QUEUED_RUNS:
+        raise HTTPException(status_code=503, detail="Too many queued runs, retry later")
     try:
         session_id = str(uuid.uuid4())
-        sessions[session_id] = asyncio.Queue()
+        sessions[session_id] = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+        run_events[session_id] = []
+        while len(run_events) > MAX_PROFILED_RUNS:
+            run_events.popitem(last=False)
         adj_list, rev_adj_list = create_adjacency_lists(data)
         io_nodes = extract_io_nodes(data)
-        script = generate_script(adj_list, rev_adj_list, True, io_nodes)
-        output_path = Path.cwd() / "src" / "orchestrator_live.py"
-        write_script_to_file(script, output_path)
+        script = generate_script(
+            adj_list, rev_adj_list, True, io_nodes, cache=CACHE_RESULTS
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    background_tasks.add_task(run_script, session_id, output_path)
+    # Each session carries its own in-memory script, so concurrent runs never
+    # share or delete each other's files.
+    queued_runs += 1
+    background_tasks.add_task(run_script, session_id, script)
     return {"session_id": session_id, "message": "Script execution started"}
 
 
+@router.get("/runs/{run_id}/profile")
+def get_run_profile(run_id: str):
+    """Per-node timeline and summary of a run, built from its timed events."""
+    events = run_events.get(run_id)
+    if events is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return {"run_id": run_id, "running": run_id in sessions, **build_profile(events)}
+
+
+@router.get("/images/{image_id}")
+def get_image(image_id: str):
+    """Full-resolution image output, encoded on first request."""
+    path = encode_full(image_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return FileResponse(path)
+
+
+@router.get("/tables/{table_id}")
+def get_table(
+    table_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(TABLE_PAGE_SIZE, ge=1, le=MAX_TABLE_PAGE_SIZE),
+    columns: list[str] | None = Query(None),
+    sort: str | None = None,
+    descending: bool = False,
+):
+    """A page of a table output, optionally restricted to some columns and sorted."""
+    try:
+        page = read_table(table_id, offset, limit, columns, sort, descending)
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Unknown column {e}")
+    if page is None:
+        raise HTTPException(status_code=404, detail="Table not found")
+    return page
+
+
 @router.get("/dag")
 def get_dag():
     try:
@@ -162,16 +264,36 @@ async def stream(session_id: str):
             iter([b"data: session not found\n\n"]), media_type="text/event-stream"
         )
 
+    async def next_batch() -> list[dict]:
+        """Wait for one event, then collect whatever follows within the flush window."""
+        loop = asyncio.get_running_loop()
+        batch = [await queue.get()]
+        deadline = loop.time() + SSE_FLUSH_INTERVAL
+        while batch[-1].get("event") not in TERMINAL_EVENTS:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
     async def event_generator():
+        streaming.add(session_id)
         try:
             while True:
-                msg = await queue.get()
-                # print("msg:", msg)
-                yield f"data: {json.dumps(msg)}\n\n"
-                await asyncio.sleep(0.2)
-                if msg.get("event") in {"workflow_complete", "workflow_error"}:
+                batch = await next_batch()
+                yield "".join(f"data: {json.dumps(msg)}\n\n" for msg in batch)
+                if batch[-1].get("event") in TERMINAL_EVENTS:
                     break
         finally:
+            streaming.discard(session_id)
             sessions.pop(session_id, None)
             print(f"🧹 Cleaned up session {session_id}")
 
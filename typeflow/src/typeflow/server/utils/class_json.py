@@ -1,15 +1,17 @@
 from pathlib import Path
 
-import yaml
+from typeflow.utils.manifests import registry
 
 
 def yaml_to_class_json(yaml_path: Path) -> dict:
     """
     Convert a class node YAML manifest into simplified JSON format for UI.
     """
-    with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
+    return manifest_to_class_json(registry.load(yaml_path))
 
+
+def manifest_to_class_json(data: dict) -> dict:
+    """Convert a parsed class manifest into simplified JSON format for UI."""
     name = data.get("name")
     description = data.get("description", "")
     entity_symbol = "C"
@@ -1,15 +1,17 @@
 from pathlib import Path
 
-import yaml
+from typeflow.utils.manifests import registry
 
 
 def yaml_to_node_json(yaml_path: Path) -> dict:
     """
     Convert a single node manifest YAML file into simplified JSON format for UI.
     """
-    with open(yaml_path, "r") as f:
-        data = yaml.safe_load(f)
+    return manifest_to_node_json(registry.load(yaml_path))
 
+
+def manifest_to_node_json(data: dict) -> dict:
+    """Convert a parsed node manifest into simplified JSON format for UI."""
     name = data.get("name")
     description = data.get("description", "")
 
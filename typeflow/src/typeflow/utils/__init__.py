@@ -1,15 +1,19 @@
 from .graph_utils import create_adjacency_lists as create_adjacency_lists
+from .graph_utils import load_yaml_definitions as load_yaml_definitions
+from .graph_utils import validate_edges as validate_edges
 from .graph_utils import validate_graph as validate_graph
 from .io_utils import ensure_structure as ensure_structure
 from .io_utils import extract_io_nodes as extract_io_nodes
 from .io_utils import format_input_val as format_input_val
 from .io_utils import get_io_node as get_io_node
 from .io_utils import get_node_value_type as get_node_value_type
+from .io_utils import index_io_nodes as index_io_nodes
 from .io_utils import load_compiled_graphs as load_compiled_graphs
 from .io_utils import load_const as load_const
 from .io_utils import load_io_data as load_io_data
 from .io_utils import save_compiled as save_compiled
 from .io_utils import save_io_nodes as save_io_nodes
+from .manifests import ManifestRegistry as ManifestRegistry
 from .root import get_project_root as get_project_root
 from .type_utils import simplify_type as simplify_type
 from .type_utils import validate_type as validate_type
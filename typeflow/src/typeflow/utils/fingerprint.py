@@ -0,0 +1,101 @@
+import hashlib
+import json
+from pathlib import Path
+
+FINGERPRINT_FILE = Path(".typeflow/compiled/fingerprint.json")
+MANIFEST_DIRS = (Path(".typeflow/nodes"), Path(".typeflow/classes"))
+
+
+def sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_fingerprint() -> dict:
+    """Load the fingerprint of the previous compile, or an empty one."""
+    if not FINGERPRINT_FILE.exists():
+        return {}
+    try:
+        return json.loads(FINGERPRINT_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_fingerprint(fingerprint: dict):
+    FINGERPRINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    FINGERPRINT_FILE.write_text(json.dumps(fingerprint))
+
+
+def manifest_fingerprints(previous: dict) -> dict:
+    """
+    Map every manifest file to ``[mtime_ns, size, sha]``. Files whose mtime and
+    size match the previous fingerprint are not re-read.
+    """
+    manifests = {}
+    for directory in MANIFEST_DIRS:
+        if not directory.exists():
+            continue
+        for path in directory.glob("*.yaml"):
+            stat = path.stat()
+            key = f"{directory.name}/{path.name}"
+            old = previous.get(key)
+            if old and old[0] == stat.st_mtime_ns and old[1] == stat.st_size:
+                manifests[key] = old
+            else:
+                manifests[key] = [stat.st_mtime_ns, stat.st_size, sha(path.read_bytes())]
+    return manifests
+
+
+def changed_entities(previous: dict, current: dict) -> set:
+    """Names of the nodes/classes whose manifest was added, removed or edited."""
+    changed = set()
+    for key in previous.keys() | current.keys():
+        old, new = previous.get(key), current.get(key)
+        if not old or not new or old[2] != new[2]:
+            changed.add(Path(key).stem)
+    return changed
+
+
+def io_fingerprints(io_nodes: list) -> dict:
+    """Hash the type-relevant data of each X/O node (positions are ignored)."""
+    fingerprints = {}
+    for node in io_nodes:
+        data = node.get("data", {})
+        typed = [node.get("type"), data.get("valueType"), data.get("outputType")]
+        fingerprints[node["id"]] = sha(json.dumps(typed).encode())
+    return fingerprints
+
+
+def edge_key(src, src_port, tgt_node, tgt_port) -> str:
+    return f"{src}|{src_port}|{tgt_node}|{tgt_port}"
+
+
+def entity_name(node_id: str) -> str | None:
+    """Manifest name an F/C node is validated against; None for X/O nodes."""
+    node_type, rest = node_id.split(":", 1)
+    if node_type in ("F", "C"):
+        return rest.split(":")[0].split("@")[0]
+    return None
+
+
+def edges_to_validate(adj_list, previous: dict, io_changed: set, entities: set):
+    """
+    Split the edges of ``adj_list`` into those needing validation and the
+    reusable results of the previous compile.
+    """
+    previous_edges = previous.get("edges", {})
+    pending, reused = [], {}
+    for src, edges in adj_list.items():
+        for tgt_node, src_port, tgt_port in edges:
+            key = edge_key(src, src_port, tgt_node, tgt_port)
+            dirty = (
+                key not in previous_edges
+                or src in io_changed
+                or tgt_node in io_changed
+                or entity_name(src) in entities
+                or entity_name(tgt_node) in entities
+            )
+            if dirty:
+                pending.append((src, src_port, tgt_node, tgt_port))
+            else:
+                reused[key] = previous_edges[key]
+    return pending, reused
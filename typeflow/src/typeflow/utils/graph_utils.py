@@ -1,8 +1,6 @@
-import os
-
-import yaml
-
-from .io_utils import get_node_value_type, load_io_data
+from .fingerprint import edge_key
+from .io_utils import get_node_value_type, index_io_nodes, load_io_data
+from .manifests import load_index, registry
 
 
 # ------------------------------
@@ -49,24 +47,25 @@ class_yaml, func_yaml = {}, {}
 
 
 def load_yaml_definitions():
-    """Load YAML definitions from nodes and classes dirs."""
-    for directory in [NODES_DIR, CLASS_DIR]:
-        if not os.path.exists(directory):
-            continue
+    """Load YAML definitions from nodes and classes dirs.
+    Returns the (class_yaml, func_yaml) lookup tables."""
+    indexed = load_index()
+    if indexed is not None:
+        class_yaml.update(indexed[0])
+        func_yaml.update(indexed[1])
+        return class_yaml, func_yaml
 
-        for fname in os.listdir(directory):
-            if fname.endswith(".yaml"):
-                path = os.path.join(directory, fname)
-                with open(path) as f:
-                    data = yaml.safe_load(f)
-                    if not data:
-                        continue
-                    if data.get("entity") == "class":
-                        class_yaml[data["name"]] = data
-                    elif data.get("entity") == "function":
-                        func_yaml[data["name"]] = data
-                    # else:
-                    #     const_yaml[data["name"]] = data
+    for directory in [NODES_DIR, CLASS_DIR]:
+        for _, data in registry.load_dir(directory):
+            if not data:
+                continue
+            if data.get("entity") == "class":
+                class_yaml[data["name"]] = data
+            elif data.get("entity") == "function":
+                func_yaml[data["name"]] = data
+            # else:
+            #     const_yaml[data["name"]] = data
+    return class_yaml, func_yaml
 
 
 def lookup_port_type(port_str, io_nodes, node_id):
@@ -135,15 +134,19 @@ def validate_edge(src, src_port, tgt_node, tgt_port, io_nodes):
     return True
 
 
+def validate_edges(edges, io_nodes):
+    """Validate (src, src_port, tgt_node, tgt_port) edges; returns {edge_key: valid}."""
+    io_nodes = index_io_nodes(io_nodes)
+    return {edge_key(*edge): validate_edge(*edge, io_nodes) for edge in edges}
+
+
 def validate_graph(adj_list):
     """Validate all edges in the adjacency list."""
     load_yaml_definitions()
     io_nodes = load_io_data()
-    all_valid = True
-
-    for src, edges in adj_list.items():
-        for tgt_node, src_port, tgt_port in edges:
-            if not validate_edge(src, src_port, tgt_node, tgt_port, io_nodes):
-                all_valid = False
-
-    return all_valid
+    edges = [
+        (src, src_port, tgt_node, tgt_port)
+        for src, edges in adj_list.items()
+        for tgt_node, src_port, tgt_port in edges
+    ]
+    return all(validate_edges(edges, io_nodes).values())
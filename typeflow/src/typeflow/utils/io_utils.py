@@ -35,17 +35,28 @@ def ensure_structure():
     return dag_file
 
 
+def write_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` to ``path`` unless the file already holds it."""
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
 def save_compiled(adj_list, rev_adj_list):
     """Save adjacency lists under .typeflow/compiled/."""
     compiled_dir = Path(".typeflow/compiled")
     compiled_dir.mkdir(parents=True, exist_ok=True)
 
-    with open(compiled_dir / "adj_list.json", "w") as f:
-        json.dump(adj_list, f, indent=2)
-    with open(compiled_dir / "rev_adj_list.json", "w") as f:
-        json.dump(rev_adj_list, f, indent=2)
+    changed = write_if_changed(compiled_dir / "adj_list.json", json.dumps(adj_list, indent=2))
+    changed |= write_if_changed(
+        compiled_dir / "rev_adj_list.json", json.dumps(rev_adj_list, indent=2)
+    )
 
-    typer.echo("💾 Saved compiled adjacency lists under .typeflow/compiled/")
+    if changed:
+        typer.echo("💾 Saved compiled adjacency lists under .typeflow/compiled/")
+    else:
+        typer.echo("💾 Compiled adjacency lists already up to date")
 
 
 def load_compiled_graphs():
@@ -162,8 +173,7 @@ def save_io_nodes(io_nodes: list, filename=IO_FILE):
     """
     Saves a list of I/O nodes to a JSON file.
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(io_nodes, f, indent=2, ensure_ascii=False)
+    write_if_changed(Path(filename), json.dumps(io_nodes, indent=2, ensure_ascii=False))
 
     print(f"✅ Extracted {len(io_nodes)} I/O nodes and saved to {filename}")
 
@@ -176,28 +186,44 @@ def load_io_data():
         return json.load(f)
 
 
+def index_io_nodes(nodes) -> dict:
+    """
+    Map node id → io node so lookups are O(1). An existing index is returned
+    as is, so callers can index once and pass the result around.
+    """
+    if isinstance(nodes, dict):
+        return nodes
+    return {node["id"]: node for node in nodes}
+
+
+def find_io_node(node_id: str, nodes):
+    """Return the io node with the given ID from an io node list or index."""
+    if isinstance(nodes, dict):
+        node = nodes.get(node_id)
+    else:
+        node = next((n for n in nodes if n["id"] == node_id), None)
+    if node is None:
+        raise KeyError(f"Node '{node_id}' not found in io.json.")
+    return node
+
+
 def get_io_node(node_id: str, nodes: dict):
     """
     Returns the 'value' of a node with the given ID from io.json.
     """
-    for node in nodes:
-        if node["id"] == node_id:
-            return node["data"]
-    raise KeyError(f"Node '{node_id}' not found in io.json.")
+    return find_io_node(node_id, nodes)["data"]
 
 
 def get_node_value_type(node_id: str, nodes: dict):
     """
     Returns the value type of a node (valueType for X nodes, outputType for O nodes).
     """
-    for node in nodes:
-        if node["id"] == node_id:
-            node_type = node.get("type")
-            data = node.get("data", {})
-            if node_type == "X":
-                return data.get("valueType")
-            elif node_type == "O":
-                return data.get("outputType")
-            else:
-                raise ValueError(f"Node '{node_id}' is not an X or O type node.")
-    raise KeyError(f"Node '{node_id}' not found in io.json.")
+    node = find_io_node(node_id, nodes)
+    node_type = node.get("type")
+    data = node.get("data", {})
+    if node_type == "X":
+        return data.get("valueType")
+    elif node_type == "O":
+        return data.get("outputType")
+    else:
+        raise ValueError(f"Node '{node_id}' is not an X or O type node.")
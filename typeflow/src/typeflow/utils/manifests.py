@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# libyaml's loader and dumper are several times faster when PyYAML was built
+# with it; the dumper emits the same text as the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+NODES_DIR = Path(".typeflow/nodes")
+CLASS_DIR = Path(".typeflow/classes")
+
+# Optional single-file index of every manifest, kept up to date by the decorators
+INDEX_FILE = Path(".typeflow/manifests.json")
+INDEX_ENABLED = os.environ.get("TYPEFLOW_MANIFEST_INDEX", "0") == "1"
+
+
+class ManifestRegistry:
+    """
+    Parsed node/class manifests, shared by the API and the validator.
+
+    Each file is parsed once and re-parsed only when its mtime or size changes,
+    so repeated catalog loads cost one ``stat`` per manifest. Returned manifests
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self):
+        self.entries: dict[Path, tuple[int, int, dict | None]] = {}
+        self.lock = threading.Lock()
+
+    def load(self, path) -> dict | None:
+        """Return the parsed manifest at ``path`` (None for an empty file).
+        ``.json`` files are read as JSON, everything else as YAML."""
+        path = Path(path).absolute()
+        stat = path.stat()
+        entry = self.entries.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        with open(path) as f:
+            data = json.load(f) if path.suffix == ".json" else yaml.load(f, Loader=YAML_LOADER)
+        with self.lock:
+            self.entries[path] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    def load_dir(self, directory) -> list[tuple[Path, dict | None]]:
+        """Return ``(path, manifest)`` for every ``*.yaml`` file in ``directory``."""
+        directory = Path(directory)
+        if not directory.exists():
+            return []
+        return [(path, self.load(path)) for path in sorted(directory.glob("*.yaml"))]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+registry = ManifestRegistry()
+
+
+def write_manifest(path, metadata: dict) -> bool:
+    """
+    Write a YAML manifest unless the file already describes exactly this
+    metadata, so importing an unchanged node does not touch the disk. The
+    existing file is compared after parsing, which is cheaper than serializing.
+    Returns whether the file was written.
+    """
+    path = Path(path)
+    try:
+        if registry.load(path) == metadata:
+            return False
+    except (FileNotFoundError, yaml.YAMLError):
+        pass
+    path.write_text(
+        yaml.dump(metadata, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+    )
+    return True
+
+
+# ------------------------------
+# Consolidated manifest index
+# ------------------------------
+
+
+def current_index(root=".") -> dict | None:
+    """
+    Return the parsed manifest index, or None when there is no index or a
+    manifest directory changed after it was written (a manifest was added or
+    removed without going through the decorators).
+    """
+    root = Path(root)
+    index = root / INDEX_FILE
+    try:
+        index_mtime = index.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    for directory in (root / NODES_DIR, root / CLASS_DIR):
+        if directory.exists() and directory.stat().st_mtime_ns > index_mtime:
+            return None
+    return registry.load(index) or {}
+
+
+def load_index(root=".") -> tuple[dict, dict] | None:
+    """Return the (class_yaml, func_yaml) tables from the index, or None when it is stale."""
+    data = current_index(root)
+    if data is None:
+        return None
+    return data.get("classes", {}), data.get("functions", {})
+
+
+def scan_manifests(root=".") -> dict:
+    """Build the index content from the YAML manifests."""
+    index = {"classes": {}, "functions": {}}
+    for directory in (Path(root) / NODES_DIR, Path(root) / CLASS_DIR):
+        for _, data in registry.load_dir(directory):
+            if not data:
+                continue
+            if data.get("entity") == "class":
+                index["classes"][data["name"]] = data
+            elif data.get("entity") == "function":
+                index["functions"][data["name"]] = data
+    return index
+
+
+@contextmanager
+def index_lock(index: Path):
+    """Serialize index updates from processes importing nodes concurrently."""
+    if fcntl is None:
+        yield
+        return
+    with open(index.with_suffix(".lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def write_index(root, content: dict):
+    """Atomically replace the index so readers never see a partial file."""
+    index = Path(root) / INDEX_FILE
+    tmp = index.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(content, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, index)
+
+
+def build_index(root="."):
+    """(Re)build the index from the YAML manifests."""
+    index = Path(root) / INDEX_FILE
+    index.parent.mkdir(parents=True, exist_ok=True)
+    with index_lock(index):
+        write_index(root, scan_manifests(root))
+
+
+def update_index(root, manifest: dict):
+    """
+    Record one manifest in the index. Does nothing unless the index exists or
+    TYPEFLOW_MANIFEST_INDEX=1. A missing or stale index is rebuilt from the
+    YAML manifests, so it never lists a subset of the nodes nor deleted ones.
+    """
+    index = Path(root) / INDEX_FILE
+    if not INDEX_ENABLED and not index.exists():
+        return
+    section = "classes" if manifest["entity"] == "class" else "functions"
+    # Importing an unchanged node only stats the index instead of parsing it
+    content = current_index(root)
+    if content is not None and content.get(section, {}).get(manifest["name"]) == manifest:
+        return
+    with index_lock(index):
+        content = current_index(root)
+        if content is None:
+            write_index(root, scan_manifests(root))
+            return
+        if content[section].get(manifest["name"]) == manifest:
+            return
+        # The parsed index is shared through the registry; patch a copy
+        content = {**content, section: {**content[section], manifest["name"]: manifest}}
+        write_index(root, content)
@@ -1,10 +1,16 @@
+from functools import lru_cache
 from pathlib import Path
 
 
 def get_project_root() -> str:
     """Find the project root by looking for .typeflow folder in current,
     parent, or parent-parent directory."""
-    current_dir = Path.cwd()
+    return find_project_root(Path.cwd())
+
+
+@lru_cache(maxsize=None)
+def find_project_root(current_dir: Path) -> str:
+    """Cached per working directory: every decorated node asks for the root on import."""
     for directory in [current_dir, current_dir.parent, current_dir.parent.parent]:
         typeflow_dir = directory / ".typeflow"
         if typeflow_dir.exists() and typeflow_dir.is_dir():
@@ -0,0 +1,138 @@
+import asyncio
+import importlib
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+
+DAG = {
+    "nodes": [
+        {"id": "X:num@1", "type": "X", "data": {"value": "3", "valueType": "int"}},
+        {"id": "O:text_out@1", "type": "O", "data": {"outputType": "text"}},
+    ],
+    "connections": [
+        {
+            "source": "X:num@1", "target": "O:text_out@1",
+            "sourceHandle": "val", "targetHandle": "input",
+        },
+    ],
+}
+
+
+def load_api(tmp_path, monkeypatch):
+    # The module creates data/inputs relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("typeflow.server.routes.api")
+
+
+def test_full_queue_without_client_drops_session(tmp_path, monkeypatch):
+    api = load_api(tmp_path, monkeypatch)
+    monkeypatch.setattr(api, "STREAM_CONNECT_TIMEOUT", 1.0)
+
+    async def run():
+        queue = asyncio.Queue(maxsize=1)
+        api.sessions["lonely"] = queue
+        await api.deliver("lonely", queue, {"type": "first"})
+        await asyncio.wait_for(api.deliver("lonely", queue, {"type": "second"}), timeout=5)
+        # Later events are dropped without waiting
+        await asyncio.wait_for(api.deliver("lonely", queue, {"type": "third"}), timeout=0.5)
+        return queue
+
+    queue = asyncio.run(run())
+    assert "lonely" not in api.sessions
+    assert queue.qsize() == 1
+
+
+def test_full_queue_with_client_keeps_waiting(tmp_path, monkeypatch):
+    api = load_api(tmp_path, monkeypatch)
+    monkeypatch.setattr(api, "STREAM_CONNECT_TIMEOUT", 1.0)
+
+    async def run():
+        queue = asyncio.Queue(maxsize=1)
+        api.sessions["slow"] = queue
+        api.streaming.add("slow")
+        try:
+            await api.deliver("slow", queue, {"type": "first"})
+            pending = asyncio.create_task(api.deliver("slow", queue, {"type": "second"}))
+            await asyncio.sleep(1.5)
+            assert not pending.done()
+            assert await queue.get() == {"type": "first"}
+            await asyncio.wait_for(pending, timeout=5)
+            return await queue.get()
+        finally:
+            api.streaming.discard("slow")
+            api.sessions.pop("slow", None)
+
+    assert asyncio.run(run()) == {"type": "second"}
+
+
+@pytest.fixture
+def limited_api(tmp_path, monkeypatch):
+    """The api module reloaded with one run slot and one queue place."""
+    monkeypatch.setenv("TYPEFLOW_MAX_RUNS", "1")
+    monkeypatch.setenv("TYPEFLOW_MAX_QUEUED_RUNS", "1")
+    api = importlib.reload(load_api(tmp_path, monkeypatch))
+    yield api
+    monkeypatch.delenv("TYPEFLOW_MAX_RUNS")
+    monkeypatch.delenv("TYPEFLOW_MAX_QUEUED_RUNS")
+    importlib.reload(api)
+
+
+def test_runs_beyond_the_limit_are_queued_then_rejected(limited_api, monkeypatch):
+    api = limited_api
+
+    async def run():
+        gate = asyncio.Event()
+
+        async def execute_script(session_id, queue, script):
+            await gate.wait()
+            await api.deliver(session_id, queue, {"event": "workflow_complete", "data": None})
+
+        monkeypatch.setattr(api, "execute_script", execute_script)
+        runs = []
+
+        async def start():
+            background = BackgroundTasks()
+            response = await api.start_script(DAG, background)
+            runs.append(asyncio.create_task(background()))
+            # Let the run take a slot or join the queue
+            await asyncio.sleep(0)
+            return response["session_id"]
+
+        first = await start()
+        second = await start()
+        with pytest.raises(HTTPException) as error:
+            await start()
+        assert error.value.status_code == 503
+
+        assert api.sessions[first].empty()
+        assert await api.sessions[second].get() == {
+            "event": "run_queued",
+            "data": {"position": 1},
+        }
+        gate.set()
+        await asyncio.gather(*runs)
+        for session_id in (first, second):
+            assert (await api.sessions[session_id].get())["event"] == "workflow_complete"
+
+    asyncio.run(run())
+    assert api.queued_runs == 0
+
+
+def test_failed_worker_start_ends_the_run(tmp_path, monkeypatch):
+    api = load_api(tmp_path, monkeypatch)
+
+    def acquire():
+        raise RuntimeError("no worker")
+
+    monkeypatch.setattr(api.worker_pool, "acquire", acquire)
+
+    async def run():
+        queue = asyncio.Queue()
+        api.sessions["broken"] = queue
+        try:
+            await api.execute_script("broken", queue, "")
+            return await queue.get()
+        finally:
+            api.sessions.pop("broken", None)
+
+    assert asyncio.run(run()) == {"event": "workflow_error", "data": "no worker"}
@@ -0,0 +1,44 @@
+from typeflow.core.bench import (
+    SHAPES,
+    STAGES,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+    stage_functions,
+)
+from typeflow.utils import graph_utils
+
+
+def test_synthetic_dags_execute():
+    expected = {"chain": 11, "diamond": 22, "class": 6}
+    for shape, value in expected.items():
+        outputs = stage_functions(SHAPES[shape](10))["execute"]()
+        assert outputs == {"O:text_out@1": value}
+
+
+def test_run_benchmarks_reports_every_stage():
+    results = run_benchmarks(shapes=("fanout",), sizes=(10,), repeat=1)
+    assert list(results) == [f"fanout/10/{stage}" for stage in STAGES]
+    assert all(r["seconds"] >= 0 and r["peak_bytes"] >= 0 for r in results.values())
+    # The benchmark manifests are removed from the validator afterwards
+    assert "inc" not in graph_utils.func_yaml
+
+
+def test_compare_flags_regressions(tmp_path):
+    baseline = {
+        "chain/10/topo": {"seconds": 0.010, "peak_bytes": 0},
+        "chain/10/plan": {"seconds": 0.010, "peak_bytes": 0},
+        "chain/10/execute": {"seconds": 0.0001, "peak_bytes": 0},
+    }
+    path = tmp_path / "baseline.json"
+    save_baseline(baseline, path)
+    assert load_baseline(path) == baseline
+
+    results = {
+        "chain/10/topo": {"seconds": 0.011, "peak_bytes": 0},
+        "chain/10/plan": {"seconds": 0.030, "peak_bytes": 0},
+        "chain/10/execute": {"seconds": 0.1, "peak_bytes": 0},
+        "chain/10/generate": {"seconds": 1.0, "peak_bytes": 0},
+    }
+    assert compare(results, baseline, max_ratio=1.5) == {"chain/10/plan": 3.0}
@@ -0,0 +1,91 @@
+import importlib.util
+
+from typeflow.core.cache import NodeCache
+
+calls = []
+
+
+def slow_square(x: int) -> int:
+    calls.append(x)
+    return x * x
+
+
+class Scaler:
+    def __init__(self, factor):
+        self.factor = factor
+
+    def scale(self, x: int) -> int:
+        calls.append(("scale", x))
+        return x * self.factor
+
+
+def test_cache_hits_on_same_inputs(tmp_path):
+    calls.clear()
+    cache = NodeCache(tmp_path / "cache")
+    assert cache.call(slow_square, x=3) == 9
+    assert cache.call(slow_square, x=3) == 9
+    assert cache.call(slow_square, x=4) == 16
+    assert calls == [3, 4]
+
+
+def test_cache_persists_across_instances(tmp_path):
+    calls.clear()
+    NodeCache(tmp_path / "cache").call(slow_square, x=5)
+    assert NodeCache(tmp_path / "cache").call(slow_square, x=5) == 25
+    assert calls == [5]
+
+
+def test_method_key_includes_instance(tmp_path):
+    calls.clear()
+    cache = NodeCache(tmp_path / "cache")
+    assert cache.call(Scaler(2).scale, x=3) == 6
+    assert cache.call(Scaler(3).scale, x=3) == 9
+    assert cache.call(Scaler(2).scale, x=3) == 6
+    assert calls == [("scale", 3), ("scale", 3)]
+
+
+def test_unpicklable_inputs_bypass_cache(tmp_path):
+    cache = NodeCache(tmp_path / "cache")
+    assert cache.call(lambda fn: fn(), fn=lambda: 1) == 1
+    assert not list((tmp_path / "cache").glob("*.pkl"))
+
+
+def test_lru_eviction_bounds_size(tmp_path):
+    cache = NodeCache(tmp_path / "cache", max_bytes=600)
+    for i in range(10):
+        cache.put(f"key{i}", b"x" * 100)
+    assert cache.size <= 600
+    assert cache.get("key9")[0]
+    assert not cache.get("key0")[0]
+
+
+def load_node_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_editing_decorated_node_invalidates_entry(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".typeflow").mkdir()
+    source = tmp_path / "offset.py"
+    template = (
+        "from typeflow import node\n\n\n"
+        "@node()\n"
+        "def offset(x: int) -> int:\n"
+        "    return x + {}\n"
+    )
+    cache = NodeCache(tmp_path / "cache")
+    source.write_text(template.format(1))
+    assert cache.call(load_node_module(source, "offset").offset, x=1) == 2
+    source.write_text(template.format(10))
+    assert cache.call(load_node_module(source, "offset").offset, x=1) == 11
+
+
+def test_entries_for_missing_code_are_misses(tmp_path):
+    cache = NodeCache(tmp_path / "cache")
+    (tmp_path / "cache" / "gone.pkl").write_bytes(b"cbuiltins\nno_such_name\n.")
+    (tmp_path / "cache" / "moved.pkl").write_bytes(b"cno_such_module\nthing\n.")
+    assert cache.get("gone") == (False, None)
+    assert cache.get("moved") == (False, None)
@@ -74,3 +74,39 @@ def test_node_class_invalid_field(tmp_path, monkeypatch):
         class BadNode:
             x: NoNodeClass
 
+
+
+def test_node_class_slots(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".typeflow").mkdir()
+
+    class Base:
+        __slots__ = ()
+
+        def describe(self) -> str:
+            return "point"
+
+    @node_class(slots=True)
+    class Point(Base):
+        x: int
+        y: int = 5
+
+        def norm(self) -> int:
+            return self.x + self.y
+
+        def describe(self) -> str:
+            return "slotted " + super().describe()
+
+    p = Point(x=2)
+    assert not hasattr(p, "__dict__")
+    assert p.norm() == 7
+    assert p.describe() == "slotted point"
+    assert Point.__is_node_class__
+    with pytest.raises(TypeError):
+        Point()
+    with pytest.raises(AttributeError):
+        p.z = 1
+
+    data = yaml.safe_load(open(tmp_path / ".typeflow" / "classes" / "Point.yaml"))
+    assert data["fields"] == {"x": "int", "y": "int", "self": "Point"}
+    assert set(data["methods"]) == {"norm", "describe"}
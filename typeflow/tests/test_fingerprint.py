@@ -0,0 +1,103 @@
+import json
+
+from typeflow.cli.commands.compile_graph import compile
+from typeflow.utils.fingerprint import (
+    changed_entities,
+    edge_key,
+    edges_to_validate,
+    entity_name,
+)
+
+ADJ_LIST = {
+    "X:num@1": [["F:double@1", "val", "x"]],
+    "F:double@1": [["C:Scaler@1:scale@2", "returns", "x"]],
+    "C:Scaler@1": [["C:Scaler@1:scale@2", "self", "self"]],
+    "C:Scaler@1:scale@2": [["O:num_out@1", "returns", "input"]],
+    "O:num_out@1": [],
+}
+
+
+def previous_edges():
+    edges = {}
+    for src, targets in ADJ_LIST.items():
+        for tgt, src_port, tgt_port in targets:
+            edges[edge_key(src, src_port, tgt, tgt_port)] = True
+    return {"edges": edges}
+
+
+def test_entity_name():
+    assert entity_name("F:double@1") == "double"
+    assert entity_name("C:Scaler@1:scale@2") == "Scaler"
+    assert entity_name("X:num@1") is None
+
+
+def test_unchanged_graph_reuses_every_edge():
+    pending, reused = edges_to_validate(ADJ_LIST, previous_edges(), set(), set())
+    assert pending == []
+    assert len(reused) == 4
+
+
+def test_changed_manifest_revalidates_touching_edges():
+    pending, reused = edges_to_validate(ADJ_LIST, previous_edges(), set(), {"double"})
+    assert pending == [
+        ("X:num@1", "val", "F:double@1", "x"),
+        ("F:double@1", "returns", "C:Scaler@1:scale@2", "x"),
+    ]
+    assert len(reused) == 2
+
+
+def test_changed_io_node_and_new_edge_are_revalidated():
+    previous = previous_edges()
+    del previous["edges"][edge_key("C:Scaler@1", "self", "C:Scaler@1:scale@2", "self")]
+    pending, _ = edges_to_validate(ADJ_LIST, previous, {"O:num_out@1"}, set())
+    assert pending == [
+        ("C:Scaler@1", "self", "C:Scaler@1:scale@2", "self"),
+        ("C:Scaler@1:scale@2", "returns", "O:num_out@1", "input"),
+    ]
+
+
+def test_changed_entities():
+    previous = {"nodes/a.yaml": [1, 2, "x"], "nodes/b.yaml": [1, 2, "y"]}
+    current = {"nodes/a.yaml": [5, 2, "x"], "classes/C.yaml": [1, 2, "z"]}
+    assert changed_entities(previous, current) == {"b", "C"}
+
+
+def test_reused_invalid_edges_are_listed(tmp_path, monkeypatch, capsys):
+    (tmp_path / ".typeflow" / "nodes").mkdir(parents=True)
+    (tmp_path / ".typeflow" / "nodes" / "double.yaml").write_text(
+        "name: double\nentity: function\ninputs:\n  x: int\nreturns: int\n"
+    )
+    (tmp_path / "workflow").mkdir()
+    dag = {
+        "nodes": [
+            {"id": "X:num@1", "type": "X", "data": {"value": "2", "valueType": "str"}},
+            {"id": "F:double@1", "type": "F", "data": {}},
+        ],
+        "connections": [
+            {
+                "source": "X:num@1", "target": "F:double@1",
+                "sourceHandle": "val", "targetHandle": "x",
+            },
+        ],
+    }
+    dag_file = tmp_path / "workflow" / "dag.json"
+    dag_file.write_text(json.dumps(dag))
+    monkeypatch.chdir(tmp_path)
+    invalid = "Invalid edge (unchanged since last compile): X:num@1:val → F:double@1:x"
+
+    compile(full=False)
+    out = capsys.readouterr().out
+    assert "Type mismatch: X:num@1:val (str) → F:double@1:x (int)" in out
+    assert invalid not in out
+
+    # Nothing changed: compile returns early
+    compile(full=False)
+    out = capsys.readouterr().out
+    assert "unchanged since last compile" in out and invalid in out
+
+    # The DAG changed but the edge is reused
+    dag["nodes"].append({"id": "F:double@2", "type": "F", "data": {}})
+    dag_file.write_text(json.dumps(dag))
+    compile(full=False)
+    out = capsys.readouterr().out
+    assert "(1 unchanged edges reused)" in out and invalid in out
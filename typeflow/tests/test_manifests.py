@@ -0,0 +1,98 @@
+import os
+
+import yaml
+
+from typeflow.utils import manifests
+from typeflow.utils.manifests import ManifestRegistry
+
+
+def write_manifest(path, returns):
+    path.write_text(yaml.dump({"name": "double", "entity": "function", "returns": returns}))
+
+
+def test_registry_parses_each_file_once(tmp_path, monkeypatch):
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(
+        manifests.yaml, "load", lambda f, Loader: parses.append(f.name) or real_load(f, Loader)
+    )
+    write_manifest(tmp_path / "double.yaml", "int")
+    registry = ManifestRegistry()
+
+    first = registry.load_dir(tmp_path)
+    second = registry.load_dir(tmp_path)
+    assert first == second
+    assert first[0][1]["returns"] == "int"
+    assert len(parses) == 1
+
+
+def test_registry_reparses_modified_files(tmp_path):
+    path = tmp_path / "double.yaml"
+    write_manifest(path, "int")
+    registry = ManifestRegistry()
+    assert registry.load(path)["returns"] == "int"
+
+    write_manifest(path, "float")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert registry.load(path)["returns"] == "float"
+
+
+def test_registry_skips_missing_directory(tmp_path):
+    assert ManifestRegistry().load_dir(tmp_path / "missing") == []
+
+
+def test_decorators_update_index(tmp_path, monkeypatch):
+    from typeflow import node
+    from typeflow.utils.manifests import INDEX_FILE, load_index
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(manifests, "INDEX_ENABLED", True)
+    nodes_dir = tmp_path / ".typeflow" / "nodes"
+    nodes_dir.mkdir(parents=True)
+    write_manifest(nodes_dir / "double.yaml", "int")
+
+    @node()
+    def triple(x: int) -> int:
+        return 3 * x
+
+    index = yaml.safe_load((tmp_path / INDEX_FILE).read_text())
+    # A new index also picks up manifests written before it existed
+    assert sorted(index["functions"]) == ["double", "triple"]
+
+    class_yaml, func_yaml = load_index(tmp_path)
+    assert class_yaml == {}
+    assert func_yaml["triple"]["inputs"] == {"x": "int"}
+
+    # Removing a manifest behind the decorators' back invalidates the index
+    (nodes_dir / "double.yaml").unlink()
+    index_mtime = (tmp_path / INDEX_FILE).stat().st_mtime_ns
+    os.utime(nodes_dir, ns=(index_mtime + 1_000_000, index_mtime + 1_000_000))
+    assert load_index(tmp_path) is None
+
+    # The next decorated import rebuilds the stale index instead of patching it
+    @node()
+    def quadruple(x: int) -> int:
+        return 4 * x
+
+    _, func_yaml = load_index(tmp_path)
+    assert sorted(func_yaml) == ["quadruple", "triple"]
+
+    # Re-importing an unchanged node leaves the index untouched
+    index_mtime = (tmp_path / INDEX_FILE).stat().st_mtime_ns
+    node()(triple.__wrapped__)
+    assert (tmp_path / INDEX_FILE).stat().st_mtime_ns == index_mtime
+
+
+def test_index_is_not_written_unless_enabled(tmp_path, monkeypatch):
+    from typeflow import node
+    from typeflow.utils.manifests import INDEX_FILE
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".typeflow" / "nodes").mkdir(parents=True)
+
+    @node()
+    def triple(x: int) -> int:
+        return 3 * x
+
+    assert not (tmp_path / INDEX_FILE).exists()
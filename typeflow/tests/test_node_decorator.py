@@ -1,3 +1,4 @@
+import inspect
 import yaml
 import os
 import tempfile
@@ -30,3 +31,51 @@ def test_node_decorator_creates_yaml(tmp_path):
     assert "Add two integers" in data["description"]
 
     os.chdir(cwd)
+
+
+def test_node_decorator_records_async(tmp_path):
+    typeflow_dir = tmp_path / ".typeflow" / "nodes"
+    typeflow_dir.mkdir(parents=True)
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+
+    @node()
+    async def fetch(url: str) -> str:
+        return url
+
+    data = yaml.safe_load(open(typeflow_dir / "fetch.yaml"))
+    assert data["is_async"] is True
+    assert inspect.iscoroutinefunction(fetch)
+
+    os.chdir(cwd)
+
+
+def test_node_decorator_skips_unchanged_manifest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    yaml_file = tmp_path / ".typeflow" / "nodes" / "scale.yaml"
+    yaml_file.parent.mkdir(parents=True)
+
+    def define():
+        @node()
+        def scale(x: int) -> int:
+            return 2 * x
+
+    define()
+    os.utime(yaml_file, ns=(0, 0))
+    define()
+    assert yaml_file.stat().st_mtime_ns == 0
+
+
+def test_node_decorator_returns_function_in_production(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".typeflow").mkdir()
+    monkeypatch.setattr("typeflow.sdk.node.PRODUCTION", True)
+
+    def double(x: int) -> int:
+        return 2 * x
+
+    decorated = node(executor="process")(double)
+    assert decorated is double
+    assert decorated.__typeflow_node__["executor"] == "process"
+    assert (tmp_path / ".typeflow" / "nodes" / "double.yaml").exists()
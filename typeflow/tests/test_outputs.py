@@ -0,0 +1,97 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+from typeflow.core import outputs
+
+
+def output_events(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_large_images_get_a_preview_and_lazy_full_resolution(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(outputs, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(outputs, "IMAGE_FORMAT", "webp")
+    monkeypatch.setattr(outputs, "THUMBNAIL_SIZE", 64)
+    pixels = np.zeros((200, 300, 3), dtype=np.uint8)
+
+    outputs.send_image(pixels, "O:image_out@1")
+    pixels[:] = 255  # changes after the call are not seen by the encoder
+    outputs.wait_for_outputs()
+
+    [event] = output_events(capsys)
+    assert event["id"] == "O:image_out@1"
+    assert (event["width"], event["height"]) == (300, 200)
+    preview = Image.open(tmp_path / event["val"].rsplit("/", 1)[1])
+    assert preview.format == "WEBP" and preview.size == (64, 43)
+    assert preview.getpixel((0, 0)) == (0, 0, 0)
+
+    image_id = event["full"].rsplit("/", 1)[1]
+    full = outputs.encode_full(image_id, tmp_path)
+    assert Image.open(full).size == (300, 200)
+    assert not (tmp_path / f"{image_id}.npy").exists()
+    assert outputs.encode_full(image_id, tmp_path) == full
+    assert outputs.encode_full("../secret", tmp_path) is None
+
+
+def test_small_images_are_encoded_once(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(outputs, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(outputs, "IMAGE_FORMAT", "jpeg")
+    outputs.send_image(Image.new("RGBA", (10, 10)), "O:image_out@1")
+    outputs.send_image("not an image", "O:image_out@2")
+    outputs.wait_for_outputs()
+
+    events = {e["id"]: e for e in output_events(capsys)}
+    assert events["O:image_out@2"]["event"] == "node_error"
+    event = events["O:image_out@1"]
+    assert event["val"] == event["full"] and event["val"].endswith(".jpg")
+    assert Image.open(tmp_path / event["val"].rsplit("/", 1)[1]).format == "JPEG"
+
+
+def test_tables_are_stored_and_paginated(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(outputs, "TABLE_PAGE_SIZE", 2)
+    frame = pd.DataFrame(
+        {
+            "n": [3, 1, 2, None],
+            "name": ["c", "a", "b", "d"],
+            "when": pd.date_range("2024-01-01", periods=4),
+        }
+    )
+    outputs.send_table(frame, "O:table_out@1", tmp_path)
+
+    [event] = output_events(capsys)
+    table = event["table"]
+    assert event["val"] == [
+        {"n": 3.0, "name": "c", "when": "2024-01-01T00:00:00.000"},
+        {"n": 1.0, "name": "a", "when": "2024-01-02T00:00:00.000"},
+    ]
+    assert table["rows"] == 4
+    assert [c["name"] for c in table["columns"]] == ["n", "name", "when"]
+
+    page = outputs.read_table(table["id"], offset=2, limit=10, output_dir=tmp_path)
+    assert [row["name"] for row in page["data"]] == ["b", "d"]
+    assert page["data"][1]["n"] is None
+
+    page = outputs.read_table(
+        table["id"], limit=2, columns=["name"], sort="n", output_dir=tmp_path
+    )
+    assert page["data"] == [{"name": "a"}, {"name": "b"}]
+    page = outputs.read_table(
+        table["id"], limit=2, sort="name", descending=True, output_dir=tmp_path
+    )
+    assert [row["name"] for row in page["data"]] == ["d", "c"]
+
+    with pytest.raises(KeyError):
+        outputs.read_table(table["id"], columns=["missing"], output_dir=tmp_path)
+    assert outputs.read_table("0" * 32, output_dir=tmp_path) is None
+
+
+def test_table_outputs_accept_records_and_lists(tmp_path, capsys):
+    outputs.send_table([{"a": 1}, {"a": 2}], "O:table_out@1", tmp_path)
+    outputs.send_table([5, 6], "O:table_out@2", tmp_path)
+    first, second = output_events(capsys)
+    assert first["val"] == [{"a": 1}, {"a": 2}]
+    assert second["val"] == [{"value": 5}, {"value": 6}]
@@ -0,0 +1,29 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from typeflow.core.process_pool import SharedArray, share_arrays, submit_to_process
+
+
+def total(arr, offset):
+    return float(arr.sum()) + offset
+
+
+def test_large_arrays_are_shared():
+    big = np.ones((1024, 1024), dtype=np.float32)
+    shared, blocks = share_arrays({"arr": big, "offset": 1})
+    try:
+        assert isinstance(shared["arr"], SharedArray)
+        assert shared["offset"] == 1
+        assert np.array_equal(shared["arr"].load(), big)
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def test_submit_to_process_round_trip():
+    big = np.ones((1024, 1024), dtype=np.float32)
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        future = submit_to_process(pool, total, arr=big, offset=2)
+        assert future.result() == big.size + 2
@@ -0,0 +1,78 @@
+import sys
+
+from typeflow.core.profiler import node_functions, node_lines, profile_run
+from typeflow.core.script_generator import generate_script
+from typeflow.utils import create_adjacency_lists, extract_io_nodes
+
+DAG = {
+    "nodes": [
+        {"id": "X:num@1", "type": "X", "data": {"value": "200000", "valueType": "int"}},
+        {"id": "F:busy@1", "type": "F", "data": {}},
+        {"id": "F:busy@2", "type": "F", "data": {}},
+        {"id": "F:tiny@3", "type": "F", "data": {}},
+    ],
+    "connections": [
+        {"source": "X:num@1", "target": "F:busy@1", "sourceHandle": "val", "targetHandle": "n"},
+        {
+            "source": "F:busy@1", "target": "F:busy@2",
+            "sourceHandle": "returns", "targetHandle": "n",
+        },
+        {
+            "source": "F:busy@2", "target": "F:tiny@3",
+            "sourceHandle": "returns", "targetHandle": "n",
+        },
+    ],
+}
+
+SOURCES = {
+    "busy": "def busy(n: int) -> int:\n    return sum(i * i for i in range(n)) % 100000 + n\n",
+    "tiny": "def tiny(n: int) -> int:\n    return n + 1\n",
+}
+
+
+def write_project(tmp_path, monkeypatch):
+    for name, source in SOURCES.items():
+        node_dir = tmp_path / "src" / "nodes" / name
+        node_dir.mkdir(parents=True)
+        (node_dir / "__init__.py").touch()
+        (node_dir / "main.py").write_text(source)
+    (tmp_path / "src" / "__init__.py").touch()
+    (tmp_path / "src" / "nodes" / "__init__.py").touch()
+
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    script = generate_script(
+        adj_list, rev_adj_list, ports=extract_io_nodes(DAG), manifests=({}, {})
+    )
+    (tmp_path / "src" / "orchestrator.py").write_text(script)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in [m for m in sys.modules if m == "src" or m.startswith("src.")]:
+        monkeypatch.delitem(sys.modules, name)
+    return adj_list, script
+
+
+def test_node_lines_and_functions(tmp_path, monkeypatch):
+    adj_list, script = write_project(tmp_path, monkeypatch)
+    assert set(node_lines(script).values()) == {"X:num@1", "F:busy@1", "F:busy@2", "F:tiny@3"}
+    functions = node_functions(adj_list, tmp_path)
+    assert functions[(str((tmp_path / "src/nodes/busy/main.py").resolve()), "busy")] == (
+        "F:busy@1, F:busy@2"
+    )
+
+
+def test_cprofile_report_names_hot_nodes(tmp_path, monkeypatch):
+    adj_list, _ = write_project(tmp_path, monkeypatch)
+    report = profile_run("cprofile", tmp_path / "src" / "orchestrator.py", tmp_path, adj_list)
+    text = report.read_text()
+    hottest = text.split("Hottest nodes\n")[1].splitlines()[1]
+    assert hottest.strip().startswith("F:busy@1, F:busy@2")
+    assert "<built-in method builtins.sum>" in text
+    assert (report.parent / "orchestrator.prof").exists()
+
+
+def test_sample_report_splits_nodes(tmp_path, monkeypatch):
+    adj_list, _ = write_project(tmp_path, monkeypatch)
+    report = profile_run("sample", tmp_path / "src" / "orchestrator.py", tmp_path, adj_list)
+    text = report.read_text()
+    assert "F:busy@1 " in text and "F:busy@2 " in text
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from typeflow.core.profiling import build_profile, output_size, traced, traced_future
+
+
+def double(x: int) -> int:
+    return 2 * x
+
+
+async def double_async(x: int) -> int:
+    return 2 * x
+
+
+def printed_events(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_traced_emits_timed_events(capsys):
+    assert traced("F:double@1", double)(x=3) == 6
+    start, success = printed_events(capsys)
+    assert start == {"event": "node_start", "id": "F:double@1", "ts": start["ts"]}
+    assert success["event"] == "node_success"
+    metrics = success["metrics"]
+    assert metrics["start"] == start["ts"] <= metrics["end"]
+    assert metrics["wall"] >= 0 and metrics["cpu"] >= 0
+    assert metrics["output_size"] > 0
+
+
+def test_traced_async_node(capsys):
+    assert asyncio.run(traced("F:double_async@1", double_async)(x=2)) == 4
+    assert [e["event"] for e in printed_events(capsys)] == ["node_start", "node_success"]
+
+
+def test_traced_future_reports_wall_time_only(capsys):
+    with ThreadPoolExecutor() as pool:
+        assert traced_future("F:double@1", pool.submit(double, 5)).result() == 10
+    success = printed_events(capsys)[-1]
+    assert success["metrics"]["cpu"] is None
+    assert success["metrics"]["peak_rss_delta"] is None
+
+
+def test_output_size_uses_buffer_size():
+    assert output_size(np.zeros(1000, dtype=np.uint8)) == 1000
+
+
+def test_build_profile_aggregates_nodes():
+    def success(node, start, end):
+        metrics = {"start": start, "end": end, "wall": end - start, "cpu": 0.1, "output_size": 8}
+        return {"event": "node_success", "id": node, "metrics": metrics}
+
+    profile = build_profile(
+        [
+            {"event": "node_start", "id": "F:a@1"},
+            success("F:a@1", 10.0, 11.0),
+            success("F:b@2", 11.0, 14.0),
+            success("F:a@1", 14.0, 14.5),
+        ]
+    )
+    assert profile["total_wall"] == 4.5
+    assert [(r["id"], r["start"]) for r in profile["timeline"]] == [
+        ("F:a@1", 0.0),
+        ("F:b@2", 1.0),
+        ("F:a@1", 4.0),
+    ]
+    assert [(n["id"], n["calls"], n["wall"]) for n in profile["nodes"]] == [
+        ("F:b@2", 1, 3.0),
+        ("F:a@1", 2, 1.5),
+    ]
@@ -0,0 +1,119 @@
+import asyncio
+
+from tests.test_script_generator import STREAM_DAG, STREAM_SOURCES, run_script
+from typeflow.core.cache import NodeCache
+from typeflow.core.runtime import compile_plan
+from typeflow.core.script_generator import generate_script
+from typeflow.utils import create_adjacency_lists, extract_io_nodes
+
+DAG = {
+    "nodes": [
+        {"id": "X:num@1", "type": "X", "data": {"value": "3", "valueType": "int"}},
+        {"id": "X:label@2", "type": "X", "data": {"value": "total", "valueType": "str"}},
+        {"id": "F:double@1", "type": "F", "data": {}},
+        {"id": "F:square@2", "type": "F", "data": {}},
+        {"id": "C:Counter@1", "type": "C", "data": {"subNodes": [{"id": "C:Counter@1:add@2"}]}},
+        {"id": "O:text_out@1", "type": "O", "data": {"outputType": "text"}},
+    ],
+    "connections": [
+        {"source": "X:num@1", "target": "F:double@1", "sourceHandle": "val", "targetHandle": "x"},
+        {"source": "X:num@1", "target": "F:square@2", "sourceHandle": "val", "targetHandle": "x"},
+        {
+            "source": "X:label@2", "target": "C:Counter@1",
+            "sourceHandle": "val", "targetHandle": "label",
+        },
+        {
+            "source": "F:double@1", "target": "C:Counter@1:add@2",
+            "sourceHandle": "returns", "targetHandle": "a",
+        },
+        {
+            "source": "F:square@2", "target": "C:Counter@1:add@2",
+            "sourceHandle": "returns", "targetHandle": "b",
+        },
+        {
+            "source": "C:Counter@1:add@2", "target": "O:text_out@1",
+            "sourceHandle": "returns", "targetHandle": "input",
+        },
+    ],
+}
+
+
+class Counter:
+    def __init__(self, label):
+        self.label = label
+
+    def add(self, a, b):
+        return f"{self.label}={a + b}"
+
+
+NODES = {
+    "double": lambda x: 2 * x,
+    "square": lambda x: x * x,
+    "Counter": Counter,
+}
+
+
+def resolver(node):
+    return NODES[node.split(":")[1].split("@")[0]]
+
+
+def make_plan():
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    return compile_plan(adj_list, rev_adj_list, extract_io_nodes(DAG), resolver, ({}, {}))
+
+
+def test_plan_runs_workflow():
+    plan = make_plan()
+    assert plan.run() == {"O:text_out@1": "total=15"}
+
+
+def test_plan_input_overrides_and_reuse():
+    plan = make_plan()
+    assert plan.run({"X:num@1": 4}) == {"O:text_out@1": "total=24"}
+    assert plan.run({"X:label@2": "sum"}) == {"O:text_out@1": "sum=15"}
+
+
+def test_plan_all_nodes():
+    results = make_plan().run(all_nodes=True)
+    assert results["F:double@1"] == 6
+    assert results["F:square@2"] == 9
+
+
+def test_shared_streams_match_generated_script(tmp_path, monkeypatch):
+    adj_list, rev_adj_list = create_adjacency_lists(STREAM_DAG)
+    ports = extract_io_nodes(STREAM_DAG)
+    streams = {"returns": "Iterator[int]"}
+    manifests = ({}, {"numbers": streams, "evens": streams})
+    functions = {}
+    for source in STREAM_SOURCES.values():
+        exec(source, functions)
+
+    def resolve(node):
+        return functions[node.split(":")[1].split("@")[0]]
+
+    plan = compile_plan(adj_list, rev_adj_list, ports, resolve, manifests)
+    script = generate_script(adj_list, rev_adj_list, ports=ports, manifests=manifests)
+    namespace = run_script(script, tmp_path, monkeypatch, STREAM_SOURCES)
+    expected = {"O:text_out@1": namespace["total_out"], "O:text_out@2": namespace["count_out"]}
+
+    assert expected == {"O:text_out@1": 10, "O:text_out@2": 3}
+    assert plan.run() == expected
+    assert asyncio.run(plan.run_async()) == expected
+    results = plan.run(all_nodes=True)
+    assert results["F:total@1"] == 10 and results["F:count@1"] == 3
+
+
+def test_cache_skips_nodes_without_consumers(tmp_path):
+    calls = []
+    nodes = {**NODES, "square": lambda x: calls.append(x) or x * x}
+    dag = {"nodes": DAG["nodes"][:4], "connections": DAG["connections"][:2]}
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    plan = compile_plan(
+        adj_list, rev_adj_list, extract_io_nodes(dag),
+        lambda node: nodes[node.split(":")[1].split("@")[0]], ({}, {}),
+    )
+    cache = NodeCache(tmp_path / "cache")
+    # Without output nodes nothing consumes square, so it runs every time
+    assert plan.run(all_nodes=True, cache=cache)["F:square@2"] == 9
+    assert plan.run(all_nodes=True, cache=cache)["F:square@2"] == 9
+    assert calls == [3, 3]
@@ -0,0 +1,334 @@
+import io
+import json
+import sys
+
+import pytest
+
+from typeflow.core.script_generator import generate_script, topo_waves
+from typeflow.utils import create_adjacency_lists, extract_io_nodes
+
+DAG = {
+    "nodes": [
+        {"id": "X:num@1", "type": "X", "data": {"value": "3", "valueType": "int"}},
+        {"id": "F:double@1", "type": "F", "data": {}},
+        {"id": "F:square@2", "type": "F", "data": {}},
+        {"id": "F:add@3", "type": "F", "data": {}},
+        {"id": "O:text_out@1", "type": "O", "data": {"outputType": "int"}},
+    ],
+    "connections": [
+        {"source": "X:num@1", "target": "F:double@1", "sourceHandle": "val", "targetHandle": "x"},
+        {"source": "X:num@1", "target": "F:square@2", "sourceHandle": "val", "targetHandle": "x"},
+        {
+            "source": "F:double@1", "target": "F:add@3",
+            "sourceHandle": "returns", "targetHandle": "a",
+        },
+        {
+            "source": "F:square@2", "target": "F:add@3",
+            "sourceHandle": "returns", "targetHandle": "b",
+        },
+        {
+            "source": "F:add@3", "target": "O:text_out@1",
+            "sourceHandle": "returns", "targetHandle": "input",
+        },
+    ],
+}
+
+NODE_SOURCES = {
+    "double": "def double(x: int) -> int:\n    return 2 * x\n",
+    "square": "def square(x: int) -> int:\n    return x * x\n",
+    # Records its arguments and result so tests can check values computed inside main()
+    "add": (
+        "calls = []\n\n"
+        "def add(a: int, b: int) -> int:\n    calls.append((a, b, a + b))\n    return a + b\n"
+    ),
+}
+
+ASYNC_NODE_SOURCES = {
+    **NODE_SOURCES,
+    "double": "async def double(x: int) -> int:\n    return 2 * x\n",
+    "square": "async def square(x: int) -> int:\n    return x * x\n",
+}
+
+
+def make_project(tmp_path, sources):
+    for name, source in sources.items():
+        node_dir = tmp_path / "src" / "nodes" / name
+        node_dir.mkdir(parents=True)
+        (node_dir / "__init__.py").touch()
+        (node_dir / "main.py").write_text(source)
+    (tmp_path / "src" / "__init__.py").touch()
+    (tmp_path / "src" / "nodes" / "__init__.py").touch()
+
+
+def add_calls():
+    """``(a, b, result)`` of every ``add`` call in the last run_script."""
+    return sys.modules["src.nodes.add.main"].calls
+
+
+def run_script(script, tmp_path, monkeypatch, sources=NODE_SOURCES):
+    make_project(tmp_path, sources)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in [m for m in sys.modules if m == "src" or m.startswith("src.")]:
+        monkeypatch.delitem(sys.modules, name)
+    namespace = {"__name__": "__main__"}
+    exec(compile(script, "orchestrator", "exec"), namespace)
+    return namespace
+
+
+def test_topo_waves_groups_independent_nodes():
+    adj_list, _ = create_adjacency_lists(DAG)
+    assert topo_waves(adj_list) == [
+        ["X:num@1"],
+        ["F:double@1", "F:square@2"],
+        ["F:add@3"],
+        ["O:text_out@1"],
+    ]
+
+
+def test_parallel_script_matches_sequential(tmp_path, monkeypatch):
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    ports = extract_io_nodes(DAG)
+
+    sequential = generate_script(adj_list, rev_adj_list, ports=ports, manifests=({}, {}))
+    script = generate_script(
+        adj_list,
+        rev_adj_list,
+        ports=ports,
+        parallel=True,
+        max_workers=2,
+        manifests=({}, {}),
+    )
+    assert "_executor.submit(double, x=num_1)" in script
+    assert "_executor.submit(square, x=num_1)" in script
+
+    def node_values(namespace):
+        return {k: v for k, v in namespace.items() if k == "num_1" or k.endswith("_out")}
+
+    expected = node_values(run_script(sequential, tmp_path / "sequential", monkeypatch))
+    namespace = node_values(run_script(script, tmp_path / "parallel", monkeypatch))
+    assert namespace == expected
+    assert namespace["add_out"] == 15
+
+
+def test_live_parallel_script_traces_calls(tmp_path, monkeypatch, capsys):
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    ports = extract_io_nodes(DAG)
+
+    script = generate_script(
+        adj_list, rev_adj_list, live=True, ports=ports, parallel=True, manifests=({}, {})
+    )
+    assert '_executor.submit(traced("F:double@1", double), x=num_1)' in script
+
+    run_script(script, tmp_path, monkeypatch)
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    timed = {e["id"] for e in events if e["event"] == "node_success" and "metrics" in e}
+    assert timed == {"F:double@1", "F:square@2", "F:add@3", "O:text_out@1"}
+    assert events[-1]["event"] == "workflow_complete"
+
+
+def test_functions_without_consumers_are_not_assigned():
+    dag = {
+        "nodes": DAG["nodes"][:4],
+        "connections": DAG["connections"][:4],
+    }
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    script = generate_script(
+        adj_list, rev_adj_list, ports=extract_io_nodes(dag), manifests=({}, {})
+    )
+    assert "double_out = double(x=num_1)" in script
+    assert "\nadd(a=double_out, b=square_out)" in script
+
+
+def test_cache_always_runs_nodes_without_consumers(tmp_path, monkeypatch):
+    dag = {
+        "nodes": DAG["nodes"][:4],
+        "connections": DAG["connections"][:4],
+    }
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    script = generate_script(
+        adj_list, rev_adj_list, ports=extract_io_nodes(dag), manifests=({}, {}), cache=True
+    )
+    assert "double_out = _cache.call(double, x=num_1)" in script
+    assert "\nadd(a=double_out, b=square_out)" in script
+
+    run_script(script, tmp_path, monkeypatch)
+    # The second run hits the cache for double and square, but add runs again
+    exec(compile(script, "orchestrator", "exec"), {"__name__": "__main__"})
+    assert add_calls() == [(6, 9, 15), (6, 9, 15)]
+
+
+def test_async_nodes_are_gathered(tmp_path, monkeypatch):
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    ports = extract_io_nodes(DAG)
+    manifests = ({}, {"double": {"is_async": True}, "square": {"is_async": True}})
+
+    script = generate_script(adj_list, rev_adj_list, ports=ports, manifests=manifests)
+    assert "async def main():" in script
+    assert (
+        "double_out, square_out = await asyncio.gather("
+        "double(x=num_1), square(x=num_1))" in script
+    )
+    assert "add_out = add(a=double_out, b=square_out)" in script
+
+    run_script(script, tmp_path, monkeypatch, ASYNC_NODE_SOURCES)
+    # Awaited results, in the order of the gather call
+    assert add_calls() == [(6, 9, 15)]
+
+
+def test_process_nodes_use_process_pool(tmp_path, monkeypatch):
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    ports = extract_io_nodes(DAG)
+    manifests = ({}, {"square": {"executor": "process"}})
+
+    script = generate_script(
+        adj_list, rev_adj_list, ports=ports, parallel=True, manifests=manifests
+    )
+    assert "_future_1 = submit_to_process(_process_pool, square, x=num_1)" in script
+    assert 'if __name__ == "__main__":' in script
+    # The pool is closed by a with block, so a failing node cannot leak it
+    assert "with ProcessPoolExecutor(max_workers=None) as _process_pool:" in script
+    assert "_process_pool.shutdown()" not in script
+
+    # The __main__ guard runs main() once; square's result comes back from the pool
+    run_script(script, tmp_path, monkeypatch)
+    assert add_calls() == [(6, 9, 15)]
+
+
+def test_batch_script_runs_records(tmp_path, monkeypatch, capsys):
+    adj_list, rev_adj_list = create_adjacency_lists(DAG)
+    ports = extract_io_nodes(DAG)
+    manifests = ({}, {"double": {"batch": True}})
+    sources = {
+        **NODE_SOURCES,
+        "double": "def double(x: list) -> list:\n    return [2 * v for v in x]\n",
+    }
+
+    script = generate_script(adj_list, rev_adj_list, ports=ports, manifests=manifests, batch=True)
+    assert "double_out = double(x=num_1)" in script
+    assert "square_out = [square(x=_0) for _0 in num_1]" in script
+
+    monkeypatch.setattr(sys, "stdin", io.StringIO('{"X:num@1": 1}\n{}\n{"X:num@1": 10}\n'))
+    namespace = run_script(script, tmp_path, monkeypatch, sources)
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"O:text_out@1": 3},
+        {"O:text_out@1": 15},
+        {"O:text_out@1": 120},
+    ]
+    assert namespace["run_batch"]([]) == {"O:text_out@1": []}
+
+
+STREAM_DAG = {
+    "nodes": [
+        {"id": "X:num@1", "type": "X", "data": {"value": "5", "valueType": "int"}},
+        {"id": "F:numbers@1", "type": "F", "data": {}},
+        {"id": "F:evens@1", "type": "F", "data": {}},
+        {"id": "F:total@1", "type": "F", "data": {}},
+        {"id": "F:count@1", "type": "F", "data": {}},
+        {"id": "O:text_out@1", "type": "O", "data": {"outputType": "int"}},
+        {"id": "O:text_out@2", "type": "O", "data": {"outputType": "int"}},
+    ],
+    "connections": [
+        {"source": "X:num@1", "target": "F:numbers@1", "sourceHandle": "val", "targetHandle": "n"},
+        {
+            "source": "F:numbers@1", "target": "F:evens@1",
+            "sourceHandle": "returns", "targetHandle": "items",
+        },
+        {
+            "source": "F:numbers@1", "target": "F:total@1",
+            "sourceHandle": "returns", "targetHandle": "items",
+        },
+        {
+            "source": "F:evens@1", "target": "F:count@1",
+            "sourceHandle": "returns", "targetHandle": "items",
+        },
+        {
+            "source": "F:total@1", "target": "O:text_out@1",
+            "sourceHandle": "returns", "targetHandle": "input",
+        },
+        {
+            "source": "F:count@1", "target": "O:text_out@2",
+            "sourceHandle": "returns", "targetHandle": "input",
+        },
+    ],
+}
+
+STREAM_SOURCES = {
+    "numbers": "def numbers(n):\n    yield from range(n)\n",
+    "evens": "def evens(items):\n    return (x for x in items if x % 2 == 0)\n",
+    "total": "def total(items):\n    return sum(items)\n",
+    "count": "def count(items):\n    return sum(1 for _ in items)\n",
+}
+
+
+def test_shared_streams_are_split(tmp_path, monkeypatch):
+    adj_list, rev_adj_list = create_adjacency_lists(STREAM_DAG)
+    ports = extract_io_nodes(STREAM_DAG)
+    manifests = (
+        {},
+        {
+            "numbers": {"returns": "Iterator[int]"},
+            "evens": {"returns": "Iterator[int]"},
+        },
+    )
+
+    script = generate_script(adj_list, rev_adj_list, ports=ports, manifests=manifests)
+    assert "numbers_out = split_stream(numbers_out, 2)" in script
+    assert "evens_out = evens(items=numbers_out[0])" in script
+    assert "total_out = total(items=numbers_out[1])" in script
+    # A stream with a single consumer is passed on as is
+    assert "evens_out = split_stream" not in script
+    with pytest.raises(ValueError, match="streams read by several nodes"):
+        generate_script(adj_list, rev_adj_list, ports=ports, manifests=manifests, batch=True)
+
+    namespace = run_script(script, tmp_path, monkeypatch, STREAM_SOURCES)
+    assert namespace["total_out"] == 10
+    assert namespace["count_out"] == 3
+
+
+def test_table_outputs_get_their_own_stream_branch(tmp_path, monkeypatch, capsys):
+    dag = {
+        "nodes": [
+            {"id": "X:num@1", "type": "X", "data": {"value": "5", "valueType": "int"}},
+            {"id": "F:numbers@1", "type": "F", "data": {}},
+            {"id": "F:total@1", "type": "F", "data": {}},
+            {"id": "O:table_out@1", "type": "O", "data": {"outputType": "table"}},
+            {"id": "O:text_out@2", "type": "O", "data": {"outputType": "text"}},
+        ],
+        "connections": [
+            {
+                "source": "X:num@1", "target": "F:numbers@1",
+                "sourceHandle": "val", "targetHandle": "n",
+            },
+            {
+                "source": "F:numbers@1", "target": "F:total@1",
+                "sourceHandle": "returns", "targetHandle": "items",
+            },
+            {
+                "source": "F:numbers@1", "target": "O:table_out@1",
+                "sourceHandle": "returns", "targetHandle": "input",
+            },
+            {
+                "source": "F:total@1", "target": "O:text_out@2",
+                "sourceHandle": "returns", "targetHandle": "input",
+            },
+        ],
+    }
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    ports = extract_io_nodes(dag)
+    manifests = ({}, {"numbers": {"returns": "Iterator[int]"}})
+
+    # Without a live display the output does not read the stream
+    script = generate_script(adj_list, rev_adj_list, ports=ports, manifests=manifests)
+    assert "split_stream" not in script
+
+    script = generate_script(adj_list, rev_adj_list, live=True, ports=ports, manifests=manifests)
+    assert "numbers_out = split_stream(numbers_out, 2)" in script
+    assert "send_output)(numbers_out[1], 'table', 'O:table_out@1')" in script
+
+    run_script(script, tmp_path, monkeypatch, STREAM_SOURCES)
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    outputs = {e["id"]: e for e in events if e["event"] == "node_output"}
+    assert outputs["O:text_out@2"]["val"] == "10"
+    assert outputs["O:table_out@1"]["table"]["rows"] == 5
@@ -0,0 +1,67 @@
+import runpy
+
+import pytest
+import yaml
+
+from typeflow.sdk.static import Unresolved, extract_manifests
+
+SOURCE = '''
+from __future__ import annotations
+import typing as t
+from collections.abc import Iterator
+from typeflow import node, node_class
+
+
+@node(executor="process")
+def tokenize(text: str, sizes: list[int], limit: t.Optional[int] = None) -> Iterator[str]:
+    """Split text."""
+    yield from text.split()
+
+
+@node_class(slots=True)
+class Counter:
+    """Counts things."""
+
+    step: int = 1
+    label: str
+
+    def add(self, value: int, extra) -> int:
+        return value + self.step
+
+    @staticmethod
+    def zero() -> int:
+        return 0
+
+    @property
+    def double(self) -> int:
+        return 2 * self.step
+'''
+
+
+def test_static_manifests_match_decorators(tmp_path, monkeypatch):
+    (tmp_path / ".typeflow").mkdir()
+    module = tmp_path / "sample.py"
+    module.write_text(SOURCE.replace("from __future__ import annotations\n", ""))
+    monkeypatch.chdir(tmp_path)
+
+    static = extract_manifests(module, tmp_path)
+    runpy.run_path(str(module))
+    assert [m["name"] for m in static] == ["tokenize", "Counter"]
+    for manifest, folder in zip(static, ("nodes", "classes")):
+        path = tmp_path / ".typeflow" / folder / f"{manifest['name']}.yaml"
+        assert yaml.safe_load(path.read_text()) == manifest
+
+
+def test_static_extraction_refuses_what_needs_an_import(tmp_path):
+    module = tmp_path / "sample.py"
+    # Methods are read with inspect.signature, so string annotations fail at import
+    module.write_text(SOURCE)
+    with pytest.raises(Unresolved):
+        extract_manifests(module, tmp_path)
+
+    module.write_text(
+        "import numpy as np\nfrom typeflow import node\n\n"
+        "@node()\ndef total(values: np.ndarray) -> float:\n    return values.sum()\n"
+    )
+    with pytest.raises(Unresolved, match="np"):
+        extract_manifests(module, tmp_path)
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from typeflow.core.streams import is_stream_type, split_stream
+
+
+def test_is_stream_type():
+    assert is_stream_type("Iterator[int]")
+    assert is_stream_type("Generator[dict, NoneType, NoneType]")
+    assert not is_stream_type("list[int]")
+    assert not is_stream_type(None)
+
+
+def test_branches_read_the_whole_stream_and_spill_when_far_apart():
+    stream = split_stream(iter(range(100)), 2, buffer_size=4)
+    first, second = stream[0], stream[1]
+    assert list(first) == list(range(100))
+    # The lagging branch kept 4 + 0 items in memory and spilled the rest
+    assert len(second.head) == 4 and second.chunks == 24 and second.tail == []
+    assert next(second) == 0
+    assert list(second) == list(range(1, 100))
+    assert second.chunks == 0
+
+
+def test_branches_interleaved_stay_in_memory():
+    stream = split_stream(range(10), 3, buffer_size=2)
+    rows = list(zip(*stream.branches))
+    assert rows == [(i, i, i) for i in range(10)]
+    assert all(branch.spill is None for branch in stream.branches)
+
+
+def test_branches_consumed_from_threads():
+    stream = split_stream(range(10_000), 4, buffer_size=16)
+    totals = [None] * 4
+
+    def consume(index):
+        totals[index] = sum(stream[index])
+
+    threads = [threading.Thread(target=consume, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert totals == [sum(range(10_000))] * 4
+
+
+def test_source_errors_reach_every_branch():
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    stream = split_stream(failing(), 2)
+    with pytest.raises(RuntimeError):
+        list(stream[0])
+    assert next(stream[1]) == 1
+    with pytest.raises(RuntimeError):
+        next(stream[1])
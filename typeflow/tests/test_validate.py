@@ -0,0 +1,79 @@
+import pytest
+import typer
+import yaml
+
+from typeflow.cli.commands.validate.runner import validate_items
+
+
+def make_project(tmp_path):
+    (tmp_path / ".typeflow").mkdir()
+    (tmp_path / "workflow").mkdir()
+    (tmp_path / "workflow" / "workflow.yaml").write_text("nodes: []\n")
+    (tmp_path / "src" / "nodes").mkdir(parents=True)
+    (tmp_path / "src" / "__init__.py").touch()
+    (tmp_path / "src" / "nodes" / "__init__.py").touch()
+    for name in ("double", "broken"):
+        node_dir = tmp_path / "src" / "nodes" / name
+        node_dir.mkdir()
+        (node_dir / "__init__.py").touch()
+    (tmp_path / "src" / "nodes" / "double" / "main.py").write_text(
+        "from typeflow import node\n\n@node()\ndef double(x: int) -> int:\n    return 2 * x\n"
+    )
+    (tmp_path / "src" / "nodes" / "broken" / "main.py").write_text(
+        "from typeflow import node\n\n@node()\ndef broken(x) -> int:\n    return x\n"
+    )
+
+
+def test_validate_skips_unchanged_modules(tmp_path, monkeypatch, capsys):
+    make_project(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    assert validate_items([("node", "double")]) == {("node", "double"): "validated"}
+    assert (tmp_path / ".typeflow" / "nodes" / "double.yaml").exists()
+    workflow = yaml.safe_load((tmp_path / "workflow" / "workflow.yaml").read_text())
+    assert workflow["nodes"] == ["double"]
+
+    assert validate_items([("node", "double")]) == {("node", "double"): "unchanged"}
+    # A deleted manifest forces a new import
+    (tmp_path / ".typeflow" / "nodes" / "double.yaml").unlink()
+    assert validate_items([("node", "double")]) == {("node", "double"): "validated"}
+    assert validate_items([("node", "double")], force=True) == {("node", "double"): "validated"}
+
+    with pytest.raises(typer.Exit):
+        validate_items([("node", "double"), ("node", "broken")])
+    out = capsys.readouterr().out
+    assert "Runtime Error in node 'broken'" in out
+    assert "Missing type hint" in out
+
+
+def test_static_validation_imports_only_unresolved_modules(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    (tmp_path / "src" / "nodes" / "broken" / "main.py").write_text(
+        "from typeflow import node\nfrom .helpers import Vector\n\n"
+        "@node()\ndef broken(x: Vector) -> int:\n    return 1\n"
+    )
+    (tmp_path / "src" / "nodes" / "broken" / "helpers.py").write_text("Vector = list[float]\n")
+    monkeypatch.chdir(tmp_path)
+
+    items = [("node", "double"), ("node", "broken")]
+    assert validate_items(items, static=True) == {
+        ("node", "double"): "extracted",
+        ("node", "broken"): "validated",
+    }
+    manifest = yaml.safe_load((tmp_path / ".typeflow" / "nodes" / "broken.yaml").read_text())
+    assert manifest["inputs"] == {"x": "list[float]"}
+    # Extracted modules are still imported by a regular validation
+    assert validate_items(items)[("node", "double")] == "validated"
+
+
+def test_async_nodes_pass_validation(tmp_path, monkeypatch):
+    make_project(tmp_path)
+    (tmp_path / "src" / "nodes" / "double" / "main.py").write_text(
+        "from typeflow import node\n\n@node()\nasync def double(x: int) -> int:\n    return 2 * x\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    assert validate_items([("node", "double")], static=True) == {("node", "double"): "extracted"}
+    assert validate_items([("node", "double")]) == {("node", "double"): "validated"}
+    manifest = yaml.safe_load((tmp_path / ".typeflow" / "nodes" / "double.yaml").read_text())
+    assert manifest["is_async"] is True
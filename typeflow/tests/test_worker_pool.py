@@ -0,0 +1,97 @@
+from typeflow.core.script_generator import generate_script
+from typeflow.server.core.worker_pool import WorkerPool
+from typeflow.utils import create_adjacency_lists, extract_io_nodes
+
+
+def make_project(tmp_path):
+    node_dir = tmp_path / "src" / "nodes" / "greet"
+    node_dir.mkdir(parents=True)
+    (tmp_path / "src" / "__init__.py").touch()
+    (tmp_path / "src" / "nodes" / "__init__.py").touch()
+    (node_dir / "__init__.py").touch()
+    (node_dir / "main.py").write_text(
+        "def greet(name: str) -> str:\n    print('hello', name)\n    return name\n"
+    )
+
+
+def test_warm_worker_runs_script(tmp_path):
+    make_project(tmp_path)
+    pool = WorkerPool(tmp_path, size=1)
+    pool.start()
+    try:
+        messages = []
+        worker = pool.acquire()
+        code = worker.run(
+            "from src.nodes.greet.main import greet\ngreet(name='flow')\n",
+            lambda kind, text: messages.append((kind, text)),
+        )
+        assert code == 0
+        assert messages == [("stdout", "hello flow")]
+        assert len(pool.idle) == 1
+    finally:
+        pool.shutdown()
+
+
+def test_failed_run_reports_traceback(tmp_path):
+    make_project(tmp_path)
+    pool = WorkerPool(tmp_path, size=0)
+    messages = []
+    code = pool.acquire().run(
+        "raise ValueError('boom')", lambda kind, text: messages.append(kind)
+    )
+    assert code == 1
+    assert "stderr" in messages
+
+
+
+def test_events_use_their_own_channel(tmp_path):
+    make_project(tmp_path)
+    pool = WorkerPool(tmp_path, size=0)
+    messages = []
+    code = pool.acquire().run(
+        "from typeflow.core.events import emit\n"
+        "print('{\"event\": \"node_output\", \"id\": \"fake\"}')\n"
+        "emit({'event': 'node_start', 'id': 'F:greet@1'})\n",
+        lambda kind, payload: messages.append((kind, payload)),
+    )
+    assert code == 0
+    assert ("event", {"event": "node_start", "id": "F:greet@1"}) in messages
+    # JSON printed by user code stays a log line
+    assert ("stdout", '{"event": "node_output", "id": "fake"}') in messages
+    assert len(messages) == 2
+
+
+def test_process_nodes_run_in_warm_workers(tmp_path):
+    make_project(tmp_path)
+    dag = {
+        "nodes": [
+            {"id": "X:name@1", "type": "X", "data": {"value": "pool", "valueType": "str"}},
+            {"id": "F:greet@1", "type": "F", "data": {}},
+            {"id": "O:text_out@1", "type": "O", "data": {"outputType": "text"}},
+        ],
+        "connections": [
+            {
+                "source": "X:name@1", "target": "F:greet@1",
+                "sourceHandle": "val", "targetHandle": "name",
+            },
+            {
+                "source": "F:greet@1", "target": "O:text_out@1",
+                "sourceHandle": "returns", "targetHandle": "input",
+            },
+        ],
+    }
+    adj_list, rev_adj_list = create_adjacency_lists(dag)
+    script = generate_script(
+        adj_list,
+        rev_adj_list,
+        live=True,
+        ports=extract_io_nodes(dag),
+        manifests=({}, {"greet": {"executor": "process"}}),
+    )
+    pool = WorkerPool(tmp_path, size=0)
+    messages = []
+    # Daemonic workers could not start the node's process pool
+    code = pool.acquire().run(script, lambda kind, payload: messages.append((kind, payload)))
+    assert code == 0, messages
+    outputs = [p for kind, p in messages if kind == "event" and p["event"] == "node_output"]
+    assert outputs[0]["val"] == "pool"